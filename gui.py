@@ -1,10 +1,15 @@
 # gui.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-from molar_masses import molar_mass, suggest_substances, name_to_formula
+from molar_masses import molar_mass, suggest_substances, name_to_formula, ATOMIC_WEIGHTS
 from thermo_data import get_thermo, phases_for
 from constants import CONSTANTS
 import math
+import itertools
+import re
+from functools import lru_cache
+import bisect
+from collections import defaultdict
 from phase_catalog import load_phase_catalog, save_phase_catalog, DEFAULT_PHASE_CATALOG
 
 
@@ -22,6 +27,779 @@ from molar_masses import molar_mass
 
 APP_TITLE = "Chem Formula Finder — GUI"
 
+
+# Gas constant and standard temperature for the 298 K thermo tools
+_R = 8.314462618            # J/(mol·K)
+_T298 = 298.15              # K
+_NEG_INV_RT_298 = -1000.0 / (_R * _T298)   # K = exp(ΔG°[kJ/mol] · this)
+
+# Reaction-builder verdicts indexed by _sign_idx(value): (negative, zero, positive)
+_HEAT = ("exothermic (releases heat)", "thermally neutral", "endothermic (absorbs heat)")
+_ENTRO = ("entropy decreases (more order)", "no net entropy change", "entropy increases (more disorder)")
+_SPONT = ("spontaneous at 298 K", "at equilibrium tendency at 298 K", "non-spontaneous at 298 K")
+_SPONT_DETAIL = ("spontaneous at 298 K (thermodynamically favorable)",
+                 "at equilibrium tendency at 298 K",
+                 "non-spontaneous at 298 K (requires driving force)")
+
+
+def _sign_idx(x: float) -> int:
+    """0, 1, 2 for x < 0, x == 0, x > 0 (index into the verdict tuples above)."""
+    return (x > 0) - (x < 0) + 1
+
+# ΔG° ↔ K step-by-step text (_open_equilibrium_dg_steps), filled with str.format_map
+_DG_TEMPLATE = (
+    "Given (using Known Variables):\n"
+    "  ΔG°rxn = {dG_disp:.6g} {dG_unit}  (= {dG_base:.6g} J/mol)\n"
+    "  T      = {T_disp:.6g} {T_unit}\n"
+    "  R      = {R_disp:.6g} {R_unit}\n\n"
+    "Compute exponent x = −ΔG°rxn / (R·T):\n"
+    "  x = −({dG_base:.6g} J/mol) / ({R:.6g} J/(mol·K) × {T:.6g} K)\n"
+    "    = {x:.6g}\n\n"
+    "Then K = exp(x):\n"
+    "  K = exp({x:.6g}) = {K:.6g}\n"
+    "  → scientific: {K:.3e}\n\n"
+    "Useful rule-of-thumb at this T:\n"
+    "  RT·ln(10) = {rtln10_kJ:.3f} kJ/mol  (ΔG° change per 10× change in K)\n"
+    "  RT·ln(2)  = {rtln2_kJ:.3f} kJ/mol   (ΔG° change per 2× change in K)\n"
+)
+
+# Reaction builder re-reads table values on every Compute; memoize the alias-aware lookup.
+# Returned records are the shared THERMO dicts (read-only by convention, as before).
+# Call _get_thermo_cached.cache_clear() after thermo_data.load_additional_from_csv().
+_get_thermo_cached = lru_cache(maxsize=4096)(get_thermo)
+
+
+def _parse_float(s: str) -> float:
+    """Parse a user-typed number, accepting a decimal comma ("1,5" -> 1.5)."""
+    return float(s.strip().replace(",", "."))
+
+
+def _opt_float(s: str, default=None):
+    """Like _parse_float, but a blank entry gives `default` instead of ValueError."""
+    s = s.strip()
+    return float(s.replace(",", ".")) if s else default
+
+
+def _parse_floats(*entries):
+    """_parse_float over several entry widgets at once; raises ValueError if any is bad."""
+    return tuple(_parse_float(e.get()) for e in entries)
+
+
+def _to_kelvin(T: float, unit: str) -> float:
+    """Temperature from a "K"/"°C" unit picker to kelvin."""
+    return T if unit == "K" else T + 273.15
+
+
+def _debounce(widget, key, fn, delay=120):
+    """Run fn() once, `delay` ms after the last call for this (widget, key)."""
+    pending = getattr(widget, "_debounce_pending", None)
+    if pending is None:
+        pending = widget._debounce_pending = {}
+        # never fire into a closed dialog
+        widget.bind("<Destroy>", lambda _e: [widget.after_cancel(a) for a, _f in pending.values()], add="+")
+    if key in pending:
+        widget.after_cancel(pending.pop(key)[0])
+
+    def _fire():
+        del pending[key]
+        fn()
+    pending[key] = (widget.after(delay, _fire), fn)
+
+
+def _listbox_sync(lst, shown, new):
+    """
+    Make Listbox `lst` show `new` (currently showing `shown`) and return the new shown list.
+    Both are filtered views of one ordered list of unique rows, so only the rows that
+    left or entered the view are deleted/inserted, in contiguous runs.
+    """
+    pos = {row: j for j, row in enumerate(new)}
+    kept = [pos[row] for row in shown if row in pos]
+    if any(a >= b for a, b in zip(kept, kept[1:])):
+        # order differs (not a filtered view): rebuild
+        lst.delete(0, "end")
+        lst.insert("end", *new)
+        return list(new)
+    i = j = k = 0                         # listbox row, index into new, index into shown
+    while k < len(shown):
+        if shown[k] not in pos:
+            start = k
+            while k < len(shown) and shown[k] not in pos:
+                k += 1
+            lst.delete(i, i + (k - start) - 1)
+            continue
+        target = pos[shown[k]]
+        if target > j:
+            lst.insert(i, *new[j:target])
+            i += target - j
+        i += 1; j = target + 1; k += 1
+    if j < len(new):
+        lst.insert("end", *new[j:])
+    return list(new)
+
+
+def _debounce_flush(widget, key):
+    """Run a pending _debounce call now (e.g. Enter pressed right after typing)."""
+    pending = getattr(widget, "_debounce_pending", None)
+    if pending and key in pending:
+        after_id, fn = pending.pop(key)
+        widget.after_cancel(after_id)
+        fn()
+
+
+def _grid_row_pool(pool, n, make):
+    """
+    Return n rows of widgets from `pool`, creating missing ones with make(grid_row) (rows
+    count from 1, under a header) and grid_remove-ing the rest, so a table that is
+    re-filled on every refresh reuses its widgets instead of destroying and rebuilding.
+    """
+    while len(pool) < n:
+        pool.append(make(len(pool) + 1))
+    for row in pool[n:]:
+        for w in row:
+            w.grid_remove()
+    for row in pool[:n]:
+        for w in row:
+            w.grid()                      # no-op if shown; restores a grid_remove-d row
+    return pool[:n]
+
+# Visible-spectrum color bands (nm). The last bound is the float just above 780 so
+# that 780 nm itself is still "red"; everything outside [380, 780] is not visible.
+_COLOR_BOUNDS = (380.0, 450.0, 495.0, 570.0, 590.0, 620.0, math.nextafter(780.0, math.inf))
+_COLOR_NAMES = ("outside visible range", "violet", "blue", "green", "yellow", "orange", "red",
+                "outside visible range")
+
+
+# Photon tool input units: unit -> (factor to SI, conversion step text or "" when already SI)
+_E_UNITS = {
+    "J": (1.0, ""),
+    "eV": (1.602_176_634e-19, "  Convert eV → J: E_J = E_eV × e = {raw:g} × {f:.6e} = {val:.6e} J\n"),
+}
+_LAM_UNITS = {
+    "m": (1.0, ""),
+    "nm": (1e-9, "  Convert nm → m: λ_m = {raw:g} × 1e-9 = {val:.6e} m\n"),
+    "Å": (1e-10, "  Convert Å → m: λ_m = {raw:g} × 1e-10 = {val:.6e} m\n"),
+}
+
+
+# Known-variable names tried, in order, when prefilling Kb / Kf / a rate constant
+_KB_KEYS = ("Kb", "K_b", "K_boil")
+_KF_KEYS = ("Kf", "K_f", "K_freeze")
+_K_RATE_KEYS = ("k_rate", "k", "k1")
+
+
+def _known_float(known_ui, keys):
+    """First of `keys` in known_ui whose display_value parses as a number, else None."""
+    for k in keys:
+        try:
+            return float(known_ui[k]["display_value"])
+        except (KeyError, TypeError, ValueError):
+            continue                      # absent or unparseable: try the next alias
+    return None
+
+
+# Shared combobox unit choices, and factors to g / L for the mass and volume pickers
+_TIME_UNITS = ("s", "min", "h")
+_TEMP_UNITS = ("K", "°C")
+_MASS_UNITS = ("g", "mg", "kg")
+_VOL_UNITS = ("mL", "L")
+_MASS_TO_G = {"g": 1.0, "mg": 1e-3, "kg": 1e3}
+_VOL_TO_L = {"mL": 1e-3, "L": 1.0}
+
+# Kinetics / Arrhenius unit factors: seconds per time unit, seconds per time unit of each
+# rate-constant label (k_base = k / factor), and J/mol per Ea unit
+_SEC_FACTOR = {"s": 1.0, "min": 60.0, "h": 3600.0}
+# Rate-constant unit choices and equation summary per order 0/1/2, in _TIME_UNITS order
+_KUNITS = (("M/s", "M/min", "M/h"),
+           ("s^-1", "min^-1", "h^-1"),
+           ("M^-1 s^-1", "M^-1 min^-1", "M^-1 h^-1"))
+_EQ_TEXT = ("0th: rate = k ;  [A]t = [A]0 − k·t ;  t1/2 = [A]0/(2k)",
+            "1st: rate = k·[A] ;  [A]t = [A]0·e^(−k t) ;  t1/2 = ln2 / k",
+            "2nd: rate = k·[A]^2 ;  1/[A]t = 1/[A]0 + k·t ;  t1/2 = 1/(k·[A]0)")
+_K_TIME_SCALE = {u: _SEC_FACTOR[t] for row in _KUNITS for u, t in zip(row, _TIME_UNITS)}
+_EA_TO_J = {"J/mol": 1.0, "kJ/mol": 1e3, "cal/mol": 4.184, "kcal/mol": 4184.0}
+# Gas constant matched to the Kp unit: L·atm and L·bar per (mol·K) pair with Kc in mol/L;
+# the Pa option expects Kc in mol/m³, so R = 8.314462618 Pa·m³/(mol·K)
+_R_BY_UNIT = {"atm": 0.082057338, "bar": 0.083144626, "Pa(m³/mol)": 8.314462618}
+
+
+def _nm_to_color(nm: float) -> str:
+    """Color name for a wavelength in nm (table lookup instead of an if-chain)."""
+    return _COLOR_NAMES[bisect.bisect_right(_COLOR_BOUNDS, nm)]
+
+
+def _phase_path(m_kg, Ti_C, Tf_C, c_s, c_l, c_g, Hfus, Hvap, Tm, Tb):
+    """
+    Heat (J) to take m_kg from Ti_C to Tf_C (°C) through solid/liquid/gas.
+    Returns (Q, steps); each step is (label, dT or None for a phase change, q in J).
+    """
+    caps = (c_s, c_l, c_g)
+    # 0 = solid, 1 = liquid, 2 = gas (a sample exactly at T_melt/T_boil counts as the upper phase)
+    ph = 0 if Ti_C < Tm else (1 if Ti_C < Tb else 2)
+    if Tf_C >= Ti_C:
+        # walk up: each phase ends at its upper edge, then the latent step into the next one
+        edges, clamp, phases = (Tm, Tb, math.inf), min, range(ph, 3)
+        labels = ("heat solid", "heat liquid", "heat gas")
+        latents = ((Hfus, "melt @ T_melt"), (Hvap, "boil @ T_boil"), None)
+    else:
+        edges, clamp, phases = (-math.inf, Tm, Tb), max, range(ph, -1, -1)
+        labels = ("cool solid", "cool liquid", "cool gas")
+        latents = (None, (-Hfus, "freeze @ T_melt"), (-Hvap, "condense @ T_boil"))
+
+    # at most three sensible segments and two latent terms between Ti and Tf
+    T = Ti_C
+    steps = []
+    for p in phases:
+        target = clamp(edges[p], Tf_C)
+        if abs(target - T) >= 1e-12:
+            dT = target - T
+            steps.append((labels[p], dT, m_kg * caps[p] * dT))
+            T = target
+        if abs(T - Tf_C) < 1e-12:
+            break
+        latent, latent_label = latents[p]
+        steps.append((latent_label, None, m_kg * latent))
+    return math.fsum(q for _, _, q in steps), steps
+
+
+_g6 = "{:.6g}".format   # shared 6-significant-digit formatter for step text
+
+
+def _integrated_conc(order: int, A0: float, k: float, t: float) -> float:
+    """[A](t) from the integrated rate law of order 0, 1 or 2 (k and t in matching time units)."""
+    if order == 0:
+        return A0 - k * t
+    if order == 1:
+        return A0 * math.exp(-k * t)
+    return A0 / (1.0 + k * A0 * t)
+
+
+# Arrhenius "Show log₁₀ form too" step text for each solve-for target
+def _log10_info(A, EaJ, R, T, k):
+    return (f"\nlog₁₀ form:\n  log k = log A − Ea/(2.303·R)·(1/T)\n"
+            f"  log k = log({A:g}) − {EaJ:g}/(2.303·{R:g})·(1/{T:g}) ⇒ k ≈ {k:.6g}\n")
+
+
+def _log10_rearranged(k, A, R, T):
+    return "\nlog₁₀ rearranged:\n  Ea = 2.303·R·T·(log A − log k)\n"
+
+
+def _log10_A(k, EaJ, R, T, A):
+    return f"\nlog₁₀ form:\n  log A = log k + Ea/(2.303·R·T) ⇒ A ≈ {A:.6g}\n"
+
+
+def _log10_T(A, k, EaJ, R, TK):
+    return f"\nlog₁₀ form:\n  1/T = [log A − log k]·(2.303·R)/Ea  ⇒  T ≈ {TK:.6g} K\n"
+
+
+def _itp_root(f, a, b, fa, fb, ftol=0.0, n_max=100):
+    """
+    Root of f in [a, b] given fa = f(a), fb = f(b) of opposite sign, by the ITP method
+    (interpolate, truncate, project). Never takes more steps than bisection run n_max
+    times would, but converges superlinearly on smooth f. Stops early once |f| < ftol.
+    """
+    width0 = b - a
+    eps = width0 * 2.0 ** -(n_max + 1)     # half-width bisection would reach
+    k1, n0 = 0.2 / width0, 1
+    j = 0
+    while b - a > 2.0 * eps:
+        xh = 0.5 * (a + b)
+        r = eps * 2.0 ** (n_max + n0 - j) - 0.5 * (b - a)
+        xf = (fb * a - fa * b) / (fb - fa)          # regula falsi
+        if not (a <= xf <= b):
+            xf = xh
+        sigma = 1.0 if xh >= xf else -1.0
+        delta = k1 * (b - a) ** 2
+        xt = xf + sigma * delta if delta <= abs(xh - xf) else xh
+        x = xt if abs(xt - xh) <= r else xh - sigma * r
+        if not (a < x < b):
+            x = xh                                  # interpolant rounded onto an end
+            if not (a < x < b):
+                break                               # bracket is down to adjacent floats
+        fx = f(x)
+        if fx is None:
+            break
+        if fx == 0 or abs(fx) < ftol:
+            return x
+        if (fx > 0) == (fa > 0):
+            a, fa = x, fx
+        else:
+            b, fb = x, fx
+        j += 1
+    return 0.5 * (a + b)
+
+
+def _lstsq(X, y):
+    """
+    Least-squares beta minimising |X·beta − y|² for rows X (len(X) ≥ len(X[0])), by
+    Householder QR, so XᵀX and its squared condition number are never formed.
+    Returns None if a column of X is (numerically) a combination of the others.
+    """
+    p = len(X[0])
+    cols = [[row[j] for row in X] for j in range(p)]   # reflected in place, column-wise
+    scale = [math.hypot(*c) for c in cols]
+    b = list(y)
+    R = [[0.0] * p for _ in range(p)]
+    for k in range(p):
+        v = cols[k][k:]
+        norm = math.hypot(*v)
+        if norm <= 1e-10 * scale[k]:
+            return None                                  # nothing left outside the span so far
+        alpha = -norm if v[0] >= 0 else norm
+        v[0] -= alpha
+        vv = norm * (norm + abs(v[0] + alpha))           # = v·v / 2
+        for c in cols[k+1:] + [b]:
+            t = sum(vi * ci for vi, ci in zip(v, c[k:])) / vv
+            c[k:] = [ci - t * vi for vi, ci in zip(v, c[k:])]
+        R[k][k] = alpha
+        for j in range(k + 1, p):
+            R[k][j] = cols[j][k]
+    beta = [0.0] * p
+    for k in reversed(range(p)):
+        beta[k] = (b[k] - sum(R[k][j] * beta[j] for j in range(k + 1, p))) / R[k][k]
+    return beta
+
+
+def _extent_root(f, lo, hi):
+    """
+    Root of f = ln Q − ln K on the feasible extent interval (lo, hi), where f is None if
+    some amount is ≤ 0. Falls back to the evaluated x with the smallest |f| if f has no
+    sign change there.
+    """
+    # Q(x) is strictly increasing on (lo, hi) since d ln Q/dx = Σ ν²/c > 0, so a sign
+    # change between points just inside both ends brackets the root without a scan
+    w = hi - lo
+    a, b = lo + 1e-9*w, hi - 1e-9*w
+    fa, fb = f(a), f(b)
+    if fa is not None and fb is not None:
+        if fa == 0: return a
+        if fb == 0: return b
+        if (fa < 0) != (fb < 0):
+            return _itp_root(f, a, b, fa, fb, ftol=1e-12)
+        # same sign: any root sits in the margin toward lo (f > 0) or hi (f < 0); close
+        # in on that end geometrically until f changes sign or Q stops being defined
+        end, xi, fi = (lo, a, fa) if fa > 0 else (hi, b, fb)
+        x = end + (xi - end) * 1e-3
+        while x != xi and x != end:
+            fx = f(x)
+            if fx is None:
+                break
+            if fx == 0:
+                return x
+            if (fx < 0) != (fi < 0):
+                return _itp_root(f, *((x, xi, fx, fi) if x < xi else (xi, x, fi, fx)), ftol=1e-12)
+            xi, fi = x, fx
+            x = end + (xi - end) * 1e-3
+        return xi   # |f| shrinks toward the root, so the point nearest the end is best
+
+    # otherwise (Q undefined near an end) scan lazily: stop at the first sign change,
+    # keeping the smallest |f| seen as the fallback
+    N = 200
+    best = None; bestx = None
+    prev = None   # (x, f) at the previous grid point, None if Q was undefined there
+    for i in range(N+1):
+        x = lo + w*i/N
+        v = f(x)
+        if v is None:
+            prev = None; continue
+        if v == 0: return x
+        if prev is not None and (prev[1] < 0) != (v < 0):
+            # refine inside the bracket (ITP: bisection's worst case, faster in practice)
+            return _itp_root(f, prev[0], x, prev[1], v, ftol=1e-12)
+        if best is None or abs(v) < best:
+            best = abs(v); bestx = x
+        prev = (x, v)
+    if bestx is None:
+        raise ValueError("Failed to evaluate Q over feasible x (check inputs).")
+    return bestx
+
+
+# One "coef species" term of a reaction side, e.g. "2 NH3" or "H2"
+_RX_TERM = re.compile(r"^\s*(\d*\.?\d*)\s*([A-Za-z0-9()^+\-·_]+)\s*$")
+# Reaction arrow between the two sides (first one wins), and the pure-phase tags left out of K
+_RX_ARROW = re.compile(r"<=>|<->|->|⇌|↔|⟷|=")
+_RX_PURE_PHASE = re.compile(r"\((?:s|l|pure)\)$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _parse_reaction_items(s: str):
+    """
+    Parse "a A + b B -> c C + d D" (also ⇌ ↔ ⟷ <=> <-> =) into a tuple of (species, ν) pairs,
+    reactants negative and products positive. Cached on the raw text, since the ICE,
+    Q and Ksp tools re-parse the same reaction on every refresh.
+    """
+    sides = _RX_ARROW.split(s, 1)
+    if len(sides) < 2:
+        raise ValueError("Use an arrow like '->' or '⇌' between sides.")
+    L, R = [part.strip() for part in sides]
+
+    st = defaultdict(float)   # species -> net ν, both sides accumulated in one pass
+
+    def parse_side(side, sign):
+        for term in side.split("+"):
+            term = term.strip()
+            if not term: 
+                continue
+            m = _RX_TERM.match(term)
+            if not m:
+                # allow plain species (implicit 1)
+                coef, sp = "", term
+            else:
+                coef, sp = m.group(1), m.group(2)
+            st[sp] += sign * (float(coef) if coef else 1.0)
+
+    parse_side(L, -1)
+    parse_side(R, +1)
+    # ensure both sides present
+    if all(v>=0 for v in st.values()) or all(v<=0 for v in st.values()):
+        raise ValueError("Reaction needs reactants and products on different sides.")
+    return tuple(st.items())
+
+
+def _log_reaction_quotient(terms, x=0.0):
+    """ln Q = Σ ν_i·ln(C0_i + ν_i·x) over (C0_i, ν_i) pairs; None if any amount is ≤ 0."""
+    s = 0.0
+    for c0, nu in terms:
+        c = c0 + nu * x
+        if c <= 0:
+            return None
+        s += nu * math.log(c)
+    return s
+
+
+def _reaction_quotient(terms, x=0.0):
+    """Q = Π (C0_i + ν_i·x)^ν_i, summed in log space so large ν neither overflows nor underflows midway."""
+    return _q_from_log(_log_reaction_quotient(terms, x))
+
+
+def _q_from_log(s):
+    """exp(ln Q), saturating to inf past the float range; None passes through."""
+    if s is None:
+        return None
+    return math.exp(s) if s < 709.78 else math.inf
+
+
+_RX_WS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=256)
+def _parse_axby(formula: str):
+    """
+    Return (x, y) for AxBy-type salts with two ionic groups.
+    Supports: Element–Element (AgCl), Element–polyatomic (CaCO3, NaNO3),
+    parentheses ((NH4)2SO4, Ca(OH)2, Fe(NO3)3), and element counts (Na2SO4).
+    Read in one left-to-right pass: "(group)n" or "Elem n" for the cation, then the anion.
+    Cached on the raw text, since the Ksp/Qsp buttons re-parse the same salt every press.
+    """
+    f = _RX_WS.sub("", formula)
+    if not f:
+        raise ValueError("Enter a salt formula.")
+    n = len(f)
+
+    def digits_end(i):
+        while i < n and f[i].isdecimal():
+            i += 1
+        return i
+
+    # --- first (cation) group: its count digits stop one short of the end, so an anion remains ---
+    if f[0] == "(":
+        j = f.find(")", 1)
+        k = digits_end(j + 1)
+        if j <= 1 or k == j + 1 == n: raise ValueError("Could not parse the first ion group.")
+        if k == n:
+            k -= 1                                       # "(NH4)23" → (NH4)2 + "3"
+        x = int(f[j+1:k]) if k > j + 1 else 1
+    elif f.startswith("NH4"):                      # common polyatomic cation without ()
+        x, k = 1, 3
+    else:
+        j = 2 if n > 1 and "a" <= f[1] <= "z" else 1     # element symbol end
+        k = digits_end(j)
+        if k == n and k > j:
+            k -= 1                                       # "Na2" → Na + "2"
+        elif k == n and j == 2:
+            j = k = 1                                    # "Ab" → A + "b"
+        if not ("A" <= f[0] <= "Z") or k == n:
+            raise ValueError("Enter a salt with two ionic groups, e.g. CaCO3, Ca(OH)2, Fe(NO3)3, Na2SO4, AgCl.")
+        x = int(f[j:k]) if k > j else 1
+
+    # --- second (anion) group ---
+    i = k
+    if i < n and f[i] == "(":
+        j = f.find(")", i + 1)
+        if j <= i + 1: raise ValueError("Could not parse the second ion group.")
+        k = digits_end(j + 1)                            # anything after the group is ignored
+        y = int(f[j+1:k]) if k > j + 1 else 1
+    elif i < n and "A" <= f[i] <= "Z":
+        # Single element like Cl2 -> y=2; multi-element like CO3/NO3 (no ()) -> y=1
+        j = i + 2 if i + 1 < n and "a" <= f[i+1] <= "z" else i + 1
+        k = digits_end(j)
+        y = int(f[j:k]) if k == n and k > j else 1
+    else:
+        y = 1
+    return x, y
+
+
+def _build_contribs(items, data_list):
+    """
+    Per-term ν·X lines for the reaction builder explanation, in one pass over the terms.
+    items: rows with side/formula/phase/nu; data_list: the matching thermo records.
+    Returns (LH, LS, LG, RH, RS, RG) line lists for reactants (L) and products (R).
+    """
+    out = {"L": ([], [], []), "R": ([], [], [])}
+    for it, data in zip(items, data_list):
+        lines_H, lines_S, lines_G = out[it["side"]]
+        sp = f"{it['formula']}({it['phase']})"
+        nu = it["nu"]
+        Hf = data.get("Hf"); S = data.get("S"); Gf = data.get("Gf")
+        lines_H.append(f"  {nu:g}×ΔH°f[{sp}] = {nu*Hf:.6g} kJ" if Hf is not None else f"  {nu:g}×ΔH°f[{sp}] = —")
+        lines_S.append(f"  {nu:g}×S°[{sp}] = {nu*S:.6g} J/K"   if S  is not None else f"  {nu:g}×S°[{sp}] = —")
+        lines_G.append(f"  {nu:g}×ΔG°f[{sp}] = {nu*Gf:.6g} kJ" if Gf is not None else f"  {nu:g}×ΔG°f[{sp}] = —")
+    return out["L"] + out["R"]
+
+
+# Concentration tool formula parser (molar masses are memoized).
+def _parse_formula(s):
+    """Element counts for a formula like "Al2(SO4)3" -> ({el: n}, index where parsing stopped)."""
+    # Single left-to-right scan; paren groups live on a stack of counters.
+    stack = [defaultdict(int)]
+    i, n = 0, len(s)
+    while i < n:
+        ch = s[i]
+        if ch == "(":
+            stack.append(defaultdict(int))
+            i += 1
+            continue
+        if "A" <= ch <= "Z":
+            i += 1
+            if i < n and "a" <= s[i] <= "z":
+                ch += s[i]; i += 1
+            el_counts = None
+        else:
+            # ")" closes the group; any other character ends it in place.
+            if ch == ")":
+                i += 1
+            if len(stack) == 1:
+                break
+            el_counts = stack.pop()
+        mult, start = 0, i
+        while i < n and "0" <= s[i] <= "9":
+            mult = mult * 10 + ord(s[i]) - 48; i += 1
+        if i == start:
+            mult = 1
+        comp = stack[-1]
+        if el_counts is None:
+            comp[ch] += mult
+        else:
+            for el, k in el_counts.items():
+                comp[el] += k * mult
+    # Unclosed groups count once, as the recursive parser did.
+    while len(stack) > 1:
+        sub = stack.pop(); comp = stack[-1]
+        for el, k in sub.items():
+            comp[el] += k
+    return stack[0], i
+
+
+@lru_cache(maxsize=512)
+def _conc_molar_mass(formula: str) -> float:
+    """Molar mass (g/mol) from ATOMIC_WEIGHTS; KeyError for an unknown element."""
+    comp, _ = _parse_formula(formula.strip())
+    total = 0.0
+    for el, n in comp.items():
+        total += ATOMIC_WEIGHTS[el] * n
+    return total
+
+
+# Concentration tool result lines: (value key, template, text when the value is None; None = omit)
+_CONC_RESULT_LINES = (
+    ("mass_soln", "Basis: solution mass = {mass_soln:.3g} g", None),
+    ("vol_soln", "Basis: solution volume = {vol_soln:.3g} mL", None),
+    ("mass_solute", "Solute mass = {mass_solute:.3g} g  (Mᵣ={Mr:.3f} g/mol)", None),
+    ("m", "Molality m = {m:.4g} mol/kg",
+     "Molality m = (needs mass of solvent ⇒ either w/w, or w/v with ρ_solution, or v/v with both densities)"),
+    ("M", "Molarity M = {M:.4g} mol/L",
+     "Molarity M = (needs solution volume ⇒ w/v, or w/w with ρ_solution, or v/v plus densities)"),
+    ("pct_line", "{pct_line}", None),
+    ("x", "Mole fraction x_solute = {x:.4f}  (solvent={solvent})", None),
+)
+_CONC_PCT_LINE = {
+    "w/w": "Mass percent (w/w) = {p:.4g}%",
+    "w/v": "Mass/volume percent (w/v) = {p:.4g}%  (={p:.4g} g per 100 mL)",
+    "v/v": "Volume percent (v/v) = {p:.4g}%  ({p:.4g} mL per 100 mL)",
+}
+
+
+# Colligative tool re-resolves the solute on every keystroke, and the Qsp checker on every
+# press; both lookups are pure.
+_name_to_formula_cached = lru_cache(maxsize=512)(name_to_formula)
+_molar_mass_cached = lru_cache(maxsize=512)(molar_mass)
+
+
+@lru_cache(maxsize=512)
+def _molar_mass_or_none(formula: str):
+    """Cached molar_mass that returns None for unparseable input (so misses are cached too)."""
+    try:
+        return molar_mass(formula)
+    except ValueError:
+        return None
+
+
+# Ion / van 't Hoff tool: minimal dissociation map (formula -> {ion: count})
+_DISS = {
+    "NaCl": {"Na+":1, "Cl-":1},
+    "KNO3":{"K+":1, "NO3-":1},
+    "K2SO4":{"K+":2, "SO4^2-":1},
+    "CaCl2":{"Ca^2+":1, "Cl-":2},
+    "Al2(SO4)3":{"Al^3+":2, "SO4^2-":3},
+    "K3PO4":{"K+":3, "PO4^3-":1},
+    "MgCl2":{"Mg^2+":1, "Cl-":2},
+}
+# formula -> (((ion, count), ...), ideal i), so compute() only multiplies by M
+_DISS_META = {f: (tuple(st.items()), sum(st.values())) for f, st in _DISS.items()}
+
+# Osmotic tool: dissociation map for ideal i (extend as you like)
+_OSMOTIC_DISS = {
+    "NaCl": {"Na+":1,"Cl-":1},
+    "KNO3":{"K+":1,"NO3-":1},
+    "K2SO4":{"K+":2,"SO4^2-":1},
+    "CaCl2":{"Ca^2+":1,"Cl-":2},
+    "Al2(SO4)3":{"Al^3+":2,"SO4^2-":3},
+    "MgCl2":{"Mg^2+":1,"Cl-":2},
+    "HCl": {"H+":1, "Cl-":1},
+    "H2SO4": {"H+":2, "SO4^2-":1},
+    # add more
+}
+
+
+# Colligative tool solvent presets (auto-fill Kb/Kf and pure Tb/Tf)
+_KBKF = {
+    # Aqueous standard
+    "water (H2O)":            {"Kb": 0.512, "Kf": 1.86, "Tb_C": 100.0,  "Tf_C": 0.0},
+
+    # Aromatics
+    "benzene (C6H6)":         {"Kb": 2.53,  "Kf": 5.12, "Tb_C": 80.1,   "Tf_C": 5.5},
+    "toluene (C7H8)":         {"Kb": 3.40,  "Kf": 7.60, "Tb_C": 110.6,  "Tf_C": -95.0},
+    "nitrobenzene (C6H5NO2)": {"Kb": 5.57,  "Kf": 7.00, "Tb_C": 210.9,  "Tf_C": 5.7},
+
+    # Alcohols / glycols
+    "ethanol (C2H5OH)":       {"Kb": 1.22,  "Kf": 1.99, "Tb_C": 78.37,  "Tf_C": -114.1},
+    "methanol (CH3OH)":       {"Kb": 0.78,  "Kf": 1.90, "Tb_C": 64.7,   "Tf_C": -97.6},
+    "ethylene glycol (C2H6O2)":{"Kb": 2.56, "Kf": 3.90, "Tb_C": 197.3,  "Tf_C": -12.9},  # Kf commonly tabulated ~3.9
+    "glycerol (C3H8O3)":      {"Kb": 3.73,  "Kf": 5.10, "Tb_C": 290.0,  "Tf_C": 18.2},
+
+    # Halogenated solvents
+    "chloroform (CHCl3)":     {"Kb": 3.63,  "Kf": 4.68, "Tb_C": 61.2,   "Tf_C": -63.5},
+
+
+    "carbon tetrachloride (CCl4)":{"Kb": 5.03,"Kf": 29.8,"Tb_C": 76.7,  "Tf_C": -22.9},
+    "dichloromethane (CH2Cl2)":{"Kb": 3.38, "Kf": 4.90, "Tb_C": 39.6,   "Tf_C": -95.0},
+
+    # Ketones / esters / nitriles / amides
+    "acetone (C3H6O)":        {"Kb": 1.71,  "Kf": 2.39, "Tb_C": 56.1,   "Tf_C": -94.7},
+    "ethyl acetate (C4H8O2)": {"Kb": 2.77,  "Kf": 4.50, "Tb_C": 77.1,   "Tf_C": -83.6},
+    "acetonitrile (C2H3N)":   {"Kb": 0.74,  "Kf": 3.90, "Tb_C": 81.6,   "Tf_C": -45.7},
+    "DMF (C3H7NO)":           {"Kb": 2.37,  "Kf": 3.70, "Tb_C": 153.0,  "Tf_C": -60.0},
+    "DMSO (C2H6OS)":          {"Kb": 2.85,  "Kf": 4.20, "Tb_C": 189.0,  "Tf_C": 18.5},
+
+    # Ethers / cycloalkanes
+    "diethyl ether (C4H10O)": {"Kb": 2.02,  "Kf": 1.79, "Tb_C": 34.6,   "Tf_C": -116.3},
+    "cyclohexane (C6H12)":    {"Kb": 2.79,  "Kf": 20.0, "Tb_C": 80.7,   "Tf_C": 6.5},
+
+    # Carboxylic acids / others
+    "acetic acid (CH3COOH)":  {"Kb": 2.93,  "Kf": 3.90, "Tb_C": 118.1,  "Tf_C": 16.6},
+
+    # Solids used for cryoscopy (very large Kf; Tb often irrelevant)
+    "camphor (C10H16O)":      {"Kb": None,  "Kf": 40.0, "Tb_C": 204.0,  "Tf_C": 179.8},  # classic cryoscopic solvent
+    "naphthalene (C10H8)":    {"Kb": None,  "Kf": 6.9,  "Tb_C": 218.0,  "Tf_C": 80.2},
+}
+_KBKF_SORTED_NAMES = tuple(sorted(_KBKF))
+
+# Kb/Kf lookup dialog: a small subset of the presets above (typical textbook values)
+_KBKF_LOOKUP = {n: _KBKF[n] for n in ("water (H2O)", "benzene (C6H6)", "ethanol (C2H5OH)",
+                                      "chloroform (CHCl3)", "acetic acid (CH3COOH)")}
+_KBKF_LOOKUP_NAMES = tuple(sorted(_KBKF_LOOKUP))
+_KBKF_LOOKUP_NAMES_LC = tuple((n.lower(), n) for n in _KBKF_LOOKUP_NAMES)
+
+
+# Colligative tool solute picker rows: (name, formula, i, note)
+_SOLUTE_I_PRESETS = (
+    # --- Non-electrolytes (i ≈ 1) ------------------------------------------
+    ("Glucose (non-electrolyte)", "C6H12O6", 1.0, "no dissociation; i≈1"),
+    ("Sucrose (non-electrolyte)", "C12H22O11", 1.0, "no dissociation; i≈1"),
+    ("Fructose (non-electrolyte)", "C6H12O6", 1.0, "no dissociation; i≈1"),
+    ("Urea (non-electrolyte)", "CH4N2O", 1.0, "no dissociation; i≈1"),
+    ("Ethanol (non-electrolyte)", "C2H5OH", 1.0, "no dissociation; i≈1"),
+    ("Methanol (non-electrolyte)", "CH3OH", 1.0, "no dissociation; i≈1"),
+    ("Glycerol (non-electrolyte)", "C3H8O3", 1.0, "no dissociation; i≈1"),
+    ("Ethylene glycol (non-electrolyte)", "C2H6O2", 1.0, "no dissociation; i≈1"),
+    ("Propylene glycol (non-electrolyte)", "C3H8O2", 1.0, "no dissociation; i≈1"),
+
+    # --- Strong acids/bases (nominally i≈2; activity < 2 in practice) -------
+    ("HCl (strong acid)",  "HCl",   2.0, ""),
+    ("HBr (strong acid)",  "HBr",   2.0, ""),
+    ("HI (strong acid)",   "HI",    2.0, ""),
+    ("HNO3 (strong acid)", "HNO3",  2.0, ""),
+    ("HClO4 (strong acid)","HClO4", 2.0, ""),
+    ("NaOH (strong base)", "NaOH",  2.0, ""),
+    ("KOH (strong base)",  "KOH",   2.0, ""),
+    ("LiOH (strong base)", "LiOH",  2.0, ""),
+
+    # --- Weak acids/bases (i a little > 1; depends on α) --------------------
+    ("HF (weak acid)",        "HF",      1.0, "i slightly >1; strongly solvent-dependent"),
+    ("CH3COOH (acetic acid)", "CH3COOH", 1.0, "i slightly >1; depends on dissociation"),
+    ("H2CO3 (carbonic acid)", "H2CO3",   1.0, "polyprotic weak acid; i>1 but small in dilute soln"),
+    ("H3PO4 (phosphoric acid)","H3PO4",  1.0, "triprotic weak; i between 1 and 4 depending on pH"),
+    ("NH3(aq) (weak base)",   "NH3",     1.0, "forms NH4+ + OH−; i>1 but small in dilute soln"),
+    ("NH4OH (aq ammonia)",    "NH4OH",   1.0, "convenience formula; weak base"),
+
+    # --- 1:1 salts (→ 2 ions; i≈2) ------------------------------------------
+    ("NaCl", "NaCl", 2.0, ""), ("KCl", "KCl", 2.0, ""), ("LiCl", "LiCl", 2.0, ""),
+    ("NaBr", "NaBr", 2.0, ""), ("KBr", "KBr", 2.0, ""), ("NaI", "NaI", 2.0, ""), ("KI", "KI", 2.0, ""),
+    ("NaF",  "NaF",  2.0, ""), ("KF",  "KF",  2.0, ""),
+    ("NaNO3","NaNO3",2.0, ""), ("KNO3","KNO3",2.0, ""), ("NH4NO3","NH4NO3",2.0, ""),
+    ("NaClO4","NaClO4",2.0,""), ("KClO4","KClO4",2.0,""),
+    ("NaOAc (sodium acetate)","CH3COONa", 2.0, "salt of weak acid; still dissociates to 2 ions"),
+    ("NH4Cl", "NH4Cl", 2.0, ""), ("NaHCO3","NaHCO3",2.0,""), ("NaHSO3","NaHSO3",2.0,""),
+
+    # --- 2:1 or 1:2 salts (→ 3 ions; i≈3) -----------------------------------
+    ("MgCl2", "MgCl2", 3.0, ""), ("CaCl2", "CaCl2", 3.0, ""), ("SrCl2", "SrCl2", 3.0, ""), ("BaCl2","BaCl2",3.0,""),
+    ("ZnCl2","ZnCl2",3.0,""), ("FeCl2","FeCl2",3.0,""), ("CuCl2","CuCl2",3.0,""), ("Pb(NO3)2","Pb(NO3)2",3.0,""),
+    ("Na2SO4","Na2SO4",3.0,""), ("K2SO4","K2SO4",3.0,""), ("(NH4)2SO4","(NH4)2SO4",3.0,""),
+    ("Na2CO3","Na2CO3",3.0,""), ("K2CO3","K2CO3",3.0,""), ("(NH4)2CO3","(NH4)2CO3",3.0,""),
+    ("Ca(NO3)2","Ca(NO3)2",3.0,""), ("Mg(NO3)2","Mg(NO3)2",3.0,""), ("Ba(NO3)2","Ba(NO3)2",3.0,""),
+    ("Ba(OH)2","Ba(OH)2",3.0,"strong base; limited solubility"),
+    ("Ca(OH)2","Ca(OH)2",3.0,"strong base; limited solubility"),
+
+    # --- 3:1 or 1:3 salts (→ 4 ions; i≈4) -----------------------------------
+    ("AlCl3","AlCl3",4.0,"hydrolyzes somewhat in water (real i < 4)"),
+    ("FeCl3","FeCl3",4.0,"hydrolysis lowers effective i"),
+    ("CrCl3","CrCl3",4.0,""),
+    ("Al(NO3)3","Al(NO3)3",4.0,""),
+    ("Fe(NO3)3","Fe(NO3)3",4.0,""),
+    ("Na3PO4","Na3PO4",4.0,"basic solution; phosphate equilibria in real systems"),
+
+    # --- 3:2 salts (→ 5 ions; i≈5) ------------------------------------------
+    ("Al2(SO4)3","Al2(SO4)3",5.0,""),
+    ("Fe2(SO4)3","Fe2(SO4)3",5.0,""),
+    ("Cr2(SO4)3","Cr2(SO4)3",5.0,""),
+
+    # --- Complex ion salts (fully dissociate to counterions + complex) -------
+    ("K3[Fe(CN)6]","K3Fe(CN)6",4.0,"3 K+ + [Fe(CN)6]3− → 4 particles"),
+    ("K4[Fe(CN)6]","K4Fe(CN)6",5.0,"4 K+ + [Fe(CN)6]4− → 5 particles"),
+
+    # --- Polyprotic strong (upper bounds) ------------------------------------
+    ("H2SO4 (upper-bound ideal)","H2SO4",3.0,"dilute realistic 2<i<3 (2nd dissociation incomplete)"),
+
+    # --- “Real world” caveats ------------------------------------------------
+    ("CuSO4 (association/hydration)","CuSO4",2.0,"hydrates; ion pairing can lower i"),
+    ("AgNO3 (complexation in some media)","AgNO3",2.0,"can form complexes; i<2 in some conditions"),
+    ("CaSO4 (very low solubility)","CaSO4",2.0,"sparingly soluble; colligative effects negligible"),
+)
+# Lowercased (name, formula) per row so the picker filter doesn't re-lower on every keystroke
+_SOLUTE_I_SEARCH = tuple((r[0].lower(), r[1].lower(), r) for r in _SOLUTE_I_PRESETS)
+_SOLUTE_I_LABEL = {r: f"{r[0]}  [{r[1]}]  →  i={r[2]:g}" + (f" — {r[3]}" if r[3] else "")
+                   for r in _SOLUTE_I_PRESETS}
+
+
 class ChemGUI(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -37,6 +815,8 @@ class ChemGUI(tk.Tk):
         self._build_layout()
         self._refresh_equation_list()
         self.phase_catalog, self.phase_catalog_path = load_phase_catalog()
+        # kept sorted alongside phase_catalog (bisect.insort on save) for the substance combobox
+        self._phase_catalog_sorted_keys = sorted(self.phase_catalog)
 
 
     # ---------------- UI BUILD ----------------
@@ -584,8 +1364,7 @@ class ChemGUI(tk.Tk):
             q = sub_entry.get()
             items = suggest_substances(q, limit=60)
             sugg.delete(0, tk.END)
-            for label, _formula in items:
-                sugg.insert(tk.END, label)
+            sugg.insert(tk.END, *[label for label, _f in items])
             if items:
                 sugg.configure(height=min(8, len(items)))
                 sugg.grid()
@@ -882,14 +1661,13 @@ class ChemGUI(tk.Tk):
         ttk.Label(frm, textvariable=val_Gf).grid(row=5, column=0, columnspan=4, sticky="w", pady=2)
         ttk.Label(frm, textvariable=val_S).grid(row=6, column=0, columnspan=4, sticky="w", pady=2)
 
-        # Helper: current formula & refresh
-        current_formula = {"f": ""}
+        # Helper: current formula & refresh (None until the first refresh)
+        current_formula = {"f": None}
 
         def _refresh_suggestions(_=None):
             items = suggest_substances(ent.get(), limit=60)
             sugg.delete(0, tk.END)
-            for label, f in items:
-                sugg.insert(tk.END, label)
+            sugg.insert(tk.END, *[label for label, _f in items])
             if items:
                 sugg.configure(height=min(8, len(items))); sugg.grid(); scx.grid()
             else:
@@ -906,6 +1684,8 @@ class ChemGUI(tk.Tk):
 
         def _refresh_formula_and_phases():
             f = name_to_formula(ent.get().strip())
+            if f == current_formula["f"]:
+                return  # e.g. "wate" → "water": same formula, phases/values already shown
             current_formula["f"] = f
             phs = phases_for(f) or ["g","l","s","aq"]
             phase.config(values=phs)
@@ -936,7 +1716,7 @@ class ChemGUI(tk.Tk):
         def _add_known(kind: str):
             f = current_formula["f"]; ph = phase.get(); data = get_thermo(f, ph)
             if not data:
-                tk.messagebox.showerror("No data", "No table value for that species/phase.", parent=win); return
+                messagebox.showerror("No data", "No table value for that species/phase.", parent=win); return
             if kind == "Hf":
                 base = data["Hf"] * 1000.0  # -> J/mol
                 self.known_base["ΔH°f"] = base
@@ -950,20 +1730,17 @@ class ChemGUI(tk.Tk):
                 self.known_base["S°"] = base
                 self.known_ui["S°"] = {"unit": "J/(mol·K)", "display_value": data["S"]}
             self._refresh_known_table(); self._refresh_equation_list()
-            tk.messagebox.showinfo("Added", "Value added to Known Variables.", parent=win)
+            messagebox.showinfo("Added", "Value added to Known Variables.", parent=win)
 
         ttk.Button(btns, text="Add ΔH°f", command=lambda: _add_known("Hf")).pack(side=tk.LEFT, padx=(0,6))
         ttk.Button(btns, text="Add ΔG°f", command=lambda: _add_known("Gf")).pack(side=tk.LEFT, padx=(0,6))
         ttk.Button(btns, text="Add S°",    command=lambda: _add_known("S")).pack(side=tk.LEFT)
 
-        _refresh_suggestions()
+        # populate once the modal is mapped, not before its first paint
+        win.after_idle(_refresh_suggestions)
 
 
     def _open_reaction_builder(self):
-        import tkinter as tk
-        from tkinter import ttk, messagebox
-        import math
-
         win = tk.Toplevel(self)
         win.title("Reaction builder — ΔH°, ΔS°, ΔG° (298 K)")
         win.transient(self); win.grab_set()
@@ -1042,8 +1819,7 @@ class ChemGUI(tk.Tk):
             from molar_masses import suggest_substances, name_to_formula
             data = suggest_substances(ent.get(), limit=60)
             sugg.delete(0, tk.END)
-            for label, f in data:
-                sugg.insert(tk.END, label)
+            sugg.insert(tk.END, *[label for label, _f in data])
             if data:
                 sugg.configure(height=min(8, len(data))); sugg.grid(); scx.grid()
             else:
@@ -1082,13 +1858,16 @@ class ChemGUI(tk.Tk):
             f = name_to_formula(ent.get().strip())
             ph = phase.get()
             try:
-                nu = float(coeff.get().strip().replace(",", "."))
+                nu = _parse_float(coeff.get())
             except ValueError:
                 messagebox.showerror("Bad ν", "Coefficient must be a number.", parent=win); return
             data = get_thermo(f, ph) or {}
             Hf = data.get("Hf"); Gf = data.get("Gf"); S = data.get("S")
 
-            row = {"side": side, "formula": f, "phase": ph, "nu": nu, "Hf": Hf, "Gf": Gf, "S": S}
+            # signed_nu: +ν for products, −ν for reactants (the power of the species in Q)
+            signed_nu = nu if side == "R" else -nu
+            row = {"side": side, "formula": f, "phase": ph, "nu": nu, "signed_nu": signed_nu,
+                   "Hf": Hf, "Gf": Gf, "S": S}
             items.append(row)
 
             vals = (
@@ -1146,16 +1925,14 @@ class ChemGUI(tk.Tk):
             ttk.Label(tbl_ns, text="Species").grid(row=0, column=0, sticky="w")
             ttk.Label(tbl_ns, text="Value (atm or M)").grid(row=0, column=1, sticky="w")
             r = 1
-            # collect species with sign: products positive, reactants negative
-            for side in ("L","R"):
-                for it in items:
-                    if it["side"] != side: continue
-                    sp = f"{it['formula']}({it['phase']})"
-                    power = it["nu"] if side=="R" else -it["nu"]
-                    ttk.Label(tbl_ns, text=f"{sp}   (power {power:g})").grid(row=r, column=0, sticky="w")
-                    e = ttk.Entry(tbl_ns, width=12); e.grid(row=r, column=1, sticky="w"); e.insert(0, "1.0")
-                    ns_entries.append({"sp": sp, "nu": power, "entry": e})
-                    r += 1
+            # species with sign already applied: products positive, reactants negative
+            for it in items:
+                sp = f"{it['formula']}({it['phase']})"
+                power = it["signed_nu"]
+                ttk.Label(tbl_ns, text=f"{sp}   (power {power:g})").grid(row=r, column=0, sticky="w")
+                e = ttk.Entry(tbl_ns, width=12); e.grid(row=r, column=1, sticky="w"); e.insert(0, "1.0")
+                ns_entries.append({"sp": sp, "nu": power, "entry": e})
+                r += 1
             if r == 1:
                 ttk.Label(tbl_ns, text="(Add reactants/products above, then click ‘Use current reaction’.)").grid(row=1, column=0, columnspan=2, sticky="w")
 
@@ -1169,7 +1946,7 @@ class ChemGUI(tk.Tk):
             txt = (man_dG0.get() or "").strip()
             if txt:
                 try:
-                    dG0 = float(txt.replace(",", "."))  # kJ/mol
+                    dG0 = _parse_float(txt)  # kJ/mol
                 except ValueError:
                     messagebox.showerror("Bad ΔG°rxn", "ΔG°rxn must be numeric (kJ/mol).", parent=win); return
                 source_msg = f"manual ΔG°rxn = {dG0:.6g} kJ/mol"
@@ -1191,18 +1968,17 @@ class ChemGUI(tk.Tk):
             try:
                 Q = 1.0
                 for row in ns_entries:
-                    val = float(row["entry"].get().replace(",", "."))
+                    val = _parse_float(row["entry"].get())
                     if val <= 0: raise ValueError
                     Q *= val ** row["nu"]
             except ValueError:
                 messagebox.showerror("Bad input", "All P/C values must be positive numbers.", parent=win); return
 
             # Thermo math
-            R_J = 8.314462618      # J mol^-1 K^-1
-            RkJ = 0.008314462618   # kJ mol^-1 K^-1
-            T   = 298.15
+            RkJ = _R / 1000.0                          # kJ mol^-1 K^-1
+            T   = _T298
             dG  = dG0 + RkJ*T*math.log(Q)              # kJ/mol
-            K   = math.exp(-(dG0*1000.0)/(R_J*T))      # dimensionless
+            K   = math.exp(dG0*_NEG_INV_RT_298)        # dimensionless
 
             # Direction from Q vs K
             rel = abs(math.log(Q/K))                   # tolerance in log space
@@ -1239,12 +2015,10 @@ class ChemGUI(tk.Tk):
             if not val:
                 messagebox.showerror("Need ΔG°rxn", "Enter ΔG°rxn (kJ/mol) or compute it above.", parent=win); return
             try:
-                dG0 = float(val.replace(",", "."))
+                dG0 = _parse_float(val)
             except ValueError:
                 messagebox.showerror("Bad ΔG°rxn", "ΔG°rxn must be numeric (kJ/mol).", parent=win); return
-            R = 8.314462618  # J/(mol·K)
-            T = 298.15
-            K = math.exp(-(dG0*1000.0)/(R*T))
+            K = math.exp(dG0*_NEG_INV_RT_298)
             out_nonstd.set(f"K (298 K) from ΔG° = {dG0:.6g} kJ/mol  →  K ≈ {K:.3e}  (≈ {K:.6g})")
 
         def _compute_Q_only():
@@ -1252,7 +2026,7 @@ class ChemGUI(tk.Tk):
             Q_num = 1.0; Q_den = 1.0
             try:
                 for row in ns_entries:
-                    val = float(row["entry"].get().replace(",", "."))
+                    val = _parse_float(row["entry"].get())
                     if val <= 0: raise ValueError
                     power = row["nu"]
                     if power > 0: Q_num *= val**power
@@ -1278,73 +2052,60 @@ class ChemGUI(tk.Tk):
         explain.configure(yscrollcommand=sv.set); sv.grid(row=9, column=9, sticky="ns")
         explain.configure(state="disabled")
 
-        def _write_explain(lines):
+        def _write_explain(*sections):
+            # any number of line groups -> one joined string -> a single Tk insert
+            body = "\n".join(itertools.chain.from_iterable(sections))
             explain.configure(state="normal")
             explain.delete("1.0", "end")
-            explain.insert("1.0", "\n".join(lines))
+            explain.insert("1.0", body)
             explain.configure(state="disabled")
 
         # ---------- Compute & Add to Known ----------
         def _compute():
             import math
 
-            # sums (kJ/mol for H,G; J/(mol·K) for S) and how many valid terms we had
-            sum_H_L = sum_G_L = 0.0
-            sum_S_L = 0.0
-            sum_H_R = sum_G_R = 0.0
-            sum_S_R = 0.0
-            cnt_H = cnt_S = cnt_G = 0
             missing = []
 
-            # pretty per-side contribution strings (uses items already in scope)
-            def contrib_str(side):
-                lines_H, lines_S, lines_G = [], [], []
-                for it in items:
-                    if it["side"] != side: 
-                        continue
-                    sp = f"{it['formula']}({it['phase']})"
-                    nu = it["nu"]
-                    Hf = it.get("Hf"); Gf = it.get("Gf"); S = it.get("S")
-                    lines_H.append(f"  {nu:g}×ΔH°f[{sp}] = {nu*Hf:.6g} kJ" if Hf is not None else f"  {nu:g}×ΔH°f[{sp}] = —")
-                    lines_S.append(f"  {nu:g}×S°[{sp}] = {nu*S:.6g} J/K"   if S  is not None else f"  {nu:g}×S°[{sp}] = —")
-                    lines_G.append(f"  {nu:g}×ΔG°f[{sp}] = {nu*Gf:.6g} kJ" if Gf is not None else f"  {nu:g}×ΔG°f[{sp}] = —")
-                return lines_H, lines_S, lines_G
-
-            # accumulate sums from the table (use get_thermo to re-read authoritative values)
-            for it in items:
-                data = get_thermo(it["formula"], it["phase"]) or {}
+            # accumulate sums from the table (use get_thermo to re-read authoritative values).
+            # One lookup per term, and the side picks the accumulator instead of branching.
+            # Contributions are collected and summed with math.fsum (exact, order-independent).
+            data_list = [_get_thermo_cached(it["formula"], it["phase"]) or {} for it in items]
+            contribs = {"L": {"Hf": [], "Gf": [], "S": []},
+                        "R": {"Hf": [], "Gf": [], "S": []}}
+            for it, data in zip(items, data_list):
+                side_contribs = contribs[it["side"]]
                 nu = it["nu"]
-                isL = (it["side"] == "L")
-
-                if "Hf" in data:
-                    (sum_H_L if isL else sum_H_R)  # just to choose var
-                    if isL: sum_H_L += nu * data["Hf"]
-                    else:   sum_H_R += nu * data["Hf"]
-                    cnt_H += 1
-                else:
-                    missing.append(f"ΔH°f {it['formula']}({it['phase']})")
-
-                if "Gf" in data:
-                    if isL: sum_G_L += nu * data["Gf"]
-                    else:   sum_G_R += nu * data["Gf"]
-                    cnt_G += 1
-                else:
-                    missing.append(f"ΔG°f {it['formula']}({it['phase']})")
+                for key, label in (("Hf", "ΔH°f"), ("Gf", "ΔG°f"), ("S", "S°")):
+                    if key in data:
+                        side_contribs[key].append(nu * data[key])
+                    else:
+                        missing.append(f"{label} {it['formula']}({it['phase']})")
 
-                if "S" in data:
-                    if isL: sum_S_L += nu * data["S"]
-                    else:   sum_S_R += nu * data["S"]
-                    cnt_S += 1
-                else:
-                    missing.append(f"S° {it['formula']}({it['phase']})")
-
-            if missing:
-                tk.messagebox.showwarning(
-                    "Missing data",
-                    "No/partial table data for: " + ", ".join(sorted(set(missing))) +
-                    "\n(You can add them in thermo_data.py.)",
-                    parent=win
-                )
+            # sums (kJ/mol for H,G; J/(mol·K) for S) and how many valid terms we had
+            cL, cR = contribs["L"], contribs["R"]
+            sum_H_L, sum_G_L, sum_S_L = math.fsum(cL["Hf"]), math.fsum(cL["Gf"]), math.fsum(cL["S"])
+            sum_H_R, sum_G_R, sum_S_R = math.fsum(cR["Hf"]), math.fsum(cR["Gf"]), math.fsum(cR["S"])
+            cnt_H = len(cL["Hf"]) + len(cR["Hf"])
+            cnt_G = len(cL["Gf"]) + len(cR["Gf"])
+            cnt_S = len(cL["S"]) + len(cR["S"])
+
+            # dedupe + sort once; shared by the warning and the explanation text
+            missing_unique = list(dict.fromkeys(missing))
+            missing_unique.sort()
+
+            if missing_unique:
+                # shown once Tk is idle, so the numbers below are on screen behind the dialog
+                msg = ("No/partial table data for: " + ", ".join(missing_unique) +
+                       "\n(You can add them in thermo_data.py.)")
+                win.after_idle(lambda: messagebox.showwarning("Missing data", msg, parent=win))
+
+            # nothing computable (empty reaction or no table data at all): skip the narrative
+            if cnt_H == cnt_G == cnt_S == 0:
+                outH.set("ΔH°rxn: (not enough ΔH°f data)")
+                outS.set("ΔS°rxn: (not enough S° data)")
+                outG.set("ΔG°rxn: (not enough ΔG°f data)")
+                _write_explain(["No thermodynamic data available for any term."])
+                return {"dH_kJ": None, "dS_J": None, "dG_kJ": None}
 
             # decide availability and compute deltas
             haveH = cnt_H > 0
@@ -1353,69 +2114,59 @@ class ChemGUI(tk.Tk):
             dH = (sum_H_R - sum_H_L) if haveH else None   # kJ/mol
             dS = (sum_S_R - sum_S_L) if haveS else None   # J/(mol·K)
             dG = (sum_G_R - sum_G_L) if haveG else None   # kJ/mol
+            K = math.exp(dG*_NEG_INV_RT_298) if dG is not None else None   # 298 K
 
             # headline numbers + quick meanings
             if dH is not None:
-                heat = "exothermic (releases heat)" if dH < 0 else ("endothermic (absorbs heat)" if dH > 0 else "thermally neutral")
-                outH.set(f"ΔH°rxn = {dH:.6g} kJ/mol   — {heat}")
+                outH.set(f"ΔH°rxn = {dH:.6g} kJ/mol   — {_HEAT[_sign_idx(dH)]}")
             else:
                 outH.set("ΔH°rxn: (not enough ΔH°f data)")
 
             if dS is not None:
-                entro = "entropy increases (more disorder)" if dS > 0 else ("entropy decreases (more order)" if dS < 0 else "no net entropy change")
-                outS.set(f"ΔS°rxn = {dS:.6g} J/(mol·K)   — {entro}")
+                outS.set(f"ΔS°rxn = {dS:.6g} J/(mol·K)   — {_ENTRO[_sign_idx(dS)]}")
             else:
                 outS.set("ΔS°rxn: (not enough S° data)")
 
             if dG is not None:
-                R = 8.314462618  # J/(mol·K)
-                T = 298.15
-                K = math.exp(-(dG*1000.0)/(R*T))
-                spont = "spontaneous at 298 K" if dG < 0 else ("non-spontaneous at 298 K" if dG > 0 else "at equilibrium tendency at 298 K")
-                outG.set(f"ΔG°rxn = {dG:.6g} kJ/mol   — {spont}   (K≈{K:.3e})")
+                outG.set(f"ΔG°rxn = {dG:.6g} kJ/mol   — {_SPONT[_sign_idx(dG)]}   (K≈{K:.3e})")
             else:
                 outG.set("ΔG°rxn: (not enough ΔG°f data)")
 
             # algebra + narrative in the explanation box
             lines = []
-            if missing:
-                lines.append("Missing table entries (ignored in sums): " + ", ".join(sorted(set(missing))) + "\n")
-
-            LH, LS, LG = contrib_str("L")
-            RH, RS, RG = contrib_str("R")
+            if missing_unique:
+                lines.append("Missing table entries (ignored in sums): " + ", ".join(missing_unique) + "\n")
+
+            LH, LS, LG, RH, RS, RG = _build_contribs(items, data_list)
+
+            def _sum_block(header, sym, lhs, rhs, s_L, s_R, d, unit):
+                # one quantity's algebra; built as its own list and extended into lines
+                block = [header, "  Reactants:"]
+                block.extend(lhs)
+                block.append(f"  Σ_L = {s_L:.6g} {unit}")
+                block.append("  Products:")
+                block.extend(rhs)
+                block.append(f"  Σ_R = {s_R:.6g} {unit}")
+                block.append(f"  ⇒ {sym} = {s_R:.6g} − {s_L:.6g} = {d:.6g} {unit}\n")
+                return block
 
             if dH is not None:
-                lines.append("ΔH°rxn = ΣνΔH°f(products) − ΣνΔH°f(reactants)")
-                lines += ["  Reactants:"] + LH + [f"  Σ_L = {sum_H_L:.6g} kJ"]
-                lines += ["  Products:"] + RH + [f"  Σ_R = {sum_H_R:.6g} kJ"]
-                lines.append(f"  ⇒ ΔH°rxn = {sum_H_R:.6g} − {sum_H_L:.6g} = {dH:.6g} kJ\n")
+                lines.extend(_sum_block("ΔH°rxn = ΣνΔH°f(products) − ΣνΔH°f(reactants)", "ΔH°rxn",
+                                        LH, RH, sum_H_L, sum_H_R, dH, "kJ"))
             if dS is not None:
-                lines.append("ΔS°rxn = ΣνS°(products) − ΣνS°(reactants)")
-                lines += ["  Reactants:"] + LS + [f"  Σ_L = {sum_S_L:.6g} J/K"]
-                lines += ["  Products:"] + RS + [f"  Σ_R = {sum_S_R:.6g} J/K"]
-                lines.append(f"  ⇒ ΔS°rxn = {sum_S_R:.6g} − {sum_S_L:.6g} = {dS:.6g} J/K\n")
+                lines.extend(_sum_block("ΔS°rxn = ΣνS°(products) − ΣνS°(reactants)", "ΔS°rxn",
+                                        LS, RS, sum_S_L, sum_S_R, dS, "J/K"))
             if dG is not None:
-                lines.append("ΔG°rxn = ΣνΔG°f(products) − ΣνΔG°f(reactants)")
-                lines += ["  Reactants:"] + LG + [f"  Σ_L = {sum_G_L:.6g} kJ"]
-                lines += ["  Products:"] + RG + [f"  Σ_R = {sum_G_R:.6g} kJ"]
-                lines.append(f"  ⇒ ΔG°rxn = {sum_G_R:.6g} − {sum_G_L:.6g} = {dG:.6g} kJ\n")
+                lines.extend(_sum_block("ΔG°rxn = ΣνΔG°f(products) − ΣνΔG°f(reactants)", "ΔG°rxn",
+                                        LG, RG, sum_G_L, sum_G_R, dG, "kJ"))
 
             lines.append("What these mean (at ~298 K):")
             if dH is not None:
-                lines.append(f"  • ΔH°rxn {dH:+.6g} kJ/mol → " +
-                            ("exothermic (releases heat)" if dH < 0 else
-                            "endothermic (absorbs heat)" if dH > 0 else "thermally neutral"))
+                lines.append(f"  • ΔH°rxn {dH:+.6g} kJ/mol → {_HEAT[_sign_idx(dH)]}")
             if dS is not None:
-                lines.append(f"  • ΔS°rxn {dS:+.6g} J/(mol·K) → " +
-                            ("entropy increases (more disorder)" if dS > 0 else
-                            "entropy decreases (more order)" if dS < 0 else "no net entropy change"))
+                lines.append(f"  • ΔS°rxn {dS:+.6g} J/(mol·K) → {_ENTRO[_sign_idx(dS)]}")
             if dG is not None:
-                R = 8.314462618; T = 298.15
-                K = math.exp(-(dG*1000.0)/(R*T))
-                lines.append(f"  • ΔG°rxn {dG:+.6g} kJ/mol → " +
-                            ("spontaneous at 298 K (thermodynamically favorable)" if dG < 0 else
-                            "non-spontaneous at 298 K (requires driving force)" if dG > 0 else
-                            "at equilibrium tendency at 298 K"))
+                lines.append(f"  • ΔG°rxn {dG:+.6g} kJ/mol → {_SPONT_DETAIL[_sign_idx(dG)]}")
                 lines.append(f"  • Estimated K (298 K): K ≈ exp(−ΔG°/RT) = {K:.3e}  (≈ {K:.6g})")
                 lines.append("    Rule-of-thumb: |ΔG°| ≈ 5.7 kJ/mol ↔ 10× change in K at 298 K.")
             else:
@@ -1453,7 +2204,7 @@ class ChemGUI(tk.Tk):
         sugg.bind("<Return>", _accept_suggestion)
         sugg.bind("<Double-Button-1>", _accept_suggestion)
 
-        _refresh_suggestions()
+        win.after_idle(_refresh_suggestions)
 
 
     def _open_equilibrium_dg_steps(self):
@@ -1501,25 +2252,13 @@ class ChemGUI(tk.Tk):
         txt.configure(yscrollcommand=vs.set)
         vs.place(relx=1.0, rely=0, relheight=1.0, anchor="ne")
 
-        def fmt(x):
-            # compact scientific (up to 6 sig figs)
-            return f"{x:.6g}"
-
-        steps = []
-        steps.append("Given (using Known Variables):\n")
-        steps.append(f"  ΔG°rxn = {dG_disp['display_value']:.6g} {dG_disp['unit']}  (= {dG_base:.6g} J/mol)\n")
-        steps.append(f"  T      = {T_disp['display_value']:.6g} {T_disp['unit']}\n")
-        steps.append(f"  R      = {R_disp['display_value']:.6g} {R_disp['unit']}\n\n")
-        steps.append("Compute exponent x = −ΔG°rxn / (R·T):\n")
-        steps.append(f"  x = −({dG_base:.6g} J/mol) / ({R:.6g} J/(mol·K) × {T:.6g} K)\n")
-        steps.append(f"    = {x:.6g}\n\n")
-        steps.append("Then K = exp(x):\n")
-        steps.append(f"  K = exp({x:.6g}) = {K:.6g}\n")
-        steps.append(f"  → scientific: {K:.3e}\n\n")
-        steps.append("Useful rule-of-thumb at this T:\n")
-        steps.append(f"  RT·ln(10) = {rtln10_kJ:.3f} kJ/mol  (ΔG° change per 10× change in K)\n")
-        steps.append(f"  RT·ln(2)  = {rtln2_kJ:.3f} kJ/mol   (ΔG° change per 2× change in K)\n")
-        txt.insert("1.0", "".join(steps))
+        ctx = {
+            "dG_disp": dG_disp["display_value"], "dG_unit": dG_disp["unit"], "dG_base": dG_base,
+            "T_disp": T_disp["display_value"], "T_unit": T_disp["unit"], "T": T,
+            "R_disp": R_disp["display_value"], "R_unit": R_disp["unit"], "R": R,
+            "x": x, "K": K, "rtln10_kJ": rtln10_kJ, "rtln2_kJ": rtln2_kJ,
+        }
+        txt.insert("1.0", _DG_TEMPLATE.format_map(ctx))
         txt.configure(state="disabled")
 
         # Buttons
@@ -1588,31 +2327,28 @@ class ChemGUI(tk.Tk):
             row=6, column=0, columnspan=4, sticky="w", pady=(4, 6)
         )
 
-        # Step-by-step log (monospace label; easy and no extra imports)
+        # Step-by-step log (read-only monospace Text; no Label wraplength re-measure on long logs)
         ttk.Label(frm, text="Calculation details:", font=("Segoe UI", 9, "bold")).grid(
             row=7, column=0, columnspan=4, sticky="w", pady=(6, 2)
         )
-        steps_var = tk.StringVar(value="")
-        steps_lbl = ttk.Label(
-            frm, textvariable=steps_var, justify="left", wraplength=520, font=("Courier New", 9)
-        )
-        steps_lbl.grid(row=8, column=0, columnspan=4, sticky="w")
+        steps_txt = tk.Text(frm, height=14, wrap="word", font=("Courier New", 9), relief="flat")
+        steps_txt.grid(row=8, column=0, columnspan=4, sticky="nsew")
+        steps_txt.configure(state="disabled")
+        frm.grid_rowconfigure(8, weight=1)
 
         def compute_ke(E_J, steps):
-            """Compute KE from photon energy and work function field. Writes to ke_out and appends steps."""
-            txt = wf_entry.get().strip()
-            if not txt:
-                ke_out.set("")  # no work function provided → clear
-                return steps
+            """KE from photon energy and the work function field. Appends to steps (a list); returns the ke_out text."""
             try:
-                wf_kJmol = float(txt.replace(",", "."))
+                wf_kJmol = _opt_float(wf_entry.get())
             except ValueError:
-                ke_out.set("Invalid work function.")
-                return steps + "\n[φ] Invalid work function; cannot compute KE."
+                steps.append("\n[φ] Invalid work function; cannot compute KE.")
+                return "Invalid work function."
+            if wf_kJmol is None:
+                return ""  # no work function provided → clear
 
             NA = 6.022_140_76e23  # Avogadro's number
             wf_J = wf_kJmol * 1000.0 / NA  # J per electron
-            steps += (
+            steps.append(
                 f"\n[Photoelectric]\n"
                 f"  φ_given = {wf_kJmol:g} kJ/mol\n"
                 f"  Convert φ → J/electron: φ_J = (φ_kJmol × 1000) / N_A\n"
@@ -1622,12 +2358,10 @@ class ChemGUI(tk.Tk):
 
             KE = E_J - wf_J
             if KE <= 0:
-                ke_out.set("Photon energy < work function: no electrons ejected.")
-                steps += "  Result: E_photon ≤ φ → no electrons ejected.\n"
-                return steps
-            ke_out.set(f"Kinetic energy of ejected electron: {KE:.3e} J  ({KE/1.602_176_634e-19:.3g} eV)")
-            steps += f"  Result: KE = {KE:.6e} J = {KE/1.602_176_634e-19:.6g} eV\n"
-            return steps
+                steps.append("  Result: E_photon ≤ φ → no electrons ejected.\n")
+                return "Photon energy < work function: no electrons ejected."
+            steps.append(f"  Result: KE = {KE:.6e} J = {KE/1.602_176_634e-19:.6g} eV\n")
+            return f"Kinetic energy of ejected electron: {KE:.3e} J  ({KE/1.602_176_634e-19:.3g} eV)"
 
         def compute():
             lam_txt = lam_val.get().strip()
@@ -1640,52 +2374,34 @@ class ChemGUI(tk.Tk):
 
             eJ_entered = None
             lam_m_entered = None
-            steps = ""
+            steps = []  # text pieces, joined once at the end
 
             # Parse inputs and log
             try:
                 if e_txt:
-                    raw_E = float(e_txt.replace(",", "."))
-                    if e_unit.get() == "eV":
-                        steps += (
-                            "[Input E]\n"
-                            f"  E_entered = {raw_E:g} eV\n"
-                            f"  Convert eV → J: E_J = E_eV × e = {raw_E:g} × {q_e:.6e} = {raw_E*q_e:.6e} J\n"
-                        )
-                        eJ_entered = raw_E * q_e
-                    else:
-                        steps += f"[Input E]\n  E_entered = {raw_E:g} J\n"
-                        eJ_entered = raw_E
+                    raw_E = _parse_float(e_txt)
+                    u = e_unit.get()
+                    factor, conv = _E_UNITS[u]
+                    eJ_entered = raw_E * factor
+                    steps.append(f"[Input E]\n  E_entered = {raw_E:g} {u}\n"
+                                 + conv.format(raw=raw_E, f=factor, val=eJ_entered))
                     if eJ_entered <= 0:
                         raise ValueError
 
                 if lam_txt:
-                    raw_lam = float(lam_txt.replace(",", "."))
+                    raw_lam = _parse_float(lam_txt)
                     u = lam_unit.get()
-                    if u == "nm":
-                        lam_m_entered = raw_lam * 1e-9
-                        steps += (
-                            "[Input λ]\n"
-                            f"  λ_entered = {raw_lam:g} nm\n"
-                            f"  Convert nm → m: λ_m = {raw_lam:g} × 1e-9 = {lam_m_entered:.6e} m\n"
-                        )
-                    elif u == "Å":
-                        lam_m_entered = raw_lam * 1e-10
-                        steps += (
-                            "[Input λ]\n"
-                            f"  λ_entered = {raw_lam:g} Å\n"
-                            f"  Convert Å → m: λ_m = {raw_lam:g} × 1e-10 = {lam_m_entered:.6e} m\n"
-                        )
-                    else:
-                        lam_m_entered = raw_lam
-                        steps += f"[Input λ]\n  λ_entered = {raw_lam:g} m\n"
+                    factor, conv = _LAM_UNITS[u]
+                    lam_m_entered = raw_lam * factor
+                    steps.append(f"[Input λ]\n  λ_entered = {raw_lam:g} {u}\n"
+                                 + conv.format(raw=raw_lam, val=lam_m_entered))
                     if lam_m_entered <= 0:
                         raise ValueError
             except ValueError:
                 messagebox.showerror("Invalid", "Enter positive numeric values for E or λ.", parent=win)
                 return
 
-            steps += (
+            steps.append(
                 "\n[Constants]\n"
                 f"  h = {h:.8e} J·s\n"
                 f"  c = {c:.6e} m/s\n"
@@ -1695,7 +2411,7 @@ class ChemGUI(tk.Tk):
             if lam_m_entered is not None:
                 lam_m = lam_m_entered
                 eJ = h * c / lam_m
-                steps += (
+                steps.append(
                     "\n[Compute E from λ]\n"
                     f"  E = h·c / λ = ({h:.8e} × {c:.6e}) / {lam_m:.6e} = {eJ:.6e} J\n"
                     f"  E_eV = E / e = {eJ:.6e} / {q_e:.6e} = {eJ/q_e:.6g} eV\n"
@@ -1703,7 +2419,7 @@ class ChemGUI(tk.Tk):
                 if eJ_entered is not None:
                     lam_from_E = h * c / eJ_entered
                     rel_err = abs(lam_from_E - lam_m) / lam_m if lam_m else 0.0
-                    steps += (
+                    steps.append(
                         "\n[Consistency check]\n"
                         f"  λ_from_E = h·c / E_entered = ({h:.8e} × {c:.6e}) / {eJ_entered:.6e} = {lam_from_E:.6e} m\n"
                         f"  Relative mismatch = |λ_from_E − λ_entered| / λ_entered = {rel_err:.3%}\n"
@@ -1717,7 +2433,7 @@ class ChemGUI(tk.Tk):
             elif eJ_entered is not None:
                 eJ = eJ_entered
                 lam_m = h * c / eJ
-                steps += (
+                steps.append(
                     "\n[Compute λ from E]\n"
                     f"  λ = h·c / E = ({h:.8e} × {c:.6e}) / {eJ:.6e} = {lam_m:.6e} m\n"
                     f"  λ_nm = λ × 1e9 = {lam_m*1e9:.6g} nm\n"
@@ -1730,29 +2446,23 @@ class ChemGUI(tk.Tk):
             lam_nm = lam_m * 1e9
 
             # Color label
-            def nm_to_color(nm: float) -> str:
-                if nm < 380 or nm > 780: return "outside visible range"
-                if nm < 450: return "violet"
-                if nm < 495: return "blue"
-                if nm < 570: return "green"
-                if nm < 590: return "yellow"
-                if nm < 620: return "orange"
-                return "red"
-
-            color = nm_to_color(lam_nm)
-            out.set(
-                f"λ = {lam_nm:.1f} nm → {color};  "
-                f"E = {eJ/q_e:.3g} eV  ({eJ:.3e} J)"
-            )
+            color = _nm_to_color(lam_nm)
+            out_txt = f"λ = {lam_nm:.1f} nm → {color};  E = {eJ/q_e:.3g} eV  ({eJ:.3e} J)"
 
             # Photoelectric effect (optional, with steps)
-            steps = compute_ke(eJ, steps)
+            ke_txt = compute_ke(eJ, steps)
 
             # Final color note
-            steps += f"\n[Color]\n  λ_nm = {lam_nm:.3f} → {color}\n"
+            steps.append(f"\n[Color]\n  λ_nm = {lam_nm:.3f} → {color}\n")
 
-            # Push the step-by-step log to UI
-            steps_var.set(steps)
+            # All text is ready: push the UI updates back-to-back, then one idle-tasks pass
+            out.set(out_txt)
+            ke_out.set(ke_txt)
+            steps_txt.configure(state="normal")
+            steps_txt.delete("1.0", "end")
+            steps_txt.insert("1.0", "".join(steps))
+            steps_txt.configure(state="disabled")
+            win.update_idletasks()
 
             return lam_m, eJ
 
@@ -1771,7 +2481,7 @@ class ChemGUI(tk.Tk):
         # ---------- Substance selector ----------
         ttk.Label(frm, text="Substance:").grid(row=0, column=0, sticky="e")
         sub = tk.StringVar(value="water")
-        sub_box = ttk.Combobox(frm, textvariable=sub, width=28, values=sorted(self.phase_catalog.keys()))
+        sub_box = ttk.Combobox(frm, textvariable=sub, width=28, values=self._phase_catalog_sorted_keys)
         sub_box.grid(row=0, column=1, columnspan=2, sticky="w", padx=6)
         ttk.Label(frm, text="(You can type a new name and Save)").grid(row=0, column=3, sticky="w")
 
@@ -1819,6 +2529,11 @@ class ChemGUI(tk.Tk):
         ttk.Label(frm, textvariable=total, font=("Segoe UI",10,"bold")).grid(row=6, column=0, columnspan=4, sticky="w")
 
         # ----- helpers -----
+        # Constant fields by catalog key, read together by current_record_from_fields
+        const_fields = {
+            "c_solid": f_c_solid, "c_liquid": f_c_liq, "c_gas": f_c_gas,
+            "H_fus": f_H_fus, "H_vap": f_H_vap, "T_melt_C": f_Tm, "T_boil_C": f_Tb,
+        }
         def load_current():
             name = sub.get().strip()
             rec = self.phase_catalog.get(name) or DEFAULT_PHASE_CATALOG.get(name) or {}
@@ -1835,18 +2550,10 @@ class ChemGUI(tk.Tk):
                 e.delete(0,"end"); e.insert(0, str(rec.get(key, default)))
 
         def current_record_from_fields():
-            def num(e):
-                return float(e.get().strip().replace(",", "."))
-            return {
-                "formula": f_formula.get().strip(),
-                "c_solid": num(f_c_solid),
-                "c_liquid": num(f_c_liq),
-                "c_gas": num(f_c_gas),
-                "H_fus": num(f_H_fus),
-                "H_vap": num(f_H_vap),
-                "T_melt_C": num(f_Tm),
-                "T_boil_C": num(f_Tb),
-            }
+            rec = {"formula": f_formula.get().strip()}
+            for key, e in const_fields.items():
+                rec[key] = _parse_float(e.get())  # ValueError → caller's message
+            return rec
 
         def to_C(txt_val, unit_combo):
             t = float(txt_val.replace(",", "."))
@@ -1874,53 +2581,16 @@ class ChemGUI(tk.Tk):
             Hfus, Hvap    = rec["H_fus"], rec["H_vap"]
             Tm, Tb        = rec["T_melt_C"], rec["T_boil_C"]
 
-            def phase(Tc):
-                return "solid" if Tc < Tm else ("liquid" if Tc < Tb else "gas")
-
-            Q = 0.0
-            T = Ti_C
             add_line(f"{sub.get()}  (formula: {rec.get('formula') or '—'})")
             add_line(f"m = {m_kg:.6g} kg;  path: {Ti_C:.2f} °C → {Tf_C:.2f} °C")
             add_line("Steps:")
 
-            def heat_to(target, c, label):
-                nonlocal T, Q
-                if abs(target - T) < 1e-12: return
-                dT = target - T
-                q = m_kg * c * dT
-                Q += q
-                add_line(f"  • {label}: ΔT = {dT:+.2f} K → q = {q/1000:.3f} kJ")
-                T = target
-
-            def phase_change(latent, label, sign=+1):
-                nonlocal Q
-                q = sign * m_kg * latent
-                Q += q
-                add_line(f"  • {label}: q = {q/1000:.3f} kJ")
-
-            # march upward or downward
-            direction = 1 if Tf_C >= Ti_C else -1
-            while True:
-                ph = phase(T)
-                if direction > 0:
-                    if ph == "solid":
-                        heat_to(min(Tm, Tf_C), c_s, "heat solid")
-                        if T < Tf_C: phase_change(Hfus, "melt @ T_melt")
-                    elif ph == "liquid":
-                        heat_to(min(Tb, Tf_C), c_l, "heat liquid")
-                        if T < Tf_C: phase_change(Hvap, "boil @ T_boil")
-                    else:
-                        heat_to(Tf_C, c_g, "heat gas")
+            Q, path = _phase_path(m_kg, Ti_C, Tf_C, c_s, c_l, c_g, Hfus, Hvap, Tm, Tb)
+            for label, dT, q in path:
+                if dT is None:
+                    add_line(f"  • {label}: q = {q/1000:.3f} kJ")
                 else:
-                    if ph == "gas":
-                        heat_to(max(Tb, Tf_C), c_g, "cool gas")
-                        if T > Tf_C: phase_change(Hvap, "condense @ T_boil", sign=-1)
-                    elif ph == "liquid":
-                        heat_to(max(Tm, Tf_C), c_l, "cool liquid")
-                        if T > Tf_C: phase_change(Hfus, "freeze @ T_melt", sign=-1)
-                    else:
-                        heat_to(Tf_C, c_s, "cool solid")
-                if abs(T - Tf_C) < 1e-12: break
+                    add_line(f"  • {label}: ΔT = {dT:+.2f} K → q = {q/1000:.3f} kJ")
 
             txt.configure(state="disabled")
             total.set(f"Total Q = {Q/1000:.3f} kJ  (= {Q:.3e} J)")
@@ -1938,9 +2608,12 @@ class ChemGUI(tk.Tk):
                 rec = current_record_from_fields()
             except ValueError:
                 messagebox.showerror("Bad number","Check constants fields.", parent=win); return
+            is_new = name not in self.phase_catalog
             self.phase_catalog[name] = rec
             save_phase_catalog(self.phase_catalog, self.phase_catalog_path)
-            sub_box.configure(values=sorted(self.phase_catalog.keys()))
+            if is_new:
+                bisect.insort(self._phase_catalog_sorted_keys, name)
+                sub_box.configure(values=self._phase_catalog_sorted_keys)
             messagebox.showinfo("Saved", f"Saved constants for '{name}' to phase_constants.json", parent=win)
 
         def reset_to_file():
@@ -1966,42 +2639,6 @@ class ChemGUI(tk.Tk):
         - Computes: mass/volume basis, m (molality), M (molarity, when possible), mass %,
         mole fraction (if solvent formula given), and explanatory details.
         """
-        import re
-        try:
-            from constants import ATOMIC_WEIGHTS  # your project file with atom masses
-        except Exception:
-            # Minimal fallback (extend if you don't import constants)
-            ATOMIC_WEIGHTS = {"H":1.00794,"C":12.0107,"N":14.0067,"O":15.9994,"Cl":35.453,"Na":22.98976928}
-
-        def _parse_num(s, i):
-            m = re.match(r"\d+", s[i:])
-            return (int(m.group(0)), i + len(m.group(0))) if m else (1, i)
-
-        def _parse_formula(s, i=0):
-            comp = {}
-            while i < len(s):
-                ch = s[i]
-                if ch == "(":
-                    sub, i = _parse_formula(s, i + 1)
-                    mult, i = _parse_num(s, i)
-                    for el, n in sub.items():
-                        comp[el] = comp.get(el, 0) + n * mult
-                elif ch == ")":
-                    return comp, i + 1
-                else:
-                    m = re.match(r"[A-Z][a-z]?", s[i:])
-                    if not m:
-                        break
-                    el = m.group(0)
-                    i += len(el)
-                    mult, i = _parse_num(s, i)
-                    comp[el] = comp.get(el, 0) + mult
-            return comp, i
-
-        def molar_mass(formula: str) -> float:
-            comp, _ = _parse_formula(formula.strip())
-            return sum(ATOMIC_WEIGHTS[el] * n for el, n in comp.items())
-
         win = tk.Toplevel(self); win.title("Concentration & % Converter")
         win.transient(self); win.grab_set(); win.geometry("680x520")
 
@@ -2039,25 +2676,26 @@ class ChemGUI(tk.Tk):
         def compute():
             txt.delete("1.0", "end")
             try:
-                pct = float(pct_e.get().replace(",", ".")) / 100.0
+                pct = _parse_float(pct_e.get()) / 100.0
             except ValueError:
                 messagebox.showerror("Invalid", "Enter a numeric percent.", parent=win); return
 
+            k = kind.get()
             solute = solute_e.get().strip()
             solvent = (solvent_e.get().strip() or "H2O")
             try:
-                MM_solute = molar_mass(solute)
+                MM_solute = _conc_molar_mass(solute)
             except Exception:
                 messagebox.showerror("Unknown element", f"Cannot parse formula: {solute}", parent=win); return
 
             MM_solvent = None
             try:
-                MM_solvent = molar_mass(solvent)
+                MM_solvent = _conc_molar_mass(solvent)
             except Exception:
                 pass  # fine; only needed for mole fraction
 
-            rho_soln = float(rho_soln_e.get().replace(",", ".")) if rho_soln_e.get() else None
-            rho_solute = float(rho_solute_e.get().replace(",", ".")) if rho_solute_e.get() else None
+            rho_soln = _opt_float(rho_soln_e.get())
+            rho_solute = _opt_float(rho_solute_e.get())
 
             # Canonical bases:
             mass_soln_g = None
@@ -2069,7 +2707,7 @@ class ChemGUI(tk.Tk):
             M_molarity = None
             x_solute = None
 
-            if kind.get() == "w/w":
+            if k == "w/w":
                 # 100 g solution basis
                 mass_soln_g = 100.0
                 mass_solute_g = pct * mass_soln_g
@@ -2083,7 +2721,7 @@ class ChemGUI(tk.Tk):
                     n_solvent = mass_solvent_g / MM_solvent
                     x_solute = n_solute / (n_solute + n_solvent)
 
-            elif kind.get() == "w/v":
+            elif k == "w/v":
                 # By definition: (% g per 100 mL solution)
                 vol_soln_mL = 100.0
                 mass_solute_g = pct * 100.0
@@ -2115,34 +2753,13 @@ class ChemGUI(tk.Tk):
                                 x_solute = n_solute / (n_solute + n_solvent)
 
             # --- Output -----------------------------------------------------------
-            lines = []
-            if mass_soln_g is not None:
-                lines.append(f"Basis: solution mass = {mass_soln_g:.3g} g")
-            if vol_soln_mL is not None:
-                lines.append(f"Basis: solution volume = {vol_soln_mL:.3g} mL")
-            if mass_solute_g is not None:
-                lines.append(f"Solute mass = {mass_solute_g:.3g} g  (Mᵣ={MM_solute:.3f} g/mol)")
-
-            if m_molality is not None:
-                lines.append(f"Molality m = {m_molality:.4g} mol/kg")
-            else:
-                lines.append("Molality m = (needs mass of solvent ⇒ either w/w, or w/v with ρ_solution, or v/v with both densities)")
-
-            if M_molarity is not None:
-                lines.append(f"Molarity M = {M_molarity:.4g} mol/L")
-            else:
-                lines.append("Molarity M = (needs solution volume ⇒ w/v, or w/w with ρ_solution, or v/v plus densities)")
-
-            # Mass percent is always whatever you entered, but re-state clearly:
-            if kind.get() == "w/w":
-                lines.append(f"Mass percent (w/w) = {pct*100:.4g}%")
-            elif kind.get() == "w/v":
-                lines.append(f"Mass/volume percent (w/v) = {pct*100:.4g}%  (={pct*100:.4g} g per 100 mL)")
-            else:
-                lines.append(f"Volume percent (v/v) = {pct*100:.4g}%  ({pct*100:.4g} mL per 100 mL)")
-
-            if x_solute is not None:
-                lines.append(f"Mole fraction x_solute = {x_solute:.4f}  (solvent={solvent})")
+            vals = {"mass_soln": mass_soln_g, "vol_soln": vol_soln_mL, "mass_solute": mass_solute_g,
+                    "Mr": MM_solute, "m": m_molality, "M": M_molarity, "x": x_solute, "solvent": solvent,
+                    # Mass percent is always whatever you entered, but re-state clearly:
+                    "pct_line": _CONC_PCT_LINE[k].format(p=pct*100)}
+            lines = [tpl.format_map(vals) if vals[key] is not None else missing
+                     for key, tpl, missing in _CONC_RESULT_LINES
+                     if vals[key] is not None or missing is not None]
 
             out.set("Computed:")
             txt.insert("end", "\n".join(lines) + "\n")
@@ -2168,9 +2785,9 @@ class ChemGUI(tk.Tk):
 
         def compute():
             try:
-                p  = float(p_e.get().replace(",", ".")) if p_e.get() else None
-                x  = float(x_e.get().replace(",", ".")) if x_e.get() else None
-                kH = float(k_e.get().replace(",", ".")) if k_e.get() else None
+                p  = _opt_float(p_e.get())
+                x  = _opt_float(x_e.get())
+                kH = _opt_float(k_e.get())
             except ValueError:
                 messagebox.showerror("Invalid","Numbers only.", parent=win); return
 
@@ -2185,7 +2802,7 @@ class ChemGUI(tk.Tk):
                     if p is None and kH is not None and x is not None:
                         # allow quick convert: if x given, approximate c ≈ x·(n/V) via ideal gas? keep simple: require c or p
                         pass
-                c = float(x_e.get().replace(",", ".")) if (mode.get()=="cp" and x_e.get()) else None  # repurpose x_e as c field
+                c = x  # repurpose x_e as c field
                 # if user put c in that box:
                 if c is None and p is not None and kH is not None: c = kH * p
                 elif p is None and c is not None and kH is not None: p = c / kH
@@ -2212,10 +2829,10 @@ class ChemGUI(tk.Tk):
         def compute():
             txt.delete("1.0","end")
             try:
-                x_A = float(xA.get().replace(",", ".")) if xA.get() else None
-                x_B = float(xB.get().replace(",", ".")) if xB.get() else None
-                P_A = float(PsA.get().replace(",", "."))
-                P_B = float(PsB.get().replace(",", "."))
+                x_A = _opt_float(xA.get())
+                x_B = _opt_float(xB.get())
+                P_A = _parse_float(PsA.get())
+                P_B = _parse_float(PsB.get())
             except ValueError:
                 messagebox.showerror("Invalid","Enter numeric values.", parent=win); return
             if x_A is None and x_B is None: messagebox.showerror("Need a composition","Provide x_A or x_B.", parent=win); return
@@ -2234,17 +2851,6 @@ class ChemGUI(tk.Tk):
         win = tk.Toplevel(self); win.title("Ion Concentrations & van ’t Hoff"); win.transient(self); win.grab_set(); win.geometry("720x520")
         frm = ttk.Frame(win, padding=12); frm.pack(fill=tk.BOTH, expand=True)
 
-        # minimal dissociation dictionary
-        DISS = {
-            "NaCl": {"Na+":1, "Cl-":1},
-            "KNO3":{"K+":1, "NO3-":1},
-            "K2SO4":{"K+":2, "SO4^2-":1},
-            "CaCl2":{"Ca^2+":1, "Cl-":2},
-            "Al2(SO4)3":{"Al^3+":2, "SO4^2-":3},
-            "K3PO4":{"K+":3, "PO4^3-":1},
-            "MgCl2":{"Mg^2+":1, "Cl-":2},
-        }
-
         ttk.Label(frm, text="Solute formula:").grid(row=0,column=0,sticky="e"); fE=ttk.Entry(frm,width=18); fE.grid(row=0,column=1,sticky="w"); fE.insert(0,"K2SO4")
         ttk.Label(frm, text="Formal molarity M:").grid(row=1,column=0,sticky="e"); ME=ttk.Entry(frm,width=10); ME.grid(row=1,column=1,sticky="w"); ME.insert(0,"0.15")
         ttk.Label(frm, text="van ’t Hoff factor i (optional):").grid(row=2,column=0,sticky="e"); iE=ttk.Entry(frm,width=10); iE.grid(row=2,column=1,sticky="w")
@@ -2254,87 +2860,41 @@ class ChemGUI(tk.Tk):
         def compute():
             txt.delete("1.0","end")
             formula = fE.get().strip()
-            try: M = float(ME.get().replace(",", ".")); 
+            try: M = _parse_float(ME.get()); 
             except ValueError: messagebox.showerror("Invalid","Give a numeric molarity.", parent=win); return
-            st = DISS.get(formula)
-            if not st:
+            meta = _DISS_META.get(formula)
+            if not meta:
                 txt.insert("end","Not in internal dissociation map. Add it there if you use it often.\n"); return
-            ideal_i = sum(st.values())
-            concs = {ion: coeff*M for ion,coeff in st.items()}
-            total_ideal = sum(concs.values())
+            ions, ideal_i = meta
+            concs = [(ion, coeff*M) for ion, coeff in ions]
+            total_ideal = ideal_i * M
             out.set(f"Ideal i = {ideal_i} ;  total ideal ion conc = {total_ideal:.3g} mol/L")
-            txt.insert("end","Per-ion concentrations (ideal):\n")
-            for ion, c in concs.items():
-                txt.insert("end", f"  [{ion}] = {c:.4g} M\n")
-            if iE.get():
-                try: iobs = float(iE.get().replace(",", ".")); 
+            parts = ["Per-ion concentrations (ideal):\n"]
+            parts.extend(f"  [{ion}] = {c:.4g} M\n" for ion, c in concs)
+            i_txt = iE.get()
+            if i_txt:
+                try: iobs = _parse_float(i_txt); 
                 except ValueError: iobs = None
                 if iobs:
                     total_obs = iobs * M
-                    txt.insert("end", f"\nWith observed i = {iobs}: total ion conc = {total_obs:.4g} M\n")
+                    parts.append(f"\nWith observed i = {iobs}: total ion conc = {total_obs:.4g} M\n")
+            txt.insert("end", "".join(parts))
             return
         
         self._add_compute_bar(win, compute)
 
 
     def _open_colligative_tool(self):
-        import tkinter as tk
-        from tkinter import ttk, messagebox
-        from molar_masses import molar_mass, name_to_formula  # you already import these above
-
         win = tk.Toplevel(self)
         win.title("Colligative Properties (ΔTb, ΔTf)")
         win.transient(self); win.grab_set(); win.geometry("780x700")
 
         frm = ttk.Frame(win, padding=12); frm.pack(fill=tk.BOTH, expand=True)
 
-        # ---- Solvent presets (auto-fill Kb/Kf and pure Tb/Tf) -------------------
-        KBKF = {
-            # Aqueous standard
-            "water (H2O)":            {"Kb": 0.512, "Kf": 1.86, "Tb_C": 100.0,  "Tf_C": 0.0},
-
-            # Aromatics
-            "benzene (C6H6)":         {"Kb": 2.53,  "Kf": 5.12, "Tb_C": 80.1,   "Tf_C": 5.5},
-            "toluene (C7H8)":         {"Kb": 3.40,  "Kf": 7.60, "Tb_C": 110.6,  "Tf_C": -95.0},
-            "nitrobenzene (C6H5NO2)": {"Kb": 5.57,  "Kf": 7.00, "Tb_C": 210.9,  "Tf_C": 5.7},
-
-            # Alcohols / glycols
-            "ethanol (C2H5OH)":       {"Kb": 1.22,  "Kf": 1.99, "Tb_C": 78.37,  "Tf_C": -114.1},
-            "methanol (CH3OH)":       {"Kb": 0.78,  "Kf": 1.90, "Tb_C": 64.7,   "Tf_C": -97.6},
-            "ethylene glycol (C2H6O2)":{"Kb": 2.56, "Kf": 3.90, "Tb_C": 197.3,  "Tf_C": -12.9},  # Kf commonly tabulated ~3.9
-            "glycerol (C3H8O3)":      {"Kb": 3.73,  "Kf": 5.10, "Tb_C": 290.0,  "Tf_C": 18.2},
-
-            # Halogenated solvents
-            "chloroform (CHCl3)":     {"Kb": 3.63,  "Kf": 4.68, "Tb_C": 61.2,   "Tf_C": -63.5},
-
-
-            "carbon tetrachloride (CCl4)":{"Kb": 5.03,"Kf": 29.8,"Tb_C": 76.7,  "Tf_C": -22.9},
-            "dichloromethane (CH2Cl2)":{"Kb": 3.38, "Kf": 4.90, "Tb_C": 39.6,   "Tf_C": -95.0},
-
-            # Ketones / esters / nitriles / amides
-            "acetone (C3H6O)":        {"Kb": 1.71,  "Kf": 2.39, "Tb_C": 56.1,   "Tf_C": -94.7},
-            "ethyl acetate (C4H8O2)": {"Kb": 2.77,  "Kf": 4.50, "Tb_C": 77.1,   "Tf_C": -83.6},
-            "acetonitrile (C2H3N)":   {"Kb": 0.74,  "Kf": 3.90, "Tb_C": 81.6,   "Tf_C": -45.7},
-            "DMF (C3H7NO)":           {"Kb": 2.37,  "Kf": 3.70, "Tb_C": 153.0,  "Tf_C": -60.0},
-            "DMSO (C2H6OS)":          {"Kb": 2.85,  "Kf": 4.20, "Tb_C": 189.0,  "Tf_C": 18.5},
-
-            # Ethers / cycloalkanes
-            "diethyl ether (C4H10O)": {"Kb": 2.02,  "Kf": 1.79, "Tb_C": 34.6,   "Tf_C": -116.3},
-            "cyclohexane (C6H12)":    {"Kb": 2.79,  "Kf": 20.0, "Tb_C": 80.7,   "Tf_C": 6.5},
-
-            # Carboxylic acids / others
-            "acetic acid (CH3COOH)":  {"Kb": 2.93,  "Kf": 3.90, "Tb_C": 118.1,  "Tf_C": 16.6},
-
-            # Solids used for cryoscopy (very large Kf; Tb often irrelevant)
-            "camphor (C10H16O)":      {"Kb": None,  "Kf": 40.0, "Tb_C": 204.0,  "Tf_C": 179.8},  # classic cryoscopic solvent
-            "naphthalene (C10H8)":    {"Kb": None,  "Kf": 6.9,  "Tb_C": 218.0,  "Tf_C": 80.2},
-        }
-
-
         ttk.Label(frm, text="Solvent preset:").grid(row=0, column=0, sticky="e")
         solvent = tk.StringVar(value="water (H2O)")
         solvent_box = ttk.Combobox(frm, width=28, state="readonly",
-                                values=sorted(KBKF.keys()), textvariable=solvent)
+                                values=_KBKF_SORTED_NAMES, textvariable=solvent)
         solvent_box.grid(row=0, column=1, sticky="w", padx=(6,12))
 
         # ---- Main inputs --------------------------------------------------------
@@ -2352,81 +2912,6 @@ class ChemGUI(tk.Tk):
         choose_i_btn = ttk.Button(frm, text="Choose… (Ctrl+L)")
         choose_i_btn.grid(row=2, column=3, sticky="w", padx=(6,0))
 
-        SOLUTE_I_PRESETS = [
-            # --- Non-electrolytes (i ≈ 1) ------------------------------------------
-            ("Glucose (non-electrolyte)", "C6H12O6", 1.0, "no dissociation; i≈1"),
-            ("Sucrose (non-electrolyte)", "C12H22O11", 1.0, "no dissociation; i≈1"),
-            ("Fructose (non-electrolyte)", "C6H12O6", 1.0, "no dissociation; i≈1"),
-            ("Urea (non-electrolyte)", "CH4N2O", 1.0, "no dissociation; i≈1"),
-            ("Ethanol (non-electrolyte)", "C2H5OH", 1.0, "no dissociation; i≈1"),
-            ("Methanol (non-electrolyte)", "CH3OH", 1.0, "no dissociation; i≈1"),
-            ("Glycerol (non-electrolyte)", "C3H8O3", 1.0, "no dissociation; i≈1"),
-            ("Ethylene glycol (non-electrolyte)", "C2H6O2", 1.0, "no dissociation; i≈1"),
-            ("Propylene glycol (non-electrolyte)", "C3H8O2", 1.0, "no dissociation; i≈1"),
-
-            # --- Strong acids/bases (nominally i≈2; activity < 2 in practice) -------
-            ("HCl (strong acid)",  "HCl",   2.0, ""),
-            ("HBr (strong acid)",  "HBr",   2.0, ""),
-            ("HI (strong acid)",   "HI",    2.0, ""),
-            ("HNO3 (strong acid)", "HNO3",  2.0, ""),
-            ("HClO4 (strong acid)","HClO4", 2.0, ""),
-            ("NaOH (strong base)", "NaOH",  2.0, ""),
-            ("KOH (strong base)",  "KOH",   2.0, ""),
-            ("LiOH (strong base)", "LiOH",  2.0, ""),
-
-            # --- Weak acids/bases (i a little > 1; depends on α) --------------------
-            ("HF (weak acid)",        "HF",      1.0, "i slightly >1; strongly solvent-dependent"),
-            ("CH3COOH (acetic acid)", "CH3COOH", 1.0, "i slightly >1; depends on dissociation"),
-            ("H2CO3 (carbonic acid)", "H2CO3",   1.0, "polyprotic weak acid; i>1 but small in dilute soln"),
-            ("H3PO4 (phosphoric acid)","H3PO4",  1.0, "triprotic weak; i between 1 and 4 depending on pH"),
-            ("NH3(aq) (weak base)",   "NH3",     1.0, "forms NH4+ + OH−; i>1 but small in dilute soln"),
-            ("NH4OH (aq ammonia)",    "NH4OH",   1.0, "convenience formula; weak base"),
-
-            # --- 1:1 salts (→ 2 ions; i≈2) ------------------------------------------
-            ("NaCl", "NaCl", 2.0, ""), ("KCl", "KCl", 2.0, ""), ("LiCl", "LiCl", 2.0, ""),
-            ("NaBr", "NaBr", 2.0, ""), ("KBr", "KBr", 2.0, ""), ("NaI", "NaI", 2.0, ""), ("KI", "KI", 2.0, ""),
-            ("NaF",  "NaF",  2.0, ""), ("KF",  "KF",  2.0, ""),
-            ("NaNO3","NaNO3",2.0, ""), ("KNO3","KNO3",2.0, ""), ("NH4NO3","NH4NO3",2.0, ""),
-            ("NaClO4","NaClO4",2.0,""), ("KClO4","KClO4",2.0,""),
-            ("NaOAc (sodium acetate)","CH3COONa", 2.0, "salt of weak acid; still dissociates to 2 ions"),
-            ("NH4Cl", "NH4Cl", 2.0, ""), ("NaHCO3","NaHCO3",2.0,""), ("NaHSO3","NaHSO3",2.0,""),
-
-            # --- 2:1 or 1:2 salts (→ 3 ions; i≈3) -----------------------------------
-            ("MgCl2", "MgCl2", 3.0, ""), ("CaCl2", "CaCl2", 3.0, ""), ("SrCl2", "SrCl2", 3.0, ""), ("BaCl2","BaCl2",3.0,""),
-            ("ZnCl2","ZnCl2",3.0,""), ("FeCl2","FeCl2",3.0,""), ("CuCl2","CuCl2",3.0,""), ("Pb(NO3)2","Pb(NO3)2",3.0,""),
-            ("Na2SO4","Na2SO4",3.0,""), ("K2SO4","K2SO4",3.0,""), ("(NH4)2SO4","(NH4)2SO4",3.0,""),
-            ("Na2CO3","Na2CO3",3.0,""), ("K2CO3","K2CO3",3.0,""), ("(NH4)2CO3","(NH4)2CO3",3.0,""),
-            ("Ca(NO3)2","Ca(NO3)2",3.0,""), ("Mg(NO3)2","Mg(NO3)2",3.0,""), ("Ba(NO3)2","Ba(NO3)2",3.0,""),
-            ("Ba(OH)2","Ba(OH)2",3.0,"strong base; limited solubility"),
-            ("Ca(OH)2","Ca(OH)2",3.0,"strong base; limited solubility"),
-
-            # --- 3:1 or 1:3 salts (→ 4 ions; i≈4) -----------------------------------
-            ("AlCl3","AlCl3",4.0,"hydrolyzes somewhat in water (real i < 4)"),
-            ("FeCl3","FeCl3",4.0,"hydrolysis lowers effective i"),
-            ("CrCl3","CrCl3",4.0,""),
-            ("Al(NO3)3","Al(NO3)3",4.0,""),
-            ("Fe(NO3)3","Fe(NO3)3",4.0,""),
-            ("Na3PO4","Na3PO4",4.0,"basic solution; phosphate equilibria in real systems"),
-
-            # --- 3:2 salts (→ 5 ions; i≈5) ------------------------------------------
-            ("Al2(SO4)3","Al2(SO4)3",5.0,""),
-            ("Fe2(SO4)3","Fe2(SO4)3",5.0,""),
-            ("Cr2(SO4)3","Cr2(SO4)3",5.0,""),
-
-            # --- Complex ion salts (fully dissociate to counterions + complex) -------
-            ("K3[Fe(CN)6]","K3Fe(CN)6",4.0,"3 K+ + [Fe(CN)6]3− → 4 particles"),
-            ("K4[Fe(CN)6]","K4Fe(CN)6",5.0,"4 K+ + [Fe(CN)6]4− → 5 particles"),
-
-            # --- Polyprotic strong (upper bounds) ------------------------------------
-            ("H2SO4 (upper-bound ideal)","H2SO4",3.0,"dilute realistic 2<i<3 (2nd dissociation incomplete)"),
-
-            # --- “Real world” caveats ------------------------------------------------
-            ("CuSO4 (association/hydration)","CuSO4",2.0,"hydrates; ion pairing can lower i"),
-            ("AgNO3 (complexation in some media)","AgNO3",2.0,"can form complexes; i<2 in some conditions"),
-            ("CaSO4 (very low solubility)","CaSO4",2.0,"sparingly soluble; colligative effects negligible"),
-        ]
-
-
         # ---- Kb/Kf and pure Tb/Tf fields ----------------------------------------
         ttk.Label(frm, text="K_b (K·kg/mol):").grid(row=4, column=0, sticky="e")
         KbE = ttk.Entry(frm, width=12); KbE.grid(row=4, column=1, sticky="w")
@@ -2466,44 +2951,49 @@ class ChemGUI(tk.Tk):
             if not txt:
                 mm_info.set(""); return
             try:
-                f = name_to_formula(txt)
-                Mr = molar_mass(f)
+                f = _name_to_formula_cached(txt)
+                Mr = _molar_mass_cached(f)
                 MrE.delete(0, "end"); MrE.insert(0, f"{Mr:g}")
                 mm_info.set(f"Formula: {f} — Mr = {Mr:g} g/mol")
             except Exception:
                 mm_info.set("Unrecognized name/formula. Enter Mr manually.")
 
-        solute_txt.bind("<KeyRelease>", refresh_Mr_from_solute)
+        # Debounce typing: only the last keystroke in a burst triggers the lookup.
+        solute_txt.bind("<KeyRelease>", lambda e: _debounce(solute_txt, "Mr", refresh_Mr_from_solute, 150))
 
         def compute_molality():
+            # Read every field once up front, then work with plain strings
+            mr_s, ms_s, msolv_s, vsolv_s, rho_s = MrE.get(), msE.get(), msolvE.get(), vsolvE.get(), rhoE.get()
+
             # Mr from auto or manual
             Mr = None
-            if MrE.get():
-                try: Mr = float(MrE.get().replace(",", "."))
+            if mr_s:
+                try: Mr = _parse_float(mr_s)
                 except ValueError:
                     messagebox.showerror("Invalid Mr", "Enter a numeric molar mass.", parent=win); return
             else:
                 refresh_Mr_from_solute()
-                if MrE.get():
-                    Mr = float(MrE.get().replace(",", "."))
+                mr_s = MrE.get()
+                if mr_s:
+                    Mr = _parse_float(mr_s)
             if Mr is None:
                 messagebox.showerror("Need molar mass", "Type a formula/name I can parse or Mr (g/mol).", parent=win); return
 
             try:
-                ms = float(msE.get().replace(",", "."))  # g
+                ms = _parse_float(ms_s)  # g
             except ValueError:
                 messagebox.showerror("Invalid mass", "Enter solute mass (g).", parent=win); return
 
             # solvent mass
-            if msolvE.get():
+            if msolv_s:
                 try:
-                    msolv_g = float(msolvE.get().replace(",", "."))
+                    msolv_g = _parse_float(msolv_s)
                 except ValueError:
                     messagebox.showerror("Invalid solvent mass", "Enter solvent mass (g).", parent=win); return
-            elif vsolvE.get():
+            elif vsolv_s:
                 try:
-                    V = float(vsolvE.get().replace(",", "."))
-                    rho = float(rhoE.get().replace(",", "."))
+                    V = _parse_float(vsolv_s)
+                    rho = _parse_float(rho_s)
                     msolv_g = V * rho
                 except ValueError:
                     messagebox.showerror("Invalid volume/density", "Enter numeric volume and density.", parent=win); return
@@ -2521,20 +3011,14 @@ class ChemGUI(tk.Tk):
         ttk.Button(box, text="Compute m →", command=compute_molality).grid(row=4, column=0, columnspan=4, sticky="w", pady=(6,0))
 
         # ---- Prefill from Known Variables (if saved earlier) --------------------
-        if not KbE.get():
-            for key in ("Kb","K_b","K_boil"):
-                if key in self.known_ui:
-                    try: KbE.insert(0, f"{float(self.known_ui[key]['display_value']):g}"); break
-                    except: pass
-        if not KfE.get():
-            for key in ("Kf","K_f","K_freeze"):
-                if key in self.known_ui:
-                    try: KfE.insert(0, f"{float(self.known_ui[key]['display_value']):g}"); break
-                    except: pass
+        for entry, keys in ((KbE, _KB_KEYS), (KfE, _KF_KEYS)):
+            val = _known_float(self.known_ui, keys)
+            if val is not None and not entry.get():
+                entry.insert(0, f"{val:g}")
 
         # ---- Fill solvent fields (Kb/Kf/Tb/Tf) ----------------------------------
         def _fill_from_solvent(force=False, *_):
-            d = KBKF.get(solvent.get())
+            d = _KBKF.get(solvent.get())
             if not d: return
             def put(entry, value):
                 if force or not entry.get():
@@ -2564,21 +3048,22 @@ class ChemGUI(tk.Tk):
             info = tk.StringVar(value="Double-click or press Enter to choose. Esc to cancel.")
             ttk.Label(pop, textvariable=info, foreground="#555").pack(anchor="w", padx=10, pady=6)
 
-            state = {"rows": SOLUTE_I_PRESETS[:]}
+            state = {"rows": _SOLUTE_I_PRESETS[:], "shown": []}
 
             def refresh(_=None):
                 needle = q.get().strip().lower()
-                rows = [r for r in SOLUTE_I_PRESETS
-                        if needle in r[0].lower() or needle in r[1].lower()]
+                if needle:
+                    rows = [r for name_lc, formula_lc, r in _SOLUTE_I_SEARCH
+                            if needle in name_lc or needle in formula_lc]
+                else:
+                    rows = _SOLUTE_I_PRESETS
                 state["rows"] = rows
-                lst.delete(0, tk.END)
-                for name, formula, i_val, note in rows:
-                    tail = f" — {note}" if note else ""
-                    lst.insert(tk.END, f"{name}  [{formula}]  →  i={i_val:g}{tail}")
+                state["shown"] = _listbox_sync(lst, state["shown"], [_SOLUTE_I_LABEL[r] for r in rows])
                 if rows:
                     lst.selection_clear(0, tk.END); lst.selection_set(0); lst.activate(0)
 
             def use_selected(_=None):
+                _debounce_flush(q, "filter")
                 if not state["rows"]: return
                 sel = lst.curselection()
                 if not sel: return
@@ -2592,7 +3077,7 @@ class ChemGUI(tk.Tk):
 
             def cancel(_=None): pop.destroy()
 
-            q.bind("<KeyRelease>", refresh)
+            q.bind("<KeyRelease>", lambda e: _debounce(q, "filter", refresh))
             lst.bind("<Double-Button-1>", use_selected)
             lst.bind("<Return>", use_selected)
             pop.bind("<Return>", use_selected)
@@ -2616,15 +3101,15 @@ class ChemGUI(tk.Tk):
         def compute():
             expl.configure(state="normal"); expl.delete("1.0", "end")
             try:
-                m  = float(mE.get().replace(",", "."))
-                i  = float(iE.get().replace(",", "."))
-                Kb = float(KbE.get().replace(",", ".")) if KbE.get() else 0.0
-                Kf = float(KfE.get().replace(",", ".")) if KfE.get() else 0.0
+                m  = _parse_float(mE.get())
+                i  = _parse_float(iE.get())
+                Kb = _opt_float(KbE.get(), 0.0)
+                Kf = _opt_float(KfE.get(), 0.0)
             except ValueError:
                 messagebox.showerror("Invalid", "Numbers only in m, i, Kb, Kf.", parent=win); return
 
-            Tb0 = float(Tb0E.get().replace(",", ".")) if Tb0E.get() else None
-            Tf0 = float(Tf0E.get().replace(",", ".")) if Tf0E.get() else None
+            Tb0 = _opt_float(Tb0E.get())
+            Tf0 = _opt_float(Tf0E.get())
 
             dTb = i*Kb*m if Kb>0 else None
             dTf = i*Kf*m if Kf>0 else None
@@ -2663,10 +3148,6 @@ class ChemGUI(tk.Tk):
 
 
     def _open_osmotic_tool(self):
-        import tkinter as tk
-        from tkinter import ttk, messagebox
-        from molar_masses import molar_mass, name_to_formula, suggest_substances
-
         win = tk.Toplevel(self)
         win.title("Osmotic Pressure — π = i·M·R·T")
         win.transient(self); win.grab_set(); win.geometry("760x560")
@@ -2682,7 +3163,7 @@ class ChemGUI(tk.Tk):
 
         ttk.Label(frm, text="Temperature T:").grid(row=1, column=0, sticky="e", pady=(4,0))
         TE = ttk.Entry(frm, width=12); TE.grid(row=1, column=1, sticky="w", padx=(6,6), pady=(4,0)); TE.insert(0, "298.15")
-        Tunit = ttk.Combobox(frm, width=6, state="readonly", values=["K","°C"])
+        Tunit = ttk.Combobox(frm, width=6, state="readonly", values=_TEMP_UNITS)
         Tunit.grid(row=1, column=2, sticky="w", pady=(4,0)); Tunit.set("K")
 
         # ---------------- Quick M calculator (optional) ----------------
@@ -2703,11 +3184,11 @@ class ChemGUI(tk.Tk):
         # mass, volume
         ttk.Label(box, text="Solute mass:").grid(row=3, column=0, sticky="e")
         massE = ttk.Entry(box, width=10); massE.grid(row=3, column=1, sticky="w", padx=6); massE.insert(0, "15")
-        massU = ttk.Combobox(box, width=6, state="readonly", values=["g","mg","kg"]); massU.grid(row=3, column=2, sticky="w"); massU.set("g")
+        massU = ttk.Combobox(box, width=6, state="readonly", values=_MASS_UNITS); massU.grid(row=3, column=2, sticky="w"); massU.set("g")
 
         ttk.Label(box, text="Solution volume:").grid(row=3, column=3, sticky="e")
         volE = ttk.Entry(box, width=10); volE.grid(row=3, column=4, sticky="w", padx=6); volE.insert(0, "100")
-        volU = ttk.Combobox(box, width=6, state="readonly", values=["mL","L"]); volU.grid(row=3, column=5, sticky="w"); volU.set("mL")
+        volU = ttk.Combobox(box, width=6, state="readonly", values=_VOL_UNITS); volU.grid(row=3, column=5, sticky="w"); volU.set("mL")
 
         # preview
         p_formula = tk.StringVar(value="")
@@ -2715,10 +3196,17 @@ class ChemGUI(tk.Tk):
         ttk.Label(box, textvariable=p_formula, font=("Segoe UI", 9, "bold")).grid(row=4, column=0, columnspan=6, sticky="w", pady=(4,0))
         ttk.Label(box, textvariable=p_mm, foreground="#444").grid(row=5, column=0, columnspan=6, sticky="w")
 
+        sugg_state = {"q": None}
+
         def _refresh_suggestions(_=None):
-            items = suggest_substances(f_entry.get(), limit=60)
+            query = f_entry.get()
+            if query == sugg_state["q"]:
+                return  # arrows/modifiers: text unchanged, list is already current
+            sugg_state["q"] = query
+            # one letter matches most of the catalogue; wait for a second character
+            items = suggest_substances(query, limit=60) if len(query.strip()) >= 2 else []
             sugg.delete(0, tk.END)
-            for label, _f in items: sugg.insert(tk.END, label)
+            sugg.insert(tk.END, *[label for label, _f in items])
             if items:
                 sugg.configure(height=min(8, len(items))); sugg.grid(); scx.grid()
             else:
@@ -2733,56 +3221,44 @@ class ChemGUI(tk.Tk):
             sugg.grid_remove(); scx.grid_remove()
             _update_preview()
 
+        preview_state = {"txt": None}
+
         def _update_preview():
-            f = name_to_formula(f_entry.get().strip())
+            t = f_entry.get().strip()
+            if t == preview_state["txt"]:
+                return
+            preview_state["txt"] = t
+            f = _name_to_formula_cached(t)
             p_formula.set(f"Formula: {f}")
-            try:
-                mm = molar_mass(f)
+            mm = _molar_mass_or_none(f)
+            if mm is not None:
                 p_mm.set(f"Molar mass = {mm:g} g/mol")
-            except Exception:
+            else:
                 p_mm.set("Molar mass = (unknown)")
 
-        f_entry.bind("<KeyRelease>", _refresh_suggestions)
+        f_entry.bind("<KeyRelease>", lambda e: _debounce(f_entry, "suggest", _refresh_suggestions))
         f_entry.bind("<Down>", lambda e: (sugg.focus_set(), sugg.selection_clear(0, tk.END), sugg.selection_set(0), sugg.activate(0)) if sugg.winfo_ismapped() else None)
         sugg.bind("<Return>", _accept_suggestion)
         sugg.bind("<Double-Button-1>", _accept_suggestion)
         _update_preview()
 
-        # Dissociation map for ideal i (extend as you like)
-        DISS = {
-            "NaCl": {"Na+":1,"Cl-":1},
-            "KNO3":{"K+":1,"NO3-":1},
-            "K2SO4":{"K+":2,"SO4^2-":1},
-            "CaCl2":{"Ca^2+":1,"Cl-":2},
-            "Al2(SO4)3":{"Al^3+":2,"SO4^2-":3},
-            "MgCl2":{"Mg^2+":1,"Cl-":2},
-            "HCl": {"H+":1, "Cl-":1},
-            "H2SO4": {"H+":2, "SO4^2-":1},
-            # add more
-        }
-
         hint_i = tk.StringVar(value="Non-electrolyte → i ≈ 1 (e.g., sugars)")
         ttk.Label(box, textvariable=hint_i, foreground="#555").grid(row=6, column=0, columnspan=4, sticky="w", pady=(2,0))
 
         def compute_M():
             # mass to moles
             try:
-                mass = float(massE.get().replace(",", "."))
-                vol = float(volE.get().replace(",", "."))
+                mass = _parse_float(massE.get())
+                vol = _parse_float(volE.get())
             except ValueError:
                 messagebox.showerror("Invalid", "Mass/volume must be numbers.", parent=win); return None
 
-            # mass units
-            if massU.get() == "mg": mass_g = mass * 1e-3
-            elif massU.get() == "kg": mass_g = mass * 1e3
-            else: mass_g = mass
-
-            # volume units
-            V_L = vol / 1000.0 if volU.get()=="mL" else vol
+            mass_g = mass * _MASS_TO_G[massU.get()]
+            V_L = vol * _VOL_TO_L[volU.get()]
 
             try:
-                f = name_to_formula(f_entry.get().strip())
-                mm = molar_mass(f)  # g/mol
+                f = _name_to_formula_cached(f_entry.get().strip())
+                mm = _molar_mass_cached(f)  # g/mol
             except Exception as ex:
                 messagebox.showerror("Unknown solute", f"Can't get molar mass: {ex}", parent=win); return None
 
@@ -2794,7 +3270,7 @@ class ChemGUI(tk.Tk):
             ME.delete(0, "end"); ME.insert(0, f"{M:g}")
 
             # i helper
-            ideal = DISS.get(f, None)
+            ideal = _OSMOTIC_DISS.get(f, None)
             if ideal:
                 i_val = float(sum(ideal.values()))
                 iE.delete(0, "end"); iE.insert(0, f"{i_val:g}")
@@ -2822,39 +3298,40 @@ class ChemGUI(tk.Tk):
 
             # Parse core entries
             try:
-                M = float(ME.get().replace(",", "."))
-                i = float(iE.get().replace(",", "."))
-                T_in = float(TE.get().replace(",", "."))
+                M = _parse_float(ME.get())
+                i = _parse_float(iE.get())
+                T_in = _parse_float(TE.get())
             except ValueError:
                 messagebox.showerror("Invalid", "M, i, and T must be numeric.", parent=win); return
 
-            T_K = T_in if Tunit.get()=="K" else (T_in + 273.15)
+            T_u = Tunit.get()
+            T_K = T_in if T_u=="K" else (T_in + 273.15)
             R = float(self.known_base.get("R", 8.314462618))  # J/(mol·K)
             M_m3 = M * 1000.0                                  # mol/m^3
 
             # π in Pa
             pi = i * M_m3 * R * T_K
 
+            pi_kPa, pi_bar, pi_atm = pi / 1e3, pi / 1e5, pi / 101325
+
             # Output summary
-            out.set(f"π = {pi/101325:.5g} atm  = {pi/1e5:.5g} bar  = {pi/1e3:.5g} kPa  (= {pi:.5g} Pa)")
+            out.set(f"π = {pi_atm:.5g} atm  = {pi_bar:.5g} bar  = {pi_kPa:.5g} kPa  (= {pi:.5g} Pa)")
 
             # Steps text
-            def g(x): return f"{x:.6g}"
-            s = []
-            s.append("Given / using:\n")
-            s.append(f"  M = {g(M)} mol/L  → {g(M_m3)} mol·m⁻³\n")
-            s.append(f"  i = {g(i)}\n")
-            s.append(f"  T = {g(T_in)} {Tunit.get()}  → {g(T_K)} K\n")
-            s.append(f"  R = {g(R)} J·mol⁻¹·K⁻¹\n\n")
-            s.append("Compute π = i·M·R·T (SI):\n")
-            s.append(f"  π = {g(i)} × {g(M_m3)} × {g(R)} × {g(T_K)} = {g(pi)} Pa\n")
-            s.append(f"  = {g(pi/1e3)} kPa  = {g(pi/1e5)} bar  = {g(pi/101325)} atm\n")
-            steps.insert("1.0", "".join(s))
+            steps.insert("1.0",
+                "Given / using:\n"
+                f"  M = {M:.6g} mol/L  → {M_m3:.6g} mol·m⁻³\n"
+                f"  i = {i:.6g}\n"
+                f"  T = {T_in:.6g} {T_u}  → {T_K:.6g} K\n"
+                f"  R = {R:.6g} J·mol⁻¹·K⁻¹\n\n"
+                "Compute π = i·M·R·T (SI):\n"
+                f"  π = {i:.6g} × {M_m3:.6g} × {R:.6g} × {T_K:.6g} = {pi:.6g} Pa\n"
+                f"  = {pi_kPa:.6g} kPa  = {pi_bar:.6g} bar  = {pi_atm:.6g} atm\n")
             steps.configure(state="disabled")
 
             # Save to Known (base = Pa; UI kPa)
             self.known_base["π_osm"] = float(pi)
-            self.known_ui["π_osm"] = {"unit": "kPa", "display_value": float(pi/1e3)}
+            self.known_ui["π_osm"] = {"unit": "kPa", "display_value": float(pi_kPa)}
             self._refresh_known_table(); self._refresh_equation_list()
 
             return pi
@@ -2870,15 +3347,6 @@ class ChemGUI(tk.Tk):
 
         frm = ttk.Frame(win, padding=12); frm.pack(fill=tk.BOTH, expand=True)
 
-        # small embedded table (values are typical textbook values)
-        KBKF = {
-            "water (H2O)":        {"Kb": 0.512, "Kf": 1.86, "Tb_C": 100.0, "Tf_C": 0.0},
-            "benzene (C6H6)":     {"Kb": 2.53,  "Kf": 5.12, "Tb_C": 80.1,  "Tf_C": 5.5},
-            "ethanol (C2H5OH)":   {"Kb": 1.22,  "Kf": 1.99, "Tb_C": 78.37, "Tf_C": -114.1},
-            "chloroform (CHCl3)": {"Kb": 3.63,  "Kf": 4.68, "Tb_C": 61.2,  "Tf_C": -63.5},
-            "acetic acid (CH3COOH)": {"Kb": 2.93, "Kf": 3.90, "Tb_C": 118.1, "Tf_C": 16.6},
-        }
-
         # --- UI -----------------------------------------------------------------
         ttk.Label(frm, text="Filter:").grid(row=0, column=0, sticky="e")
         q = tk.StringVar()
@@ -2895,21 +3363,20 @@ class ChemGUI(tk.Tk):
         note.grid(row=3, column=0, columnspan=4, sticky="w")
 
         # populate list
-        names_all = sorted(KBKF.keys())
+        names_all = _KBKF_LOOKUP_NAMES
+        shown = {"names": []}
         def refresh():
             pat = q.get().strip().lower()
-            lst.delete(0, tk.END)
-            for name in names_all:
-                if pat in name.lower():
-                    lst.insert(tk.END, name)
-            if lst.size():
+            names = names_all if not pat else [name for name_lc, name in _KBKF_LOOKUP_NAMES_LC if pat in name_lc]
+            shown["names"] = _listbox_sync(lst, shown["names"], names)
+            if names:
                 lst.selection_clear(0, tk.END); lst.selection_set(0); lst.activate(0); show()
 
         def current():
             sel = lst.curselection()
             if not sel: return None, None
             name = lst.get(sel[0])
-            return name, KBKF[name]
+            return name, _KBKF_LOOKUP[name]
 
         def show(_=None):
             name, data = current()
@@ -2918,7 +3385,7 @@ class ChemGUI(tk.Tk):
             info.set(f"{name} →  Kb = {data['Kb']}  ;  Kf = {data['Kf']}   "
                     f"(Tb ≈ {data['Tb_C']} °C, Tf ≈ {data['Tf_C']} °C)")
 
-        ent.bind("<KeyRelease>", lambda e: refresh())
+        ent.bind("<KeyRelease>", lambda e: _debounce(ent, "filter", refresh))
         lst.bind("<<ListboxSelect>>", show)
         refresh()
 
@@ -2953,7 +3420,6 @@ class ChemGUI(tk.Tk):
 
 
     def _open_rate_law_tool(self):
-        import math
         win = tk.Toplevel(self)
         win.title("Rate laws — zero / first / second order")
         win.transient(self); win.grab_set(); win.geometry("860x640")
@@ -2974,19 +3440,14 @@ class ChemGUI(tk.Tk):
 
         # k value + units (units depend on order)
         ttk.Label(frm, text="Rate constant k:").grid(row=1, column=2, sticky="e")
-        k_entry = ttk.Entry(frm, width=14); k_entry.grid(row=1, column=3, sticky="w", padx=(6,6))
+        k_var = tk.StringVar(value="1.58e-3")  # handy default for first-order example
+        k_entry = ttk.Entry(frm, width=14, textvariable=k_var); k_entry.grid(row=1, column=3, sticky="w", padx=(6,6))
         k_unit = ttk.Combobox(frm, width=12, state="readonly"); k_unit.grid(row=1, column=4, sticky="w")
-        k_entry.insert(0, "1.58e-3")  # handy default for first-order example
 
         # Prefill k if user has one in Known Variables
-        for key in ("k_rate", "k", "k1"):
-            if key in self.known_ui:
-                try:
-                    k_entry.delete(0, "end")
-                    k_entry.insert(0, f"{float(self.known_ui[key]['display_value']):g}")
-                except Exception:
-                    pass
-                break
+        k_known = _known_float(self.known_ui, _K_RATE_KEYS)
+        if k_known is not None:
+            k_var.set(f"{k_known:g}")
 
         # --- Inputs block ---------------------------------------------------------
         ttk.Label(frm, text="[A]₀ (M):").grid(row=2, column=0, sticky="e")
@@ -2996,7 +3457,7 @@ class ChemGUI(tk.Tk):
         ttk.Label(frm, text="Time t:").grid(row=2, column=2, sticky="e")
         t_entry = ttk.Entry(frm, width=12); t_entry.grid(row=2, column=3, sticky="w", padx=(6,6))
         t_unit = ttk.Combobox(frm, width=8, state="readonly",
-                            values=["s", "min", "h"]); t_unit.grid(row=2, column=4, sticky="w")
+                            values=_TIME_UNITS); t_unit.grid(row=2, column=4, sticky="w")
         t_unit.set("s"); t_entry.insert(0, "180")  # example
 
         ttk.Label(frm, text="Target [A] or fraction:").grid(row=3, column=0, sticky="e")
@@ -3082,7 +3543,7 @@ class ChemGUI(tk.Tk):
 
         ttk.Label(frm, text="Half-life t₁/₂:").grid(row=5, column=0, sticky="e")
         t12_entry = ttk.Entry(frm, width=12); t12_entry.grid(row=5, column=1, sticky="w", padx=(6,12))
-        t12_unit  = ttk.Combobox(frm, width=8, state="readonly", values=["s","min","h"])
+        t12_unit  = ttk.Combobox(frm, width=8, state="readonly", values=_TIME_UNITS)
         t12_unit.grid(row=5, column=2, sticky="w"); t12_unit.set("s")
 
         # --- Optional second-point inputs (for k from two points) -----------------
@@ -3092,7 +3553,7 @@ class ChemGUI(tk.Tk):
 
         ttk.Label(box2p, text="t₁:").grid(row=0, column=0, sticky="e")
         t1_e = ttk.Entry(box2p, width=10); t1_e.grid(row=0, column=1, sticky="w", padx=(6,6))
-        t1_u = ttk.Combobox(box2p, width=6, state="readonly", values=["s","min","h"]); t1_u.grid(row=0, column=2, sticky="w"); t1_u.set("s")
+        t1_u = ttk.Combobox(box2p, width=6, state="readonly", values=_TIME_UNITS); t1_u.grid(row=0, column=2, sticky="w"); t1_u.set("s")
         ttk.Label(box2p, text="[A]₁ (M):").grid(row=0, column=3, sticky="e")
         A1_e = ttk.Entry(box2p, width=10); A1_e.grid(row=0, column=4, sticky="w", padx=(6,6))
         # A tiny top-right help button
@@ -3103,7 +3564,7 @@ class ChemGUI(tk.Tk):
 
         ttk.Label(box2p, text="t₂:").grid(row=1, column=0, sticky="e")
         t2_e = ttk.Entry(box2p, width=10); t2_e.grid(row=1, column=1, sticky="w", padx=(6,6))
-        t2_u = ttk.Combobox(box2p, width=6, state="readonly", values=["s","min","h"]); t2_u.grid(row=1, column=2, sticky="w"); t2_u.set("s")
+        t2_u = ttk.Combobox(box2p, width=6, state="readonly", values=_TIME_UNITS); t2_u.grid(row=1, column=2, sticky="w"); t2_u.set("s")
         ttk.Label(box2p, text="[A]₂ (M):").grid(row=1, column=3, sticky="e")
         A2_e = ttk.Entry(box2p, width=10); A2_e.grid(row=1, column=4, sticky="w", padx=(6,6))
 
@@ -3113,17 +3574,16 @@ class ChemGUI(tk.Tk):
 
 
 
+        shown_order = {"i": None}
+
         def _set_k_units(*_):
-            o = order_var.get()[0]  # "0", "1", or "2"
-            if o == "0":
-                k_unit.config(values=["M/s", "M/min", "M/h"]); k_unit.set("M/s")
-                eq_var.set("0th: rate = k ;  [A]t = [A]0 − k·t ;  t1/2 = [A]0/(2k)")
-            elif o == "1":
-                k_unit.config(values=["s^-1", "min^-1", "h^-1"]); k_unit.set("s^-1")
-                eq_var.set("1st: rate = k·[A] ;  [A]t = [A]0·e^(−k t) ;  t1/2 = ln2 / k")
-            else:
-                k_unit.config(values=["M^-1 s^-1", "M^-1 min^-1", "M^-1 h^-1"]); k_unit.set("M^-1 s^-1")
-                eq_var.set("2nd: rate = k·[A]^2 ;  1/[A]t = 1/[A]0 + k·t ;  t1/2 = 1/(k·[A]0)")
+            o = order_var.get()[:1]  # "0", "1", or "2"
+            i = 0 if o == "0" else (1 if o == "1" else 2)
+            if i == shown_order["i"]:
+                return   # same order re-selected: keep the chosen k unit
+            shown_order["i"] = i
+            k_unit.configure(values=_KUNITS[i]); k_unit.set(_KUNITS[i][0])
+            eq_var.set(_EQ_TEXT[i])
         order_box.bind("<<ComboboxSelected>>", _set_k_units)
         _set_k_units()
 
@@ -3142,210 +3602,195 @@ class ChemGUI(tk.Tk):
             return float(entry.get().strip().replace(",", "."))
 
         def _sec_factor(unit_str: str) -> float:
-            return {"s":1.0, "min":60.0, "h":3600.0}[unit_str]
+            return _SEC_FACTOR[unit_str]
 
         def _k_to_base(k_val: float, k_unit_txt: str) -> float:
             # Convert k to base seconds units
-            if "min" in k_unit_txt:
-                return k_val / 60.0
-            elif "h" in k_unit_txt:
-                return k_val / 3600.0
-            else:
-                return k_val
+            return k_val / _K_TIME_SCALE[k_unit_txt]
 
         # --- Compute core ----------------------------------------------------------
-        def compute():
-            explain.configure(state="normal"); explain.delete("1.0","end")
+        last = {"t12": None}   # seconds, from the most recent half-life compute
+        g = _g6   # pretty format
+
+        # One handler per task; each returns the explanation lines, or None after
+        # reporting an input error.
+        def do_at(A0, k_val, t_sec, order):
+            if k_val is None or t_sec is None:
+                messagebox.showerror("Inputs", "Need k and t for [A] at time.", parent=win); return
+            At = _integrated_conc(order, A0, k_val, t_sec)
+            if order == 0:
+                lines = [f"[0th]  [A]t = [A]0 − k t = {g(A0)} − {g(k_val)}×{g(t_sec)} = {g(At)} M"]
+            elif order == 1:
+                lines = [f"[1st]  [A]t = [A]0·e^(−k t) = {g(A0)}·e^(−{g(k_val)}×{g(t_sec)}) = {g(At)} M"]
+            else:
+                lines = [f"[2nd]  [A]t = [A]0 /(1 + k [A]0 t) = {g(A0)}/(1+{g(k_val)}×{g(A0)}×{g(t_sec)}) = {g(At)} M"]
+            rate = k_val * At**order
+            out.set(f"[A](t) = {g(At)} M    ;    rate = {g(rate)} M/s")
+            lines.append(f"rate(t) = k·[A]^n = {g(k_val)} × {g(At)}^{order} = {g(rate)} M/s")
+            return lines
+
+        def do_rate(A0, k_val, t_sec, order):
+            if k_val is None or t_sec is None:
+                messagebox.showerror("Inputs", "Need k and t to find rate.", parent=win); return
+            At = _integrated_conc(order, A0, k_val, t_sec)
+            rate = k_val * At**order
+            out.set(f"rate(t) = {g(rate)} M/s   (with [A](t) = {g(At)} M)")
+            return [f"[A](t) computed as above → rate = k·[A]^n = {g(rate)} M/s"]
+
+        def do_tpct(A0, k_val, t_sec, order):
+            if k_val is None:
+                messagebox.showerror("Inputs", "Need k for time.", parent=win); return
             try:
-                A0 = _num(A0_entry)
+                pct = _num(pct_entry) / 100.0
             except Exception:
-                messagebox.showerror("Need [A]₀", "Enter a numeric [A]₀ (M).", parent=win); return
+                messagebox.showerror("Percent", "Enter percent consumed (e.g., 75).", parent=win); return
+            if pct <= 0 or pct >= 1:
+                messagebox.showerror("Percent", "Use 0–100 (exclusive).", parent=win); return
+            At = A0 * (1.0 - pct)
+            if order == 0:
+                t_sec = (A0 - At) / k_val
+                lines = [f"[0th]  At = A0(1−f) → t = (A0−At)/k = ({g(A0)}−{g(At)})/{g(k_val)} = {g(t_sec)} s"]
+            elif order == 1:
+                t_sec = (1.0 / k_val) * math.log(A0 / At)
+                lines = [f"[1st]  t = (1/k) ln(A0/At) = (1/{g(k_val)}) ln({g(A0)}/{g(At)}) = {g(t_sec)} s"]
+            else:
+                t_sec = (1.0 / k_val) * (1.0/At - 1.0/A0)
+                lines = [f"[2nd]  t = (1/k)(1/At − 1/A0) = (1/{g(k_val)})({g(1/At)}−{g(1/A0)}) = {g(t_sec)} s"]
+            out.set(f"Time for {pct*100:.1f}% consumed:  t ≈ {g(t_sec)} s  ({g(t_sec/60)} min)")
+            return lines
 
-            # k (if present)
-            k_val = None
-            if k_entry.get().strip():
-                try:
-                    k_val = _k_to_base(_num(k_entry), k_unit.get())
-                except Exception:
-                    messagebox.showerror("Bad k", "Enter a numeric k.", parent=win); return
+        def do_tA(A0, k_val, t_sec, order):
+            try:
+                At = _opt_float(At_entry.get())
+            except ValueError:
+                messagebox.showerror("Target", "Enter numeric target [A].", parent=win); return
+            if k_val is None or At is None:
+                messagebox.showerror("Inputs", "Need k and target [A].", parent=win); return
+            if order == 0:
+                t_sec = (A0 - At) / k_val
+                lines = [f"[0th]  t = (A0−At)/k = ({g(A0)}−{g(At)})/{g(k_val)} = {g(t_sec)} s"]
+            elif order == 1:
+                t_sec = (1.0 / k_val) * math.log(A0 / At)
+                lines = [f"[1st]  t = (1/k) ln(A0/At) = {g(t_sec)} s"]
+            else:
+                t_sec = (1.0 / k_val) * (1.0/At - 1.0/A0)
+                lines = [f"[2nd]  t = (1/k)(1/At − 1/A0) = {g(t_sec)} s"]
+            out.set(f"Time to reach [A]={g(At)} M:  t ≈ {g(t_sec)} s  ({g(t_sec/60)} min)")
+            return lines
 
-            # time t (if present)
-            t_sec = None
-            if t_entry.get().strip():
-                try:
-                    t_sec = _num(t_entry) * _sec_factor(t_unit.get())
-                except Exception:
-                    messagebox.showerror("Bad t", "Enter a numeric time.", parent=win); return
+        def do_k2p(A0, k_val, t_sec, order):
+            try:
+                t1 = _num(t1_e) * _sec_factor(t1_u.get())
+                t2 = _num(t2_e) * _sec_factor(t2_u.get())
+                A1 = _num(A1_e); A2 = _num(A2_e)
+            except Exception:
+                messagebox.showerror("Two-point data", "Enter t₁, t₂, [A]₁, [A]₂.", parent=win); return
+            dt = t2 - t1
+            if dt == 0:
+                messagebox.showerror("Two-point data", "t₂ must differ from t₁.", parent=win); return
+            if order == 0:
+                k_val = (A1 - A2) / dt
+                lines = [f"[0th]  [A]t = [A]0 − k t  ⇒  slope = −k  ⇒  k = (A1−A2)/(t2−t1) = {g(k_val)} M/s"]
+                k_unit.set("M/s")
+            elif order == 1:
+                k_val = (math.log(A1) - math.log(A2)) / dt
+                lines = [f"[1st]  ln[A] vs t slope = −k  ⇒  k = (ln A1 − ln A2)/Δt = {g(k_val)} s^-1"]
+                k_unit.set("s^-1")
+            else:
+                k_val = (1.0/A2 - 1.0/A1) / dt
+                lines = [f"[2nd]  1/[A] vs t slope = +k  ⇒  k = (1/A2 − 1/A1)/Δt = {g(k_val)} M^-1 s^-1"]
+                k_unit.set("M^-1 s^-1")
+            out.set(f"k ≈ {g(k_val)}  ({k_unit.get()})")
+            k_var.set(g(k_val))
+            return lines
 
-            ord0 = (order_var.get().startswith("0"))
-            ord1 = (order_var.get().startswith("1"))
-            ord2 = (order_var.get().startswith("2"))
+        def do_kt12(A0, k_val, t_sec, order):
+            try:
+                t12_in = _opt_float(t12_entry.get())
+            except ValueError:
+                messagebox.showerror("Half-life", "Bad t₁/₂.", parent=win); return
+            if t12_in is None:
+                messagebox.showerror("Half-life", "Enter t₁/₂.", parent=win); return
+            t12_u = t12_unit.get()
+            t12s = t12_in * _sec_factor(t12_u)   # seconds
+
+            # compute k in base (per second) units
+            if order == 0:
+                # t1/2 = [A]0 / (2k)  →  k = [A]0 / (2 t1/2)
+                k_base = A0 / (2.0 * t12s)                 # M/s
+            elif order == 1:
+                # t1/2 = ln 2 / k  →  k = ln 2 / t1/2
+                k_base = math.log(2.0) / t12s              # s^-1
+            else:
+                # t1/2 = 1 / (k [A]0)  →  k = 1 / (t1/2 · [A]0)
+                k_base = 1.0 / (t12s * A0)                 # M^-1 s^-1
+
+            # set k_unit to match the half-life time unit (always one of this order's choices)
+            target_units = _KUNITS[order][_TIME_UNITS.index(t12_u)]
+            k_unit.set(target_units)
+
+            # convert base (per second) → display unit (s/min/h)
+            k_disp = k_base * _K_TIME_SCALE[target_units]
+
+            k_var.set(f"{k_disp:.6g}")
+            out.set(f"k = {k_disp:.6g}  {target_units}")
+            return [f"Using half-life relation for order {order}:",
+                    f"  k = [A]0/(2 t1/2) = {A0:.6g}/(2×{t12_in:.6g} {t12_u})" if order == 0 else
+                    f"  k = ln2 / t1/2 = 0.693/{t12_in:.6g} {t12_u}" if order == 1 else
+                    f"  k = 1/(t1/2 · [A]0) = 1/({t12_in:.6g} {t12_u} × {A0:.6g})"]
+
+        def do_t12(A0, k_val, t_sec, order):
+            if k_val is None:
+                messagebox.showerror("Need k", "Enter k to get t₁/₂.", parent=win); return
+            if order == 0:
+                t12 = A0 / (2.0 * k_val)
+                lines = [f"[0th]  t1/2 = [A]0/(2k) = {g(A0)}/(2×{g(k_val)}) = {g(t12)} s"]
+            elif order == 1:
+                t12 = math.log(2.0) / k_val
+                lines = [f"[1st]  t1/2 = ln2 / k = {g(t12)} s"]
+            else:
+                t12 = 1.0 / (k_val * A0)
+                lines = [f"[2nd]  t1/2 = 1/(k [A]0) = 1/({g(k_val)}×{g(A0)}) = {g(t12)} s"]
+            out.set(f"t₁/₂ ≈ {g(t12)} s  ({g(t12/60)} min)")
+            last["t12"] = t12
+            return lines
 
-            # pretty format
-            def g(x): return f"{x:.6g}"
+        handlers = {"A_t": do_at, "rate": do_rate, "t_%": do_tpct, "t_A": do_tA,
+                    "k_2p": do_k2p, "k_t12": do_kt12, "t12": do_t12}
 
-            lines = []
-            task_key = task.get().split()[0]  # "A_t", "rate", "t_%", "t_A", "k_2p", "t12"
-
-            # ---- A_t (concentration after t) ----
-            if task_key == "A_t":
-                if k_val is None or t_sec is None:
-                    messagebox.showerror("Inputs", "Need k and t for [A] at time.", parent=win); return
-                if ord0:
-                    At = A0 - k_val * t_sec
-                    lines += [f"[0th]  [A]t = [A]0 − k t = {g(A0)} − {g(k_val)}×{g(t_sec)} = {g(At)} M"]
-                elif ord1:
-                    At = A0 * math.exp(-k_val * t_sec)
-                    lines += [f"[1st]  [A]t = [A]0·e^(−k t) = {g(A0)}·e^(−{g(k_val)}×{g(t_sec)}) = {g(At)} M"]
-                else:
-                    At = A0 / (1.0 + k_val * A0 * t_sec)
-                    lines += [f"[2nd]  [A]t = [A]0 /(1 + k [A]0 t) = {g(A0)}/(1+{g(k_val)}×{g(A0)}×{g(t_sec)}) = {g(At)} M"]
-                rate = k_val * (At if ord1 else (At**2 if ord2 else 1.0))
-                out.set(f"[A](t) = {g(At)} M    ;    rate = {g(rate)} M/s")
-                lines.append(f"rate(t) = k·[A]^n = {g(k_val)} × {g(At)}^{('1' if ord1 else '2' if ord2 else '0')} = {g(rate)} M/s")
-
-            # ---- rate at t ----
-            elif task_key == "rate":
-                if k_val is None or t_sec is None:
-                    messagebox.showerror("Inputs", "Need k and t to find rate.", parent=win); return
-                if ord0:
-                    At = A0 - k_val * t_sec
-                elif ord1:
-                    At = A0 * math.exp(-k_val * t_sec)
-                else:
-                    At = A0 / (1.0 + k_val * A0 * t_sec)
-                rate = k_val * (At if ord1 else (At**2 if ord2 else 1.0))
-                out.set(f"rate(t) = {g(rate)} M/s   (with [A](t) = {g(At)} M)")
-                lines += [f"[A](t) computed as above → rate = k·[A]^n = {g(rate)} M/s"]
-
-            # ---- t for % consumed ----
-            elif task_key == "t_%":
-                if k_val is None:
-                    messagebox.showerror("Inputs", "Need k for time.", parent=win); return
-                try:
-                    pct = _num(pct_entry) / 100.0
-                except Exception:
-                    messagebox.showerror("Percent", "Enter percent consumed (e.g., 75).", parent=win); return
-                if pct <= 0 or pct >= 1:
-                    messagebox.showerror("Percent", "Use 0–100 (exclusive).", parent=win); return
-                At = A0 * (1.0 - pct)
-                if ord0:
-                    t_sec = (A0 - At) / k_val
-                    lines += [f"[0th]  At = A0(1−f) → t = (A0−At)/k = ({g(A0)}−{g(At)})/{g(k_val)} = {g(t_sec)} s"]
-                elif ord1:
-                    t_sec = (1.0 / k_val) * math.log(A0 / At)
-                    lines += [f"[1st]  t = (1/k) ln(A0/At) = (1/{g(k_val)}) ln({g(A0)}/{g(At)}) = {g(t_sec)} s"]
-                else:
-                    t_sec = (1.0 / k_val) * (1.0/At - 1.0/A0)
-                    lines += [f"[2nd]  t = (1/k)(1/At − 1/A0) = (1/{g(k_val)})({g(1/At)}−{g(1/A0)}) = {g(t_sec)} s"]
-                out.set(f"Time for {pct*100:.1f}% consumed:  t ≈ {g(t_sec)} s  ({g(t_sec/60)} min)")
-
-            # ---- t to reach a target At ----
-            elif task_key == "t_A":
-                if k_val is None or not At_entry.get().strip():
-                    messagebox.showerror("Inputs", "Need k and target [A].", parent=win); return
-                try:
-                    At = _num(At_entry)
-                except Exception:
-                    messagebox.showerror("Target", "Enter numeric target [A].", parent=win); return
-                if ord0:
-                    t_sec = (A0 - At) / k_val
-                    lines += [f"[0th]  t = (A0−At)/k = ({g(A0)}−{g(At)})/{g(k_val)} = {g(t_sec)} s"]
-                elif ord1:
-                    t_sec = (1.0 / k_val) * math.log(A0 / At)
-                    lines += [f"[1st]  t = (1/k) ln(A0/At) = {g(t_sec)} s"]
-                else:
-                    t_sec = (1.0 / k_val) * (1.0/At - 1.0/A0)
-                    lines += [f"[2nd]  t = (1/k)(1/At − 1/A0) = {g(t_sec)} s"]
-                out.set(f"Time to reach [A]={g(At)} M:  t ≈ {g(t_sec)} s  ({g(t_sec/60)} min)")
+        def compute():
+            try:
+                A0 = _num(A0_entry)
+            except Exception:
+                messagebox.showerror("Need [A]₀", "Enter a numeric [A]₀ (M).", parent=win); return
 
-            # ---- solve k from two points ----
-            elif task_key == "k_2p":
-                try:
-                    t1 = _num(t1_e) * _sec_factor(t1_u.get())
-                    t2 = _num(t2_e) * _sec_factor(t2_u.get())
-                    A1 = _num(A1_e); A2 = _num(A2_e)
-                except Exception:
-                    messagebox.showerror("Two-point data", "Enter t₁, t₂, [A]₁, [A]₂.", parent=win); return
-                dt = t2 - t1
-                if dt == 0:
-                    messagebox.showerror("Two-point data", "t₂ must differ from t₁.", parent=win); return
-                if ord0:
-                    k_val = (A1 - A2) / dt
-                    lines += [f"[0th]  [A]t = [A]0 − k t  ⇒  slope = −k  ⇒  k = (A1−A2)/(t2−t1) = {g(k_val)} M/s"]
-                    k_unit.set("M/s")
-                elif ord1:
-                    k_val = (math.log(A1) - math.log(A2)) / dt
-                    lines += [f"[1st]  ln[A] vs t slope = −k  ⇒  k = (ln A1 − ln A2)/Δt = {g(k_val)} s^-1"]
-                    k_unit.set("s^-1")
-                else:
-                    k_val = (1.0/A2 - 1.0/A1) / dt
-                    lines += [f"[2nd]  1/[A] vs t slope = +k  ⇒  k = (1/A2 − 1/A1)/Δt = {g(k_val)} M^-1 s^-1"]
-                    k_unit.set("M^-1 s^-1")
-                out.set(f"k ≈ {g(k_val)}  ({k_unit.get()})")
-                k_entry.delete(0,"end"); k_entry.insert(0, g(k_val))
-            
-            elif task_key == "k_t12":
-                if not t12_entry.get().strip():
-                    messagebox.showerror("Half-life", "Enter t₁/₂.", parent=win); return
-                try:
-                    t12s = _num(t12_entry) * _sec_factor(t12_unit.get())   # seconds
-                except Exception:
-                    messagebox.showerror("Half-life", "Bad t₁/₂.", parent=win); return
-
-                # compute k in base (per second) units
-                if ord0:
-                    # t1/2 = [A]0 / (2k)  →  k = [A]0 / (2 t1/2)
-                    k_base = A0 / (2.0 * t12s)                 # M/s
-                    target_units = {"s":"M/s", "min":"M/min", "h":"M/h"}[t12_unit.get()]
-                elif ord1:
-                    # t1/2 = ln 2 / k  →  k = ln 2 / t1/2
-                    k_base = math.log(2.0) / t12s              # s^-1
-                    target_units = {"s":"s^-1", "min":"min^-1", "h":"h^-1"}[t12_unit.get()]
-                else:
-                    # t1/2 = 1 / (k [A]0)  →  k = 1 / (t1/2 · [A]0)
-                    k_base = 1.0 / (t12s * A0)                 # M^-1 s^-1
-                    target_units = {"s":"M^-1 s^-1", "min":"M^-1 min^-1", "h":"M^-1 h^-1"}[t12_unit.get()]
-
-                # set k_unit to match the half-life time unit
-                for opt in k_unit["values"]:
-                    if opt == target_units:
-                        k_unit.set(opt); break
-
-                # convert base (per second) → display unit (s/min/h)
-                scale = 1.0
-                if "min" in k_unit.get():   scale = 60.0
-                elif "h" in k_unit.get():   scale = 3600.0
-                k_disp = k_base * scale
-
-                k_entry.delete(0, "end"); k_entry.insert(0, f"{k_disp:.6g}")
-                out.set(f"k = {k_disp:.6g}  {k_unit.get()}")
-                explain.insert("end",
-                    f"Using half-life relation for order {order_var.get()[0]}:\n"
-                    + (f"  k = [A]0/(2 t1/2) = {A0:.6g}/(2×{_num(t12_entry):.6g} {t12_unit.get()})\n" if ord0 else
-                        f"  k = ln2 / t1/2 = 0.693/{_num(t12_entry):.6g} {t12_unit.get()}\n" if ord1 else
-                        f"  k = 1/(t1/2 · [A]0) = 1/({_num(t12_entry):.6g} {t12_unit.get()} × {A0:.6g})\n")
-                )
+            # k and time t (either may be blank)
+            try:
+                k_val = _opt_float(k_entry.get())
+            except ValueError:
+                messagebox.showerror("Bad k", "Enter a numeric k.", parent=win); return
+            if k_val is not None:
+                k_val = _k_to_base(k_val, k_unit.get())
+            try:
+                t_sec = _opt_float(t_entry.get())
+            except ValueError:
+                messagebox.showerror("Bad t", "Enter a numeric time.", parent=win); return
+            if t_sec is not None:
+                t_sec *= _sec_factor(t_unit.get())
 
-            # ---- half-life ----
-            else:  # "t12"
-                if k_val is None:
-                    messagebox.showerror("Need k", "Enter k to get t₁/₂.", parent=win); return
-                if ord0:
-                    t12 = A0 / (2.0 * k_val)
-                    lines += [f"[0th]  t1/2 = [A]0/(2k) = {g(A0)}/(2×{g(k_val)}) = {g(t12)} s"]
-                elif ord1:
-                    t12 = math.log(2.0) / k_val
-                    lines += [f"[1st]  t1/2 = ln2 / k = {g(t12)} s"]
-                else:
-                    t12 = 1.0 / (k_val * A0)
-                    lines += [f"[2nd]  t1/2 = 1/(k [A]0) = 1/({g(k_val)}×{g(A0)}) = {g(t12)} s"]
-                out.set(f"t₁/₂ ≈ {g(t12)} s  ({g(t12/60)} min)")
+            o = order_var.get()[:1]
+            order = 0 if o == "0" else (1 if o == "1" else 2)
 
-            explain.insert("end", "\n".join(lines) + "\n")
-            explain.configure(state="disabled")
+            task_key = task.get().split()[0]  # "A_t", "rate", "t_%", "t_A", "k_2p", "k_t12", "t12"
+            lines = handlers[task_key](A0, k_val, t_sec, order)
+            if lines is None:
+                return
 
-            return  # (we don’t need to return a number; UI shows all)
+            # one state toggle + replace of the (read-only) explanation per compute
+            explain.configure(state="normal")
+            explain.delete("1.0", "end")
+            explain.insert("1.0", "\n".join(lines) + "\n")
+            explain.configure(state="disabled")
         
 
         # Put the compute bar at the bottom (Enter triggers compute)
@@ -3354,26 +3799,25 @@ class ChemGUI(tk.Tk):
         # --- Add-to-known shortcuts ----------------------------------------------
         btns = ttk.Frame(frm); btns.grid(row=8, column=0, columnspan=5, sticky="w", pady=(8,0))
         def add_k_known():
-            if not k_entry.get().strip(): 
-                messagebox.showinfo("k", "Compute or type k first.", parent=win); return
+            k_txt = k_entry.get()
             try:
-                k_base = _k_to_base(_num(k_entry), k_unit.get())
-            except Exception:
+                k_disp = _opt_float(k_txt)
+            except ValueError:
                 messagebox.showerror("k", "Bad k.", parent=win); return
-            self.known_base["k_rate"] = float(k_base)   # store in base (seconds)
-            self.known_ui["k_rate"]   = {"unit": k_unit.get(), "display_value": float(_num(k_entry))}
+            if k_disp is None:
+                messagebox.showinfo("k", "Compute or type k first.", parent=win); return
+            unit = k_unit.get()
+            self.known_base["k_rate"] = _k_to_base(k_disp, unit)   # store in base (seconds)
+            self.known_ui["k_rate"]   = {"unit": unit, "display_value": k_disp}
             self._refresh_known_table(); self._refresh_equation_list()
-            messagebox.showinfo("Added", f"Saved k = {k_entry.get()} {k_unit.get()} as ‘k_rate’.", parent=win)
+            messagebox.showinfo("Added", f"Saved k = {k_txt} {unit} as ‘k_rate’.", parent=win)
 
         def add_t12_known():
             # simulate pressing compute on half-life
+            last["t12"] = None
             old = task.get(); task.set("t12  • Half-life (t₁/₂) from k and [A]₀"); compute(); task.set(old)
-            txt = out.get()
-            # crude parse for seconds value
-            import re
-            m = re.search(r"≈ ([\d.eE+-]+) s", txt)
-            if not m: return
-            t12 = float(m.group(1))
+            t12 = last["t12"]
+            if t12 is None: return
             self.known_base["t1/2"] = t12  # seconds
             self.known_ui["t1/2"]   = {"unit":"s","display_value":t12}
             self._refresh_known_table(); self._refresh_equation_list()
@@ -3415,45 +3859,42 @@ class ChemGUI(tk.Tk):
         box.grid(row=2, column=0, columnspan=4, sticky="we", pady=(8,8))
         for c in range(8): box.grid_columnconfigure(c, weight=1)
 
-        # k
-        ttk.Label(box, text="k:").grid(row=0, column=0, sticky="e")
-        k_entry = ttk.Entry(box, width=16); k_entry.grid(row=0, column=1, sticky="w", padx=(6,8))
-        ttk.Label(box, text="units of k:").grid(row=0, column=2, sticky="e")
-        k_unit = ttk.Combobox(box, width=14, state="readonly",
-                            values=["s⁻¹","min⁻¹","h⁻¹","M⁻¹·s⁻¹","M⁻¹·min⁻¹","custom…"])
-        k_unit.grid(row=0, column=3, sticky="w"); k_unit.set("s⁻¹")
-
-        # A
-        ttk.Label(box, text="A (same units as k):").grid(row=1, column=0, sticky="e")
-        A_entry = ttk.Entry(box, width=16); A_entry.grid(row=1, column=1, sticky="w", padx=(6,8))
-
-        # Ea + unit
-        ttk.Label(box, text="Ea:").grid(row=2, column=0, sticky="e")
-        Ea_entry = ttk.Entry(box, width=16); Ea_entry.grid(row=2, column=1, sticky="w", padx=(6,8))
-        Ea_unit = ttk.Combobox(box, width=10, state="readonly",
-                            values=["J/mol","kJ/mol","cal/mol","kcal/mol"])
-        Ea_unit.grid(row=2, column=2, sticky="w"); Ea_unit.set("kJ/mol")
-
-        # Temperature + unit
-        ttk.Label(box, text="T:").grid(row=3, column=0, sticky="e")
-        T_entry = ttk.Entry(box, width=16); T_entry.grid(row=3, column=1, sticky="w", padx=(6,8))
-        T_unit = ttk.Combobox(box, width=8, state="readonly", values=["K","°C"])
-        T_unit.grid(row=3, column=2, sticky="w"); T_unit.set("K")
-
-        # Prefill from Known if present
-        if "Ea" in self.known_ui and not Ea_entry.get():
+        # Rows: (key, label, extra unit label, unit choices or None, default unit, box width);
+        # the unit box sits after the extra label when there is one
+        ents, evars, units = {}, {}, {}
+        for r, (key, label, unit_label, values, default, cb_width) in enumerate((
+                ("k", "k:", "units of k:", ("s⁻¹","min⁻¹","h⁻¹","M⁻¹·s⁻¹","M⁻¹·min⁻¹","custom…"), "s⁻¹", 14),
+                ("A", "A (same units as k):", None, None, None, 0),
+                ("Ea", "Ea:", None, tuple(_EA_TO_J), "kJ/mol", 10),
+                ("T", "T:", None, _TEMP_UNITS, "K", 8))):
+            ttk.Label(box, text=label).grid(row=r, column=0, sticky="e")
+            evars[key] = tk.StringVar()
+            ents[key] = ent = ttk.Entry(box, width=16, textvariable=evars[key]); ent.grid(row=r, column=1, sticky="w", padx=(6,8))
+            if values is None:
+                continue
+            col = 2
+            if unit_label:
+                ttk.Label(box, text=unit_label).grid(row=r, column=2, sticky="e"); col = 3
+            units[key] = cb = ttk.Combobox(box, width=cb_width, state="readonly", values=values)
+            cb.grid(row=r, column=col, sticky="w"); cb.set(default)
+        k_entry, A_entry, Ea_entry, T_entry = ents["k"], ents["A"], ents["Ea"], ents["T"]
+        k_var, A_var, Ea_var, T_var = evars["k"], evars["A"], evars["Ea"], evars["T"]
+        k_unit, Ea_unit, T_unit = units["k"], units["Ea"], units["T"]
+
+        # Prefill from Known if present: (key, entry, base-value scale or None to use the
+        # displayed value, unit box, unit to select)
+        ui, base = self.known_ui, self.known_base
+        for key, ent, scale, unit_box, unit_val in (
+                ("Ea", Ea_entry, 1e-3, Ea_unit, "kJ/mol"),
+                ("T", T_entry, 1.0, T_unit, "K"),
+                ("k", k_entry, None, None, None),
+                ("A", A_entry, None, None, None)):
+            if key not in ui or ent.get():
+                continue
             try:
-                valJ = float(self.known_base["Ea"])
-                Ea_entry.insert(0, f"{valJ/1000.0:g}"); Ea_unit.set("kJ/mol")
-            except Exception: pass
-        if "T" in self.known_ui and not T_entry.get():
-            try: T_entry.insert(0, f"{float(self.known_base['T']):g}"); T_unit.set("K")
-            except Exception: pass
-        if "k" in self.known_ui and not k_entry.get():
-            try: k_entry.insert(0, f"{float(self.known_ui['k']['display_value']):g}")
-            except Exception: pass
-        if "A" in self.known_ui and not A_entry.get():
-            try: A_entry.insert(0, f"{float(self.known_ui['A']['display_value']):g}")
+                val = float(ui[key]["display_value"]) if scale is None else float(base[key]) * scale
+                ent.insert(0, f"{val:g}")
+                if unit_box is not None: unit_box.set(unit_val)
             except Exception: pass
 
         # --- Two-point panel -------------------------------------------------------
@@ -3463,26 +3904,23 @@ class ChemGUI(tk.Tk):
 
         ttk.Label(box2, text="k₁:").grid(row=0, column=0, sticky="e"); k1E=ttk.Entry(box2,width=12); k1E.grid(row=0,column=1,sticky="w",padx=(6,8))
         ttk.Label(box2, text="T₁:").grid(row=0, column=2, sticky="e"); T1E=ttk.Entry(box2,width=12); T1E.grid(row=0,column=3,sticky="w",padx=(6,8))
-        T1U=ttk.Combobox(box2,width=6, state="readonly", values=["K","°C"]); T1U.grid(row=0,column=4,sticky="w"); T1U.set("K")
+        T1U=ttk.Combobox(box2,width=6, state="readonly", values=_TEMP_UNITS); T1U.grid(row=0,column=4,sticky="w"); T1U.set("K")
 
-        ttk.Label(box2, text="k₂:").grid(row=1, column=0, sticky="e"); k2E=ttk.Entry(box2,width=12); k2E.grid(row=1,column=1,sticky="w",padx=(6,8))
+        ttk.Label(box2, text="k₂:").grid(row=1, column=0, sticky="e"); k2_var=tk.StringVar(); k2E=ttk.Entry(box2,width=12,textvariable=k2_var); k2E.grid(row=1,column=1,sticky="w",padx=(6,8))
         ttk.Label(box2, text="T₂:").grid(row=1, column=2, sticky="e"); T2E=ttk.Entry(box2,width=12); T2E.grid(row=1,column=3,sticky="w",padx=(6,8))
-        T2U=ttk.Combobox(box2,width=6, state="readonly", values=["K","°C"]); T2U.grid(row=1,column=4,sticky="w"); T2U.set("K")
+        T2U=ttk.Combobox(box2,width=6, state="readonly", values=_TEMP_UNITS); T2U.grid(row=1,column=4,sticky="w"); T2U.set("K")
 
         btns2 = ttk.Frame(box2); btns2.grid(row=2, column=0, columnspan=6, sticky="w", pady=(6,0))
         def _two_point_Ea():
             try:
-                R = float(R_entry.get().replace(",", "."))
-                k1 = float(k1E.get().replace(",", ".")); k2 = float(k2E.get().replace(",", "."))
-                T1 = float(T1E.get().replace(",", ".")); T2 = float(T2E.get().replace(",", "."))
+                R, k1, k2, T1, T2 = _parse_floats(R_entry, k1E, k2E, T1E, T2E)
             except ValueError:
                 messagebox.showerror("Invalid", "Enter numbers for k₁, k₂, T₁, T₂."); return
-            T1K = T1 if T1U.get()=="K" else T1 + 273.15
-            T2K = T2 if T2U.get()=="K" else T2 + 273.15
+            T1K = _to_kelvin(T1, T1U.get()); T2K = _to_kelvin(T2, T2U.get())
             if k1<=0 or k2<=0 or T1K<=0 or T2K<=0:
                 messagebox.showerror("Invalid", "k and T must be > 0."); return
             Ea = R * math.log(k1/k2) / (1.0/T2K - 1.0/T1K)  # J/mol
-            Ea_entry.delete(0,"end"); Ea_entry.insert(0, f"{Ea/1000.0:g}"); Ea_unit.set("kJ/mol")
+            Ea_var.set(f"{Ea/1000.0:g}"); Ea_unit.set("kJ/mol")
             out.set(f"Two-point: Ea = {Ea/1000.0:.6g} kJ/mol  (= {Ea:.6g} J/mol)")
             _append_steps(
                 f"Two-point Ea:\n  ln(k2/k1) = -Ea/R · (1/T2 - 1/T1)\n"
@@ -3492,19 +3930,14 @@ class ChemGUI(tk.Tk):
 
         def _two_point_k2():
             try:
-                R = float(R_entry.get().replace(",", "."))
-                k1 = float(k1E.get().replace(",", ".")); T1 = float(T1E.get().replace(",", "."))
-                T2 = float(T2E.get().replace(",", "."))
-                # Ea from main box (convert to J/mol)
-                Ea_val = float(Ea_entry.get().replace(",", "."))
+                # Ea from main box (converted to J/mol below)
+                R, k1, T1, T2, Ea_val = _parse_floats(R_entry, k1E, T1E, T2E, Ea_entry)
             except ValueError:
                 messagebox.showerror("Invalid", "Need k₁, T₁, T₂ and Ea (in main box)."); return
-            T1K = T1 if T1U.get()=="K" else T1 + 273.15
-            T2K = T2 if T2U.get()=="K" else T2 + 273.15
-            factor = {"J/mol":1.0,"kJ/mol":1000.0,"cal/mol":4.184,"kcal/mol":4184.0}[Ea_unit.get()]
-            EaJ = Ea_val * factor
+            T1K = _to_kelvin(T1, T1U.get()); T2K = _to_kelvin(T2, T2U.get())
+            EaJ = Ea_val * _EA_TO_J[Ea_unit.get()]
             k2 = k1 * math.exp(-EaJ/R * (1.0/T2K - 1.0/T1K))
-            k2E.delete(0,"end"); k2E.insert(0, f"{k2:.6g}")
+            k2_var.set(f"{k2:.6g}")
             out.set(f"Two-point: k₂ = {k2:.6g} (units same as k₁)")
             _append_steps(
                 f"Two-point k₂:\n  ln(k2/k1) = -Ea/R · (1/T2 - 1/T1)\n"
@@ -3533,41 +3966,36 @@ class ChemGUI(tk.Tk):
         def compute():
             steps.configure(state="normal"); steps.delete("1.0", "end"); steps.configure(state="disabled")
             try:
-                R = float(R_entry.get().replace(",", "."))
+                R = _parse_float(R_entry.get())
             except ValueError:
                 messagebox.showerror("Invalid R", "Enter a numeric gas constant R."); return
 
-            # Pull & convert inputs (some may be blank)
-            k_str, A_str, Ea_str, T_str = k_entry.get().strip(), A_entry.get().strip(), Ea_entry.get().strip(), T_entry.get().strip()
+            # Pull & convert inputs (some may be blank): one read per entry
+            k_unit_txt, t_unit_txt, show_log10 = k_unit.get(), T_unit.get(), use_log10.get()
             # Ea to J/mol if present
-            EaJ = None
-            if Ea_str:
-                try:
-                    eaval = float(Ea_str.replace(",", "."))
-                    EaJ = eaval * {"J/mol":1.0,"kJ/mol":1000.0,"cal/mol":4.184,"kcal/mol":4184.0}[Ea_unit.get()]
-                except ValueError:
-                    messagebox.showerror("Invalid Ea", "Enter a numeric Ea."); return
+            try:
+                EaJ = _opt_float(Ea_entry.get())
+            except ValueError:
+                messagebox.showerror("Invalid Ea", "Enter a numeric Ea."); return
+            if EaJ is not None:
+                EaJ *= _EA_TO_J[Ea_unit.get()]
             # T to K if present
-            TK = None
-            if T_str:
-                try:
-                    tval = float(T_str.replace(",", "."))
-                    TK = tval if T_unit.get()=="K" else tval + 273.15
-                except ValueError:
-                    messagebox.showerror("Invalid T", "Enter a numeric temperature."); return
+            try:
+                TK = _opt_float(T_entry.get())
+            except ValueError:
+                messagebox.showerror("Invalid T", "Enter a numeric temperature."); return
+            if TK is not None:
+                TK = _to_kelvin(TK, t_unit_txt)
                 if TK <= 0:
                     messagebox.showerror("Invalid T", "Absolute temperature must be > 0 K."); return
 
             # Parse k and A if present
-            kval = None; Aval = None
-            if k_str:
-                try: kval = float(k_str.replace(",", "."))
-                except ValueError: messagebox.showerror("Invalid k","Enter a numeric k."); return
-                if kval <= 0: messagebox.showerror("Invalid k","k must be > 0."); return
-            if A_str:
-                try: Aval = float(A_str.replace(",", "."))
-                except ValueError: messagebox.showerror("Invalid A","Enter a numeric A."); return
-                if Aval <= 0: messagebox.showerror("Invalid A","A must be > 0."); return
+            try: kval = _opt_float(k_entry.get())
+            except ValueError: messagebox.showerror("Invalid k","Enter a numeric k."); return
+            if kval is not None and kval <= 0: messagebox.showerror("Invalid k","k must be > 0."); return
+            try: Aval = _opt_float(A_entry.get())
+            except ValueError: messagebox.showerror("Invalid A","Enter a numeric A."); return
+            if Aval is not None and Aval <= 0: messagebox.showerror("Invalid A","A must be > 0."); return
 
             what = solve_for.get()
 
@@ -3581,36 +4009,36 @@ class ChemGUI(tk.Tk):
                 if Aval is None or EaJ is None or TK is None:
                     messagebox.showerror("Need inputs", "Provide A, Ea and T to solve for k."); return
                 k = Aval * math.exp(-EaJ/(R*TK))
-                k_entry.delete(0,"end"); k_entry.insert(0, f"{k:.6g}")
-                show_result("k", k, k_unit.get())
+                k_var.set(f"{k:.6g}")
+                show_result("k", k, k_unit_txt)
                 _append_steps(
                     f"k = A·exp(-Ea/(R·T))\n"
-                    f"  = {Aval:g}·exp(-{EaJ:g}/({R:g}·{TK:g})) = {k:.6g} {k_unit.get()}\n"
-                    + (_log10_info(Aval, EaJ, R, TK, k) if use_log10.get() else "")
+                    f"  = {Aval:g}·exp(-{EaJ:g}/({R:g}·{TK:g})) = {k:.6g} {k_unit_txt}\n"
+                    + (_log10_info(Aval, EaJ, R, TK, k) if show_log10 else "")
                 )
 
             elif what == "Ea":
                 if kval is None or Aval is None or TK is None:
                     messagebox.showerror("Need inputs", "Provide k, A and T to solve for Ea."); return
                 EaJ = - R*TK*math.log(kval/Aval)
-                Ea_entry.delete(0,"end"); Ea_entry.insert(0, f"{EaJ/1000.0:.6g}"); Ea_unit.set("kJ/mol")
+                Ea_var.set(f"{EaJ/1000.0:.6g}"); Ea_unit.set("kJ/mol")
                 show_result("Ea", EaJ/1000.0, "kJ/mol")
                 _append_steps(
                     f"ln k = ln A − Ea/(R·T)  ⇒  Ea = −R·T·ln(k/A)\n"
                     f"  = −{R:g}·{TK:g}·ln({kval:g}/{Aval:g}) = {EaJ/1000.0:.6g} kJ/mol\n"
-                    + (_log10_rearranged(kval, Aval, R, TK) if use_log10.get() else "")
+                    + (_log10_rearranged(kval, Aval, R, TK) if show_log10 else "")
                 )
 
             elif what == "A":
                 if kval is None or EaJ is None or TK is None:
                     messagebox.showerror("Need inputs", "Provide k, Ea and T to solve for A."); return
                 A = kval * math.exp(EaJ/(R*TK))
-                A_entry.delete(0,"end"); A_entry.insert(0, f"{A:.6g}")
-                show_result("A", A, f"{k_unit.get()}")
+                A_var.set(f"{A:.6g}")
+                show_result("A", A, k_unit_txt)
                 _append_steps(
                     f"A = k·exp(Ea/(R·T))\n"
-                    f"  = {kval:g}·exp({EaJ:g}/({R:g}·{TK:g})) = {A:.6g} ({k_unit.get()})\n"
-                    + (_log10_A(kval, EaJ, R, TK, A) if use_log10.get() else "")
+                    f"  = {kval:g}·exp({EaJ:g}/({R:g}·{TK:g})) = {A:.6g} ({k_unit_txt})\n"
+                    + (_log10_A(kval, EaJ, R, TK, A) if show_log10 else "")
                 )
 
             else:  # what == "T"
@@ -3620,68 +4048,51 @@ class ChemGUI(tk.Tk):
                 if arg <= 0 or arg == 1.0:
                     messagebox.showerror("Invalid", "A/k must be > 0 and ≠ 1."); return
                 Tsol = EaJ / (R * math.log(arg))
-                if T_unit.get() == "°C":
+                if t_unit_txt == "°C":
                     disp = Tsol - 273.15; unitlab = "°C"
                 else:
                     disp = Tsol; unitlab = "K"
-                T_entry.delete(0,"end"); T_entry.insert(0, f"{disp:.6g}")
+                T_var.set(f"{disp:.6g}")
                 show_result("T", disp, unitlab)
                 _append_steps(
                     f"k = A·exp(-Ea/(R·T)) ⇒ T = Ea / [R·ln(A/k)]\n"
                     f"  = {EaJ:g} / [{R:g}·ln({Aval:g}/{kval:g})] = {Tsol:.6g} K\n"
-                    + (_log10_T(Aval, kval, EaJ, R, Tsol) if use_log10.get() else "")
+                    + (_log10_T(Aval, kval, EaJ, R, Tsol) if show_log10 else "")
                 )
 
-        def _log10_info(A, EaJ, R, T, k):
-            return (f"\nlog₁₀ form:\n  log k = log A − Ea/(2.303·R)·(1/T)\n"
-                    f"  log k = log({A:g}) − {EaJ:g}/(2.303·{R:g})·(1/{T:g}) ⇒ k ≈ {k:.6g}\n")
-
-        def _log10_rearranged(k, A, R, T):
-            return (f"\nlog₁₀ rearranged:\n  Ea = 2.303·R·T·(log A − log k)\n")
-
-        def _log10_A(k, EaJ, R, T, A):
-            return (f"\nlog₁₀ form:\n  log A = log k + Ea/(2.303·R·T) ⇒ A ≈ {A:.6g}\n")
-
-        def _log10_T(A, k, EaJ, R, TK):
-            return (f"\nlog₁₀ form:\n  1/T = [log A − log k]·(2.303·R)/Ea  ⇒  T ≈ {TK:.6g} K\n")
-
         # --- Compute bar at the bottom (Enter triggers) ----------------------------
         self._add_compute_bar(win, compute)
 
         # --- Add to Known Variables ------------------------------------------------
         btm = ttk.Frame(frm); btm.grid(row=6, column=0, columnspan=4, sticky="w", pady=(8,0))
         def _add_known():
-            # Save what we have (if parseable)
+            # Save what we have (if parseable); each entry is read once
             saved = []
+            def _val(entry):
+                try: return _opt_float(entry.get())
+                except ValueError: return None
             # T
-            if T_entry.get().strip():
-                try:
-                    tval = float(T_entry.get().replace(",",".")); TK = tval if T_unit.get()=="K" else tval + 273.15
-                    self.known_base["T"] = float(TK); self.known_ui["T"]={"unit":"K","display_value":float(TK)}; saved.append("T")
-                except: pass
-            # k
-            if k_entry.get().strip():
-                try:
-                    kval = float(k_entry.get().replace(",",".")); self.known_base["k"]=float(kval)
-                    self.known_ui["k"]={"unit":k_unit.get(), "display_value":float(kval)}; saved.append("k")
-                except: pass
-            # A
-            if A_entry.get().strip():
-                try:
-                    Aval = float(A_entry.get().replace(",",".")); self.known_base["A"]=float(Aval)
-                    self.known_ui["A"]={"unit":k_unit.get(), "display_value":float(Aval)}; saved.append("A")
-                except: pass
+            tval = _val(T_entry)
+            if tval is not None:
+                TK = _to_kelvin(tval, T_unit.get())
+                self.known_base["T"] = float(TK); self.known_ui["T"]={"unit":"K","display_value":float(TK)}; saved.append("T")
+            # k and A (same units)
+            kval, Aval, k_unit_txt = _val(k_entry), _val(A_entry), k_unit.get()
+            if kval is not None:
+                self.known_base["k"]=kval
+                self.known_ui["k"]={"unit":k_unit_txt, "display_value":kval}; saved.append("k")
+            if Aval is not None:
+                self.known_base["A"]=Aval
+                self.known_ui["A"]={"unit":k_unit_txt, "display_value":Aval}; saved.append("A")
             # Ea
-            if Ea_entry.get().strip():
-                try:
-                    eaval = float(Ea_entry.get().replace(",",".")); fac={"J/mol":1.0,"kJ/mol":1000.0,"cal/mol":4.184,"kcal/mol":4184.0}[Ea_unit.get()]
-                    EaJ = eaval*fac; self.known_base["Ea"]=float(EaJ)
-                    self.known_ui["Ea"]={"unit":"kJ/mol","display_value":float(EaJ/1000.0)}; saved.append("Ea")
-                except: pass
+            eaval = _val(Ea_entry)
+            if eaval is not None:
+                EaJ = eaval*_EA_TO_J[Ea_unit.get()]; self.known_base["Ea"]=float(EaJ)
+                self.known_ui["Ea"]={"unit":"kJ/mol","display_value":float(EaJ/1000.0)}; saved.append("Ea")
 
             # R
             try:
-                Rv = float(R_entry.get().replace(",",".")); self.known_base["R"]=float(Rv)
+                Rv = _parse_float(R_entry.get()); self.known_base["R"]=float(Rv)
                 self.known_ui["R"]={"unit":"J/(mol·K)","display_value":float(Rv)}; saved.append("R")
             except: pass
 
@@ -3729,40 +4140,11 @@ class ChemGUI(tk.Tk):
     
     # ---- tiny parser for "a A + b B <-> c C + d D" ----
     def _parse_reaction(self, s: str):
-        import re
-        s = s.replace("⇌", "->").replace("↔", "->").replace("⟷", "->").replace("=", "->")
-        if "->" not in s:
-            raise ValueError("Use an arrow like '->' or '⇌' between sides.")
-        L, R = [part.strip() for part in s.split("->", 1)]
-
-        def parse_side(side, sign):
-            species = {}
-            if not side:
-                return species
-            for term in side.split("+"):
-                term = term.strip()
-                if not term: 
-                    continue
-                m = re.match(r"^\s*(\d*\.?\d*)\s*([A-Za-z0-9()^+\-·_]+)\s*$", term)
-                if not m:
-                    # allow plain species (implicit 1)
-                    coef, sp = "", term
-                else:
-                    coef, sp = m.group(1), m.group(2)
-                nu = float(coef) if coef else 1.0
-                species[sp] = species.get(sp, 0.0) + sign * nu
-            return species
-
-        st = {}
-        for k, v in parse_side(L, -1).items(): st[k] = st.get(k,0)+v
-        for k, v in parse_side(R, +1).items(): st[k] = st.get(k,0)+v
-        # ensure both sides present
-        if all(v>=0 for v in st.values()) or all(v<=0 for v in st.values()):
-            raise ValueError("Reaction needs reactants and products on different sides.")
-        return st  # dict: species -> ν (reactants negative; products positive)
+        return dict(_parse_reaction_items(s))  # fresh dict: callers may mutate it
 
     # ---- robust 1D extent solver for ICE (bisection + fallback) ----
-    def _solve_extent_for_K(self, stoich, C0, K, is_pressure=False):
+    def _solve_extent_for_K(self, stoich, C0, K, is_pressure=False, return_q=False):
+        """Extent x with Q(x) = K; with return_q, (x, Q(x)) (Q None if undefined at x)."""
         import math
         # admissible interval for x s.t. all Ci(x)=C0_i + ν_i x >= 0
         lo = -1e30; hi = 1e30
@@ -3776,65 +4158,25 @@ class ChemGUI(tk.Tk):
         if not (lo < hi):
             raise ValueError("No feasible extent (check initials).")
 
-        def Q_of(x):
-            num = den = 1.0
-            for sp, nu in stoich.items():
-                c = C0[sp] + nu * x
-                if c <= 0: 
-                    return None
-                if nu > 0:
-                    num *= c**nu
-                elif nu < 0:
-                    den *= (c**(-nu))
-            return num/den
+        if not K > 0:
+            raise ValueError("K must be positive.")
+
+        # (C0_i, ν_i) pairs built once, so each Q(x) below skips the dict lookups
+        terms = tuple((C0[sp], nu) for sp, nu in stoich.items())
+        lnK = math.log(K)
 
-        # objective: f(x) = Q(x) - K
+        # objective: f(x) = ln Q(x) - ln K (same root; the tolerance is then relative).
+        # ln Q is kept per x so Q at the returned root needs no re-evaluation
+        lnq_at = {}
         def f(x):
-            q = Q_of(x)
-            return None if q is None else (q - K)
-
-        # try bracket with coarse scan
-        N = 200
-        xs = [lo + (hi-lo)*i/N for i in range(N+1)]
-        vals = [f(x) for x in xs]
-        bracket = None
-        for i in range(N):
-            a,b = xs[i], xs[i+1]
-            fa, fb = vals[i], vals[i+1]
-            if fa is None or fb is None: 
-                continue
-            if fa==0: return a
-            if fb==0: return b
-            if fa*fb < 0:
-                bracket = (a,b); break
-
-        # bisection if bracketed
-        if bracket:
-            a,b = bracket
-            for _ in range(100):
-                m = 0.5*(a+b)
-                fm = f(m)
-                if fm is None: 
-                    break
-                if abs(fm) < 1e-12:
-                    return m
-                fa = f(a)
-                if fa*fm <= 0:
-                    b = m
-                else:
-                    a = m
-            return 0.5*(a+b)
+            lq = lnq_at[x] = _log_reaction_quotient(terms, x)
+            return None if lq is None else (lq - lnK)
 
-        # fallback: choose x with minimal |f|
-        best = None; bestx = None
-        for x,v in zip(xs, vals):
-            if v is None: 
-                continue
-            if best is None or abs(v) < best:
-                best = abs(v); bestx = x
-        if bestx is None:
-            raise ValueError("Failed to evaluate Q over feasible x (check inputs).")
-        return bestx
+        x = _extent_root(f, lo, hi)
+        if not return_q:
+            return x
+        lq = lnq_at[x] if x in lnq_at else _log_reaction_quotient(terms, x)
+        return x, _q_from_log(lq)
     
 
     def _open_equilibrium_ice_tool(self):
@@ -3867,27 +4209,32 @@ class ChemGUI(tk.Tk):
         table = ttk.Frame(frm); table.grid(row=3, column=0, columnspan=6, sticky="nsew", pady=(8,6))
         frm.grid_rowconfigure(3, weight=1); frm.grid_columnconfigure(1, weight=1)
 
-        species_widgets = {}  # sp -> (label, init_entry)
+        species_widgets = {}  # sp -> init_entry
         stoich = {}
+        species = []          # stoich keys sorted once per parse, for every display below
+        hdr = ("Species","ν (prod + / react −)","Initial (M or atm)")
+        for j,h in enumerate(hdr):
+            ttk.Label(table, text=h, font=("Segoe UI",10,"bold")).grid(row=0, column=j, sticky="w", padx=4, pady=2)
+        row_pool = []   # (species label, ν label, initial entry) per grid row, reused across refreshes
+
+        def make_row(i):
+            name = ttk.Label(table); name.grid(row=i, column=0, sticky="w", padx=4)
+            nu_l = ttk.Label(table); nu_l.grid(row=i, column=1, sticky="w")
+            e = ttk.Entry(table, width=14); e.grid(row=i, column=2, sticky="w")
+            return name, nu_l, e
 
         def build_table():
-            nonlocal stoich, species_widgets
-            for w in table.winfo_children(): w.destroy()
+            nonlocal stoich, species_widgets, species
             try:
                 stoich = self._parse_reaction(rxn.get())
             except Exception as ex:
                 messagebox.showerror("Parse error", str(ex), parent=win); return
 
-            hdr = ("Species","ν (prod + / react −)","Initial (M or atm)")
-            for j,h in enumerate(hdr):
-                ttk.Label(table, text=h, font=("Segoe UI",10,"bold")).grid(row=0, column=j, sticky="w", padx=4, pady=2)
-
+            species = sorted(stoich)
             species_widgets = {}
-            for i,(sp,nu) in enumerate(sorted(stoich.items()), start=1):
-                ttk.Label(table, text=sp).grid(row=i, column=0, sticky="w", padx=4)
-                ttk.Label(table, text=f"{nu:g}").grid(row=i, column=1, sticky="w")
-                e = ttk.Entry(table, width=14); e.grid(row=i, column=2, sticky="w")
-                e.insert(0, "0.00")
+            for sp, (name, nu_l, e) in zip(species, _grid_row_pool(row_pool, len(species), make_row)):
+                name.configure(text=sp); nu_l.configure(text=f"{stoich[sp]:g}")
+                e.delete(0, "end"); e.insert(0, "0.00")
                 species_widgets[sp] = e
 
         ttk.Button(frm, text="Parse/Refresh species", command=build_table).grid(row=2, column=0, sticky="w", pady=(8,0))
@@ -3908,8 +4255,9 @@ class ChemGUI(tk.Tk):
         sc = ttk.Scrollbar(frm, orient="vertical", command=steps.yview); steps.configure(yscrollcommand=sc.set)
         sc.grid(row=6, column=6, sticky="ns")
 
-        def note(s):
-            steps.configure(state="normal"); steps.insert("end", s + ("\n" if not s.endswith("\n") else "")); steps.configure(state="disabled")
+        def note(*lines):
+            # one insert (and one state toggle) per block of lines
+            steps.configure(state="normal"); steps.insert("end", "\n".join(lines) + "\n"); steps.configure(state="disabled")
 
         def compute():
             steps.configure(state="normal"); steps.delete("1.0","end"); steps.configure(state="disabled")
@@ -3917,87 +4265,69 @@ class ChemGUI(tk.Tk):
             C0 = {}
             try:
                 for sp,e in species_widgets.items():
-                    C0[sp] = float(e.get().replace(",", "."))
+                    C0[sp] = _parse_float(e.get())
             except ValueError:
                 messagebox.showerror("Invalid", "Initial entries must be numbers.", parent=win); return
+            # K (blank = Q only) and Kc/Kp choice, read once for the whole compute
+            try:
+                K = _opt_float(KE.get())
+            except ValueError:
+                messagebox.showerror("Bad K", "K must be numeric.", parent=win); return
+            kind_val = kind.get()
 
-            # quotient from initials
-            def Q_from(C):
-                num = den = 1.0
-                for sp,nu in stoich.items():
-                    if C[sp] <= 0: 
-                        return None
-                    if nu>0: num *= (C[sp]**nu)
-                    elif nu<0: den *= (C[sp]**(-nu))
-                return num/den
-
-            Q0 = Q_from(C0)
+            # quotient from initials (Q at the equilibrium extent comes back from the solver)
+            Q0 = _reaction_quotient(tuple((C0[sp], nu) for sp, nu in stoich.items()))
             if Q0 is None:
                 out.set("Q not defined (zero/negative entry).")
             else:
-                out.set(f"Initial reaction quotient Q = {Q0:.6g}  ({kind.get()})")
-                note(f"Equilibrium expression ({kind.get()}):  K = Π(products)^ν / Π(reactants)^|ν|\n"
-                    f"Initial Q with given amounts: {Q0:.6g}")
-                if Q0 is not None:
-                    if KE.get().strip():
-                        try:
-                            K_val = float(KE.get().replace(",", "."))
-                            if Q0 < K_val:
-                                note("Direction: Q < K → reaction will run toward products (→ right) to reach equilibrium.")
-                            elif Q0 > K_val:
-                                note("Direction: Q > K → reaction will run toward reactants (← left) to reach equilibrium.")
-                            else:
-                                note("Direction: Q = K → system is at equilibrium; no net change.")
-                        except ValueError:
-                            pass
-                    else:
-                        note("Direction: (K not entered) — cannot predict shift without K.")
+                out.set(f"Initial reaction quotient Q = {Q0:.6g}  ({kind_val})")
+                if K is None:
+                    dir_line = "Direction: (K not entered) — cannot predict shift without K."
+                elif Q0 < K:
+                    dir_line = "Direction: Q < K → reaction will run toward products (→ right) to reach equilibrium."
+                elif Q0 > K:
+                    dir_line = "Direction: Q > K → reaction will run toward reactants (← left) to reach equilibrium."
+                else:
+                    dir_line = "Direction: Q = K → system is at equilibrium; no net change."
+                note(f"Equilibrium expression ({kind_val}):  K = Π(products)^ν / Π(reactants)^|ν|",
+                    f"Initial Q with given amounts: {Q0:.6g}", dir_line)
 
             # If K given, solve equilibrium via single-extent method
-            if KE.get().strip():
+            if K is not None:
                 try:
-                    K = float(KE.get().replace(",", "."))
-                except ValueError:
-                    messagebox.showerror("Bad K", "K must be numeric.", parent=win); return
-
-                try:
-                    x = self._solve_extent_for_K(stoich, C0, K, is_pressure=(kind.get()=="Kp"))
+                    x, qeq = self._solve_extent_for_K(stoich, C0, K, is_pressure=(kind_val=="Kp"), return_q=True)
                 except Exception as ex:
                     messagebox.showerror("Solve failed", str(ex), parent=win); return
 
                 # equilibrium concentrations/pressures
                 Ceq = {sp: C0[sp] + stoich[sp]*x for sp in stoich}
-                # post Q (≈K)
-                num = den = 1.0
-                for sp,nu in stoich.items():
-                    c = Ceq[sp]
-                    if nu>0: num *= c**nu
-                    elif nu<0: den *= c**(-nu)
-                qeq = num/den
 
                 # print ICE-like summary
-                note("\nICE table summary (values in M or atm per your choice):")
-                note("species      I         Δ(ν·x)      E")
-                for sp in sorted(stoich.keys()):
+                lines = ["\nICE table summary (values in M or atm per your choice):",
+                         "species      I         Δ(ν·x)      E"]
+                for sp in species:
                     I = C0[sp]; d = stoich[sp]*x; E = Ceq[sp]
-                    note(f"{sp:>8s}  {I:>9.5g}  {d:>10.5g}  {E:>11.5g}")
+                    lines.append(f"{sp:>8s}  {I:>9.5g}  {d:>10.5g}  {E:>11.5g}")
+                note(*lines)
 
                 # direction
                 direction = "→ products" if Q0 is not None and Q0 < K else ("→ reactants" if Q0 is not None and Q0 > K else "already at K")
-                out.set(f"Equilibrium found: x = {x:.6g} ;  K(target)={K:.6g},  Q(eq)≈{qeq:.6g}  → shift {direction}")
+                qeq_txt = f"{qeq:.6g}" if qeq is not None else "undefined"
+                out.set(f"Equilibrium found: x = {x:.6g} ;  K(target)={K:.6g},  Q(eq)≈{qeq_txt}  → shift {direction}")
 
                 # copy to a small table below
                 res = tk.Toplevel(win); res.title("Equilibrium values"); res.transient(win); res.geometry("360x280")
                 tfrm = ttk.Frame(res, padding=10); tfrm.pack(fill=tk.BOTH, expand=True)
-                ttk.Label(tfrm, text=f"Equilibrium ({kind.get()}):", font=("Segoe UI",10,"bold")).pack(anchor="w")
-                for sp in sorted(Ceq.keys()):
+                ttk.Label(tfrm, text=f"Equilibrium ({kind_val}):", font=("Segoe UI",10,"bold")).pack(anchor="w")
+                for sp in species:
                     ttk.Label(tfrm, text=f"{sp} : {Ceq[sp]:.6g}").pack(anchor="w")
                 def add_known():
                     # store Ceq as [sp]_eq in Known (names "[X]_eq")
+                    is_kc = kind_val == "Kc"
                     for sp,val in Ceq.items():
-                        key = f"[{sp}]_eq" if kind.get()=="Kc" else f"P_{sp}_eq"
+                        key = f"[{sp}]_eq" if is_kc else f"P_{sp}_eq"
                         self.known_base[key] = float(val)
-                        self.known_ui[key]   = {"unit":"M" if kind.get()=="Kc" else "atm", "display_value": float(val)}
+                        self.known_ui[key]   = {"unit":"M" if is_kc else "atm", "display_value": float(val)}
                     self._refresh_known_table(); self._refresh_equation_list()
                     messagebox.showinfo("Saved", "Equilibrium values added to Known Variables.", parent=res)
                 ttk.Button(tfrm, text="Add equilibrium values to Known", command=add_known).pack(anchor="w", pady=(8,0))
@@ -4023,9 +4353,6 @@ class ChemGUI(tk.Tk):
         ttk.Button(frm, text="❓ Help", command=help_popup).grid(row=2, column=5, sticky="e")
 
     def _open_kp_kc_converter(self):
-        import math, tkinter as tk
-        from tkinter import ttk, messagebox
-
         win = tk.Toplevel(self); win.title("Kp ↔ Kc Converter")
         win.transient(self); win.grab_set(); win.geometry("560x280")
         frm = ttk.Frame(win, padding=12); frm.pack(fill=tk.BOTH, expand=True)
@@ -4040,7 +4367,7 @@ class ChemGUI(tk.Tk):
         ttk.Label(frm, text="Kp unit:").grid(row=1, column=3, sticky="e")
         punit = tk.StringVar(value="atm")
         ttk.Combobox(frm, width=6, state="readonly", textvariable=punit,
-                    values=["atm","bar","Pa(m³/mol)"]).grid(row=1, column=4, sticky="w")
+                    values=list(_R_BY_UNIT)).grid(row=1, column=4, sticky="w")
 
         ttk.Label(frm, text="Kc:").grid(row=2, column=0, sticky="e")
         KcE = ttk.Entry(frm, width=14); KcE.grid(row=2, column=1, sticky="w", padx=(6,0))
@@ -4049,35 +4376,31 @@ class ChemGUI(tk.Tk):
 
         out = tk.StringVar(value=""); ttk.Label(frm, textvariable=out, font=("Segoe UI",10,"bold")).grid(row=4, column=0, columnspan=5, sticky="w", pady=(8,0))
 
-        def R_match():
-            u = punit.get()
-            if u == "atm": return 0.082057338  # L·atm/(mol·K), Kc in mol/L
-            if u == "bar": return 0.083144626  # L·bar/(mol·K)
-            # Pa option expects Kc in mol/m^3, Kp in Pa; then R must be 8.314462618 J/(mol·K)=Pa·m^3/(mol·K)
-            return 8.314462618
-
         def compute():
             try:
-                dn = float(dnE.get().replace(",", "."))
-                T  = float(TE.get().replace(",", "."))
+                dn, T = _parse_floats(dnE, TE)
             except ValueError:
                 messagebox.showerror("Invalid", "Δn and T must be numeric.", parent=win); return
-            R = R_match()
+            try:
+                Kc = _opt_float(KcE.get())
+                Kp = _opt_float(KpE.get()) if Kc is None else None
+            except ValueError:
+                messagebox.showerror("Invalid", "Kc or Kp must be numeric.", parent=win); return
+            u = punit.get()
+            R = _R_BY_UNIT[u]
             factor = (R * T) ** dn
             powtxt = f"(RT)^{dn:g}"
 
-            if KcE.get().strip():
-                Kc = float(KcE.get().replace(",", "."))
+            if Kc is not None:
                 Kp = Kc * factor
                 KpE.delete(0,"end"); KpE.insert(0, f"{Kp:.6g}")
-                out.set(f"Kp = Kc·{powtxt} = {Kp:.6g}   (R matched to {punit.get()})")
-            elif KpE.get().strip():
-                Kp = float(KpE.get().replace(",", "."))
+                out.set(f"Kp = Kc·{powtxt} = {Kp:.6g}   (R matched to {u})")
+            elif Kp is not None:
                 if (R*T) == 0:
                     messagebox.showerror("Oops", "RT = 0.", parent=win); return
                 Kc = Kp / factor
                 KcE.delete(0,"end"); KcE.insert(0, f"{Kc:.6g}")
-                out.set(f"Kc = Kp/{powtxt} = {Kc:.6g}   (R matched to {punit.get()})")
+                out.set(f"Kc = Kp/{powtxt} = {Kc:.6g}   (R matched to {u})")
             else:
                 messagebox.showerror("Need a value", "Enter either Kc or Kp.", parent=win)
 
@@ -4106,21 +4429,18 @@ class ChemGUI(tk.Tk):
         out = tk.StringVar(value=""); ttk.Label(frm, textvariable=out, font=("Segoe UI",10,"bold")).grid(row=3,column=0,sticky="w",pady=(8,0))
 
         def compute():
-            import math
             if not rows:
                 messagebox.showerror("Empty","Add at least one K row.", parent=win); return
             try:
-                logK = 0.0
-                for Ke, ne in rows:
-                    K = float(Ke.get().replace(",", "."))
-                    n = float(ne.get().replace(",", "."))
-                    if K <= 0: 
-                        messagebox.showerror("Bad K","K must be > 0.", parent=win); return
-                    logK += n * math.log(K)
-                Koverall = math.exp(logK)
-                out.set(f"K_overall = {Koverall:.6g}")
+                Ks = _parse_floats(*(Ke for Ke, _ in rows))
+                ns = _parse_floats(*(ne for _, ne in rows))
             except ValueError:
-                messagebox.showerror("Invalid","Use numeric K and ν.", parent=win)
+                messagebox.showerror("Invalid","Use numeric K and ν.", parent=win); return
+            if min(Ks) <= 0:
+                messagebox.showerror("Bad K","K must be > 0.", parent=win); return
+            # ln K_overall = Σ ν_i·ln K_i, summed exactly with fsum
+            Koverall = math.exp(math.fsum(n * math.log(K) for K, n in zip(Ks, ns)))
+            out.set(f"K_overall = {Koverall:.6g}")
 
         self._add_compute_bar(win, compute)
 
@@ -4140,18 +4460,26 @@ class ChemGUI(tk.Tk):
         tbl = ttk.Frame(box); tbl.pack(fill=tk.X, pady=6)
 
         entries = {}; stoich = {}
+        ttk.Label(tbl, text="Species").grid(row=0,column=0,sticky="w")
+        ttk.Label(tbl, text="Amount now").grid(row=0,column=1,sticky="w")
+        row_pool = []   # (species label, amount entry) per grid row, reused across refreshes
+
+        def make_row(i):
+            name = ttk.Label(tbl); name.grid(row=i,column=0,sticky="w")
+            e = ttk.Entry(tbl, width=12); e.grid(row=i,column=1,sticky="w")
+            return name, e
+
         def refresh():
-            for w in tbl.winfo_children(): w.destroy()
+            nonlocal stoich
             try:
-                nonlocal stoich
                 stoich = self._parse_reaction(rxn.get())
             except Exception as ex:
                 messagebox.showerror("Parse error", str(ex), parent=win); return
-            ttk.Label(tbl, text="Species").grid(row=0,column=0,sticky="w")
-            ttk.Label(tbl, text="Amount now").grid(row=0,column=1,sticky="w")
-            for i,(sp,_) in enumerate(sorted(stoich.items()),start=1):
-                ttk.Label(tbl, text=sp).grid(row=i,column=0,sticky="w")
-                e = ttk.Entry(tbl, width=12); e.grid(row=i,column=1,sticky="w"); e.insert(0,"0.0")
+            species = sorted(stoich)
+            entries.clear()   # only this reaction's species; compute() reads every entry
+            for sp, (name, e) in zip(species, _grid_row_pool(row_pool, len(species), make_row)):
+                name.configure(text=sp)
+                e.delete(0,"end"); e.insert(0,"0.0")
                 entries[sp]=e
         refresh()
 
@@ -4161,21 +4489,17 @@ class ChemGUI(tk.Tk):
         def compute():
             txt.configure(state="normal"); txt.delete("1.0","end"); txt.configure(state="disabled")
             try:
-                K = float(KE.get().replace(",", "."))
+                K = _parse_float(KE.get())
             except ValueError:
                 messagebox.showerror("Need K","Enter a numeric K.", parent=win); return
             C = {}
             try:
                 for sp,e in entries.items():
-                    C[sp]=float(e.get().replace(",", "."))
+                    C[sp]=_parse_float(e.get())
             except ValueError:
                 messagebox.showerror("Invalid","Numbers only.", parent=win); return
-            num=den=1.0
-            for sp,nu in stoich.items():
-                if C[sp]<=0: out.set("Q undefined (zero/negative)"); return
-                if nu>0: num*=C[sp]**nu
-                elif nu<0: den*=C[sp]**(-nu)
-            Q=num/den
+            Q = _reaction_quotient(tuple((C[sp], nu) for sp, nu in stoich.items()))
+            if Q is None: out.set("Q undefined (zero/negative)"); return
             direct = "→ products" if Q<K else ("→ reactants" if Q>K else "at equilibrium")
             out.set(f"Q = {Q:.6g}; compare to K={K:.6g}  ⇒ shift {direct}")
             txt.configure(state="normal")
@@ -4194,8 +4518,6 @@ class ChemGUI(tk.Tk):
         ttk.Button(frm, text="Parse species again", command=refresh).grid(row=2,column=3,sticky="e")
 
     def _open_ksp_tool(self):
-        import re, math, tkinter as tk
-        from tkinter import ttk, messagebox
         win = tk.Toplevel(self); win.title("Ksp & Heterogeneous Equilibria")
         win.transient(self); win.grab_set(); win.geometry("760x620")
         frm = ttk.Frame(win, padding=12); frm.pack(fill=tk.BOTH, expand=True)
@@ -4217,73 +4539,30 @@ class ChemGUI(tk.Tk):
         ttk.Label(box, textvariable=out1, font=("Segoe UI", 10, "bold"))\
             .grid(row=2, column=0, columnspan=5, sticky="w", pady=(6,0))
 
-        def parse_axby(formula: str):
-            """
-            Return (x, y) for AxBy-type salts with two ionic groups.
-            Supports: Element–Element (AgCl), Element–polyatomic (CaCO3, NaNO3),
-            parentheses ((NH4)2SO4, Ca(OH)2, Fe(NO3)3), and element counts (Na2SO4).
-            """
-            import re
-            f = re.sub(r"\s+", "", formula)
-            if not f:
-                raise ValueError("Enter a salt formula.")
-
-            # --- first (cation) group ---
-            if f.startswith("("):
-                m = re.match(r"^\(([^)]+)\)(\d*)(.+)$", f)
-                if not m: raise ValueError("Could not parse the first ion group.")
-                x = int(m.group(2)) if m.group(2) else 1
-                rest = m.group(3)
-            elif f.startswith("NH4"):                      # common polyatomic cation without ()
-                x, rest = 1, f[3:]
-            else:
-                m = re.match(r"^([A-Z][a-z]?)(\d*)(.+)$", f)
-                if not m: raise ValueError("Enter a salt with two ionic groups, e.g. CaCO3, Ca(OH)2, Fe(NO3)3, Na2SO4, AgCl.")
-                x = int(m.group(2)) if m.group(2) else 1
-                rest = m.group(3)
-
-            # --- second (anion) group ---
-            rest = rest.strip()
-            if rest.startswith("("):
-                m = re.match(r"^\(([^)]+)\)(\d*)$", rest)
-                if not m:
-                    m = re.match(r"^\(([^)]+)\)(\d*)", rest)  # take first group if more follows
-                    if not m: raise ValueError("Could not parse the second ion group.")
-                y = int(m.group(2)) if m.group(2) else 1
-            else:
-                # Single element like Cl2 -> y=2; multi-element like CO3/NO3 (no ()) -> y=1
-                if re.fullmatch(r"[A-Z][a-z]?\d*", rest):
-                    m = re.fullmatch(r"[A-Z][a-z]?(\d*)", rest)
-                    y = int(m.group(1)) if m.group(1) else 1
-                else:
-                    y = 1
-            return x, y
-
-
         def compute_ksp_block():
             try:
-                x, y = parse_axby(fE.get().strip())
+                x, y = _parse_axby(fE.get().strip())
             except Exception as ex:
                 messagebox.showerror("Formula", str(ex), parent=win); return
-            if KspE.get().strip():
-                try:
-                    Ksp = float(KspE.get().replace(",", "."))
-                except ValueError:
-                    messagebox.showerror("Ksp", "Numeric.", parent=win); return
+            try:
+                Ksp = _opt_float(KspE.get())
+            except ValueError:
+                messagebox.showerror("Ksp", "Numeric.", parent=win); return
+            if Ksp is not None:
                 # Ksp = (x·s)^x (y·s)^y = (x^x y^y) s^{x+y}
                 s = (Ksp / ((x**x) * (y**y))) ** (1.0 / (x + y))
                 sE.delete(0, "end"); sE.insert(0, f"{s:.6g}")
                 out1.set(f"molar solubility s = {s:.6g} mol/L   (x={x}, y={y})")
-            elif sE.get().strip():
+            else:
                 try:
-                    s = float(sE.get().replace(",", "."))
+                    s = _opt_float(sE.get())
                 except ValueError:
                     messagebox.showerror("s", "Numeric.", parent=win); return
+                if s is None:
+                    messagebox.showerror("Need one", "Enter either Ksp or s.", parent=win); return
                 Ksp = ((x * s) ** x) * ((y * s) ** y)
                 KspE.delete(0, "end"); KspE.insert(0, f"{Ksp:.6g}")
                 out1.set(f"Ksp = (x·s)^x (y·s)^y = {Ksp:.6g}")
-            else:
-                messagebox.showerror("Need one", "Enter either Ksp or s.", parent=win)
 
         # Consistent bottom bar for this first block
         self._add_compute_bar(win, compute_ksp_block)  # original behavior kept. :contentReference[oaicite:3]{index=3}
@@ -4334,7 +4613,7 @@ class ChemGUI(tk.Tk):
             # Which formula to use for stoichiometry (Qsp uses same AxBy parser)
             ftxt = (qfE.get().strip() or fE.get().strip())
             try:
-                x, y = parse_axby(ftxt)
+                x, y = _parse_axby(ftxt)
             except Exception as ex:
                 messagebox.showerror("Formula", str(ex), parent=win); return
 
@@ -4351,8 +4630,8 @@ class ChemGUI(tk.Tk):
                                         parent=win); return
                 # Use your existing helpers to get molar mass
                 try:
-                    f = name_to_formula(ftxt)
-                    MM = molar_mass(f)  # g/mol
+                    f = _name_to_formula_cached(ftxt)
+                    MM = _molar_mass_cached(f)  # g/mol
                 except Exception as ex:
                     messagebox.showerror("Molar mass", str(ex), parent=win); return
                 n = _mass_g(mg, mU.get()) / MM
@@ -4374,7 +4653,7 @@ class ChemGUI(tk.Tk):
             verdict = ""
             if Ktxt:
                 try:
-                    Ksp_val = float(Ktxt.replace(",", "."))
+                    Ksp_val = _parse_float(Ktxt)
                 except ValueError:
                     messagebox.showerror("Ksp", "Ksp must be numeric.", parent=win); return
                 # Compare with a soft tolerance
@@ -4418,14 +4697,9 @@ class ChemGUI(tk.Tk):
                 st = self._parse_reaction(rxn.get())
             except Exception as ex:
                 messagebox.showerror("Parse", str(ex), parent=win); return
-            include = []
-            for sp, nu in st.items():
-                sp_l = sp.lower()
-                if sp_l.endswith("(s)") or sp_l.endswith("(l)") or sp_l.endswith("(pure)"):
-                    continue
-                include.append((sp, nu))
-                if not include:
-                    out2.set("All species were pure s/l; K = 1.")
+            include = [(sp, nu) for sp, nu in st.items() if not _RX_PURE_PHASE.search(sp)]
+            if not include:
+                out2.set("All species were pure s/l; K = 1.")
                 return
             num = " · ".join([f"[{sp}]^{int(nu) if abs(nu-int(nu))<1e-12 else nu:g}" for sp,nu in include if nu>0])
             den = " · ".join([f"[{sp}]^{int(-nu) if abs(-nu-int(-nu))<1e-12 else -nu:g}" for sp,nu in include if nu<0])
@@ -4487,34 +4761,6 @@ class ChemGUI(tk.Tk):
         scy = ttk.Scrollbar(frm, orient="vertical", command=steps.yview); steps.configure(yscrollcommand=scy.set)
         scy.grid(row=11, column=8, sticky="ns")
 
-        # --- tiny linear solver (2 or 3 parameters) --------------------------------
-        def solve_normal_eq(XTX, XTy):
-            # Gaussian elimination for 2x2 or 3x3
-            n = len(XTy)
-            # build augmented matrix
-            A = [XTX[i][:] + [XTy[i]] for i in range(n)]
-            # elimination
-            for i in range(n):
-                # pivot
-                pivot = i
-                for r in range(i+1, n):
-                    if abs(A[r][i]) > abs(A[pivot][i]): pivot = r
-                if abs(A[pivot][i]) < 1e-14:
-                    return None  # singular
-                if pivot != i:
-                    A[i], A[pivot] = A[pivot], A[i]
-                # normalize
-                fac = A[i][i]
-                for c in range(i, n+1):
-                    A[i][c] /= fac
-                # eliminate
-                for r in range(n):
-                    if r == i: continue
-                    fac = A[r][i]
-                    for c in range(i, n+1):
-                        A[r][c] -= fac * A[i][c]
-            return [A[i][n] for i in range(n)]  # solution
-
         # --- core compute -----------------------------------------------------------
         def compute():
             steps.configure(state="normal"); steps.delete("1.0", "end"); steps.configure(state="disabled")
@@ -4574,17 +4820,8 @@ class ChemGUI(tk.Tk):
             if len(X) < p:
                 messagebox.showerror("Not enough data", f"Need at least {p} experiments for this fit."); return
 
-            # Normal equations: (X^T X) beta = X^T y
-            # compute Gram matrix and RHS
-            XTX = [[0.0]*p for _ in range(p)]
-            XTy = [0.0]*p
-            for xi, yi in zip(X, y):
-                for i in range(p):
-                    XTy[i] += xi[i]*yi
-                    for j in range(p):
-                        XTX[i][j] += xi[i]*xi[j]
-
-            beta = solve_normal_eq(XTX, XTy)
+            # Least squares on X directly (QR), not via the normal equations (X^T X) beta = X^T y
+            beta = _lstsq(X, y)
             if beta is None:
                 messagebox.showerror("Singular system",
                                     "Data are collinear (e.g., no variation in A or B). Vary concentrations and try again.")
@@ -5942,8 +6179,7 @@ class ChemGUI(tk.Tk):
             scored = [(score(query, item["hay"]), item) for item in indexed]
             scored.sort(key=lambda t: t[0], reverse=True)
             top = [it for s,it in scored[:16] if s > 0] or [it for s,it in scored[:16]]
-            for item in top:
-                lst.insert(tk.END, f"{item['label']}   —   {item['cat']}")
+            lst.insert(tk.END, *[f"{item['label']}   —   {item['cat']}" for item in top])
             if lst.size():
                 lst.selection_clear(0, tk.END)
                 lst.selection_set(0); lst.activate(0)
@@ -5952,6 +6188,7 @@ class ChemGUI(tk.Tk):
                 detail.set("—")
 
         def choose(*_):
+            _debounce_flush(ent, "filter")
             sel = lst.curselection()
             if not sel: 
                 win.destroy(); return
@@ -5972,7 +6209,7 @@ class ChemGUI(tk.Tk):
             if sel:
                 detail.set(lst.get(sel[0]))
 
-        ent.bind("<KeyRelease>", refresh)
+        ent.bind("<KeyRelease>", lambda e: _debounce(ent, "filter", refresh))
         lst.bind("<<ListboxSelect>>", on_move)
         lst.bind("<Double-Button-1>", choose)
         lst.bind("<Return>", choose)
@@ -8004,8 +8241,7 @@ class ChemGUI(tk.Tk):
             from molar_masses import suggest_substances, name_to_formula, molar_mass
             items = suggest_substances(ent.get(), limit=60)
             sugg.delete(0, tk.END)
-            for label, f in items:
-                sugg.insert(tk.END, label)
+            sugg.insert(tk.END, *[label for label, _f in items])
             if items:
                 sugg.configure(height=min(8, len(items))); sugg.grid(); scx.grid()
             else:
@@ -250,39 +250,48 @@ SPECIES.update({
 })
 
 _token = re.compile(r"([A-Z][a-z]?|\(|\)|\d+)")
+_element = re.compile(r"[A-Z][a-z]?$")
 
 
 def _parse(tokens):
-    """Recursive descent parse for parentheses and counts."""
-    total = {}
-    while tokens:
-        t = tokens[0]
-        if t == ")":
-            break
+    """Parse element/paren/count tokens with an explicit group stack (no recursion).
+
+    Consumes the tokens it used from the front of the list; a stray ")" is left
+    in place for the caller to reject as trailing input.
+    """
+    stack = [{}]
+    i, n = 0, len(tokens)
+    while i < n:
+        t = tokens[i]
         if t == "(":
-            tokens.pop(0)  # consume '('
-            inner = _parse(tokens)
-            if not tokens or tokens[0] != ")":
-                raise ValueError("Unmatched '(' in formula")
-            tokens.pop(0)  # consume ')'
-            # optional count
-            count = 1
-            if tokens and tokens[0].isdigit():
-                count = int(tokens.pop(0))
-            for sym, n in inner.items():
-                total[sym] = total.get(sym, 0) + n * count
+            stack.append({})
+            i += 1
+            continue
+        if t == ")":
+            if len(stack) == 1:
+                break
+            inner = stack.pop()
+            i += 1
+        elif _element.match(t):
+            inner = None
+            i += 1
+        else:
+            raise ValueError(f"Unexpected token: {t}")
+        # optional count
+        count = 1
+        if i < n and tokens[i].isdigit():
+            count = int(tokens[i])
+            i += 1
+        total = stack[-1]
+        if inner is None:
+            total[t] = total.get(t, 0) + count
         else:
-            # element symbol
-            if not re.match(r"[A-Z][a-z]?$", t):
-                raise ValueError(f"Unexpected token: {t}")
-            sym = t
-            tokens.pop(0)
-            # optional count
-            count = 1
-            if tokens and tokens[0].isdigit():
-                count = int(tokens.pop(0))
-            total[sym] = total.get(sym, 0) + count
-    return total
+            for sym, k in inner.items():
+                total[sym] = total.get(sym, 0) + k * count
+    del tokens[:i]
+    if len(stack) > 1:
+        raise ValueError("Unmatched '(' in formula")
+    return stack[0]
 
 
 def molar_mass(formula_or_name_or_symbol: str) -> float: